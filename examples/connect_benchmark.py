@@ -0,0 +1,53 @@
+# Copyright (C) 2025 Intel Corporation
+# SPDX-License-Identifier: MIT
+"""
+Benchmark of SSH connect time with and without connection profile.
+
+Usage:
+python connect_benchmark.py --ip 10.10.10.10 --username root --password *** --device-type cisco_nxos --rounds 5
+"""
+
+import argparse
+import statistics
+import tempfile
+import time
+from pathlib import Path
+
+from mfd_switchmanagement import ConnectionProfileCache, SSHSwitchConnection
+
+
+def measure(rounds: int, **connection_params) -> list:
+    """Connect and disconnect given number of times, return duration of each connect in seconds."""
+    durations = []
+    for _ in range(rounds):
+        start = time.perf_counter()
+        connection = SSHSwitchConnection(**connection_params)
+        durations.append(time.perf_counter() - start)
+        connection.disconnect()
+    return durations
+
+
+def report(name: str, durations: list) -> None:
+    """Print summary of measured durations."""
+    print(
+        f"{name:<20} mean {statistics.mean(durations):6.2f}s  median {statistics.median(durations):6.2f}s  "
+        f"min {min(durations):6.2f}s  max {max(durations):6.2f}s"
+    )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--ip", required=True)
+    parser.add_argument("--username", required=True)
+    parser.add_argument("--password", required=True)
+    parser.add_argument("--device-type", required=True)
+    parser.add_argument("--rounds", type=int, default=5)
+    args = parser.parse_args()
+
+    params = dict(ip=args.ip, username=args.username, password=args.password, device_type=args.device_type)
+    report("default", measure(args.rounds, **params))
+
+    with tempfile.TemporaryDirectory() as cache_dir:
+        cache = ConnectionProfileCache(path=Path(cache_dir) / "connection_profiles.json")
+        report("learning profile", measure(1, connection_profile_cache=cache, **params))
+        report("cached profile", measure(args.rounds, connection_profile_cache=cache, **params))
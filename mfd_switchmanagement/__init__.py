@@ -2,11 +2,27 @@
 # SPDX-License-Identifier: MIT
 """Module for switch management."""
 
+import socket as _socket
+
 # connections
 from .connections.ssh import SSHSwitchConnection
+from .connections.pool import SSHConnectionPool, get_connection_pool
+from .connections.device_type_cache import DeviceTypeCache
+from .connections.connection_profile import ConnectionProfileCache
+from .connections.reachability import ReachabilityChecker
+from .connections.async_ssh import AsyncSSHSwitchConnection
+from .utils.governor import CommandGovernor, get_governor
+
+# Unix sockets used by broker are not available on Windows
+if hasattr(_socket, "AF_UNIX"):
+    from .connections.broker import BrokeredSwitchConnection, SwitchBroker
 
 # api connections
 from .connections.vendors.cisco_api import CiscoAPIConnection
+from .connections.vendors.async_cisco_api import AsyncCiscoAPIConnection
+
+# asyncio facade
+from .async_switch import AsyncSwitch
 from .vendors.arista.arista_7050 import Arista7050
 from .vendors.arista.base import Arista
 from .vendors.brocade.base import Fabos
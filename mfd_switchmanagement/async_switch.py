@@ -0,0 +1,203 @@
+# Copyright (C) 2025 Intel Corporation
+# SPDX-License-Identifier: MIT
+"""Module for asyncio facade of switch classes."""
+
+import asyncio
+import contextvars
+from concurrent.futures import Executor
+from functools import partial
+from typing import Any, Awaitable, Callable, List, Optional, Type
+
+from .base import Switch
+from .connections.async_base import AsyncBaseSwitchConnection
+
+
+class _BridgeConnection:
+    """
+    Blocking connection of switch object run in worker thread, each command is awaited on async connection in loop.
+
+    Class is mixed with connection class expected by switch, so vendor checks like
+    isinstance(self._connection, CiscoAPIConnection) keep working.
+    """
+
+    command_lock = None
+    SUPPORTS_BATCH = False
+    _batch = None
+
+    def __init__(self, connection: AsyncBaseSwitchConnection, loop: asyncio.AbstractEventLoop, **kwargs):
+        """
+        Init of bridge, parameters passed by switch constructor are ignored, connection is owned by facade.
+
+        :param connection: Async connection with switch
+        :param loop: Event loop running facade
+        """
+        self._async_connection = connection
+        self._loop = loop
+        self._ip = connection._ip
+        self._device_type = connection._device_type
+
+    def _await(self, method: str, *args) -> Any:
+        return asyncio.run_coroutine_threadsafe(getattr(self._async_connection, method)(*args), self._loop).result()
+
+    def send_command(self, command: str) -> Any:
+        return self._await("send_command", command)
+
+    def send_command_expect(self, command: str, prompt: str) -> Any:
+        return self._await("send_command_expect", command, prompt)
+
+    def send_command_list(self, commands: List[str]) -> Any:
+        return self._await("send_command_list", list(commands))
+
+    def send_configuration(self, commands: List[str]) -> Any:
+        return self._await("send_configuration", list(commands))
+
+    def exit_port_configuration(self) -> None:
+        return self._await("exit_port_configuration")
+
+    def disconnect(self) -> None:
+        pass
+
+
+class AsyncSwitch:
+    """
+    Asyncio facade of switch class.
+
+    Methods of switch class are available as coroutines, command builders and output parsers of vendor class are
+    reused. Method of switch object runs once in worker thread of executor, each command it sends is awaited
+    on async connection in event loop, so waiting of vendor methods (sleep, timeouts) does not block loop.
+    Switch object is created by vendor constructor on first call, with connection bridged to async connection.
+    Operations on the same switch are serialized, operations on different switches run concurrently.
+    Every operation in flight occupies one worker thread, so number of concurrent operations is bounded by size
+    of executor (default executor of event loop if not passed), pass executor sized for expected concurrency.
+
+    Usage:
+    >>>async with await AsyncSwitch.create(Cisco_NXOS, AsyncCiscoAPIConnection, ip="10.10.10.10",
+    >>>                                    username="admin", password="***") as switch:
+    >>>    print(await switch.is_port_linkup("Ethernet1/1"))
+    True
+    """
+
+    def __init__(
+        self,
+        switch_type: Type[Switch],
+        connection: AsyncBaseSwitchConnection,
+        topology: Any = None,
+        executor: Optional[Executor] = None,
+    ):
+        """
+        Init of facade, connection has to be connected by caller (or use create()).
+
+        :param switch_type: Vendor switch class, e.g. Cisco_NXOS
+        :param connection: Async connection with switch
+        :param topology: Topology model of switch
+        :param executor: Executor running switch methods, can be shared by facades, default executor of event loop
+                         is used if not passed
+        """
+        self._switch_type = switch_type
+        self._connection = connection
+        self.topology = topology
+        self._executor = executor
+        self._switch_object: Optional[Switch] = None
+
+    @classmethod
+    async def create(
+        cls, switch_type: Type[Switch], connection_type: Type[AsyncBaseSwitchConnection], **kwargs
+    ) -> "AsyncSwitch":
+        """
+        Create async connection, connect it and create facade.
+
+        :param switch_type: Vendor switch class, e.g. Cisco_NXOS
+        :param connection_type: Async connection class, e.g. AsyncSSHSwitchConnection
+        :param kwargs: Parameters of connection, topology and executor are passed to facade
+        :return: Facade of connected switch
+        """
+        topology = kwargs.pop("topology", None)
+        executor = kwargs.pop("executor", None)
+        connection = connection_type(**kwargs)
+        await connection.connect()
+        return cls(switch_type, connection, topology=topology, executor=executor)
+
+    @property
+    def connection(self) -> AsyncBaseSwitchConnection:
+        """Async connection with switch."""
+        return self._connection
+
+    def _switch(self, loop: asyncio.AbstractEventLoop) -> Switch:
+        """
+        Create switch object by vendor constructor, its connection is bridged to async connection.
+
+        :param loop: Event loop running facade
+        :return: Switch object
+        """
+        sync_type = self._connection.SYNC_CONNECTION_TYPE
+        bridge_type = type(f"Bridged{sync_type.__name__}", (_BridgeConnection, sync_type), {})
+        return self._switch_type(
+            ip=str(self._connection._ip),
+            username=self._connection._username,
+            password=self._connection._password,
+            secret=self._connection._secret,
+            device_type=self._connection._device_type,
+            connection_type=partial(bridge_type, self._connection, loop),
+            topology=self.topology,
+        )
+
+    async def _run(self, function: Callable[..., Any], *args, **kwargs) -> Any:
+        """
+        Run blocking function in worker thread of executor.
+
+        When caller is cancelled, function can not be interrupted, it is awaited before cancellation is propagated,
+        so command lock is not released while function still sends commands.
+
+        :param function: Function using bridged connection
+        :return: Value returned by function
+        """
+        context = contextvars.copy_context()
+        loop = asyncio.get_running_loop()
+        task = loop.run_in_executor(self._executor, partial(context.run, function, *args, **kwargs))
+        try:
+            return await asyncio.shield(task)
+        except asyncio.CancelledError:
+            await asyncio.wait({task})
+            raise
+
+    async def call(self, method: str, *args, **kwargs) -> Any:
+        """
+        Call method of switch class.
+
+        :param method: Name of public switch method
+        :param args: Positional arguments of method
+        :param kwargs: Keyword arguments of method
+        :return: Value returned by method
+        """
+        async with self._connection.command_lock:
+            loop = asyncio.get_running_loop()
+            if self._switch_object is None:
+                self._switch_object = await self._run(self._switch, loop)
+            # facade could be used by other event loop than the one which created switch object
+            self._switch_object._connection._loop = loop
+            return await self._run(getattr(self._switch_object, method), *args, **kwargs)
+
+    def __getattr__(self, name: str) -> Callable[..., Awaitable[Any]]:
+        """Get coroutine function calling public method of switch class."""
+        if name.startswith("_") or not callable(getattr(self._switch_type, name, None)):
+            raise AttributeError(f"'{type(self).__name__}' object has no attribute '{name}'")
+
+        async def method(*args, **kwargs) -> Any:
+            return await self.call(name, *args, **kwargs)
+
+        method.__name__ = name
+        method.__doc__ = getattr(self._switch_type, name).__doc__
+        return method
+
+    async def disconnect(self) -> None:
+        """Close connection with switch."""
+        await self._connection.disconnect()
+
+    async def __aenter__(self) -> "AsyncSwitch":
+        return self
+
+    async def __aexit__(self, *args) -> None:
+        await self.disconnect()
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self._switch_type.__name__}, {self._connection._ip})"
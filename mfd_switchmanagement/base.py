@@ -2,18 +2,24 @@
 
 # Copyright (C) 2025 Intel Corporation
 # SPDX-License-Identifier: MIT
+import inspect
 import re
 import socket
 import typing
 from abc import ABC
+from contextlib import contextmanager, nullcontext
 from enum import Enum
 from dataclasses import dataclass
+from functools import wraps
 from pathlib import Path
-from typing import List, Optional, Union
+from typing import Callable, ContextManager, Iterator, List, Optional, Union
 
 from .connections.base import BaseSwitchConnection
+from .connections.batch import ConfigurationBatch
+from .connections.pool import SSHConnectionPool
 from .connections.ssh import SSHSwitchConnection
 from .exceptions import SwitchException
+from .utils.lock import FairRLock
 
 if typing.TYPE_CHECKING:
     from pydantic import BaseModel
@@ -48,6 +54,26 @@ def _grouper(iterable: str, group_size: int) -> str:
     return (iterable[i : i + group_size] for i in range(0, len(iterable), group_size))
 
 
+def _serialized(method: Callable) -> Callable:
+    """Run switch method while holding command lock of switch connection."""
+
+    @wraps(method)
+    def wrapper(switch: "Switch", *args, **kwargs) -> typing.Any:
+        # not named self, so frame of wrapper is not reported as origin of batched commands
+        with switch._command_lock():
+            return method(switch, *args, **kwargs)
+
+    wrapper._serialized = True
+    return wrapper
+
+
+def _serialize_public_methods(cls: type) -> None:
+    """Wrap public methods defined by class, so multi-command operations are not interleaved between threads."""
+    for name, attribute in list(vars(cls).items()):
+        if not name.startswith("_") and inspect.isfunction(attribute) and not getattr(attribute, "_serialized", False):
+            setattr(cls, name, _serialized(attribute))
+
+
 class Switch(ABC):
     """
     Module of switch management.
@@ -81,6 +107,10 @@ class Switch(ABC):
     PORT_REGEX = None
     PORT_CHANNEL_REGEX = None
 
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        _serialize_public_methods(cls)
+
     def __init__(
         self,
         ip: str = None,
@@ -94,11 +124,18 @@ class Switch(ABC):
         device_type: Optional[str] = None,
         topology: Optional["BaseModel"] = None,  # SwitchModel
         global_delay_factor: Optional[int] = None,
+        connection_pool: Optional[SSHConnectionPool] = None,
         *args,
         **kwargs,
     ):
-        """Initialize base switch."""
-        self._connection = connection_type(
+        """
+        Initialize base switch.
+
+        :param connection_pool: Pool from which SSH connection is borrowed instead of creating new one,
+                                connection is returned to pool on disconnect
+        :param kwargs: Additional connection specific options passed to connection_type
+        """
+        connection_params = dict(
             ip=ip,
             username=username,
             password=password,
@@ -108,10 +145,51 @@ class Switch(ABC):
             auth_timeout=auth_timeout,
             device_type=device_type,
             global_delay_factor=global_delay_factor,
+            **kwargs,
         )
+        self._connection_pool = connection_pool
+        self._pool_released = False
+        if connection_pool is not None:
+            if not issubclass(connection_type, SSHSwitchConnection):
+                raise ValueError(f"Connection pool is not supported for {connection_type.__name__}")
+            self._connection = connection_pool.acquire(connection_type=connection_type, **connection_params)
+        else:
+            self._connection = connection_type(**connection_params)
 
         self.topology = topology
 
+    def _command_lock(self) -> ContextManager:
+        """
+        Get command lock of connection.
+
+        Public methods are holding lock for whole operation, e.g. all commands of enable_port with count > 1
+        are sent without commands of other threads in between.
+
+        :return: Lock of connection or dummy context if connection does not provide lock
+        """
+        lock = getattr(getattr(self, "_connection", None), "command_lock", None)
+        return lock if isinstance(lock, FairRLock) else nullcontext()
+
+    @contextmanager
+    def _command_lock_released(self) -> Iterator[None]:
+        """
+        Release command lock held by operation for long wait (e.g. polling of link state), re-acquire it after.
+
+        Commands sent while waiting take lock on their own, so commands of other threads can be sent in between.
+        Lock is kept while configuration batch is in progress, commands of other threads are not queued into it.
+        """
+        lock = self._command_lock()
+        depth = 0
+        if isinstance(lock, FairRLock) and getattr(self._connection, "_batch", None) is None:
+            while lock.is_owned():
+                lock.release()
+                depth += 1
+        try:
+            yield
+        finally:
+            for _ in range(depth):
+                lock.acquire()
+
     def _validate_configure_parameters(
         self,
         ports: str,
@@ -201,9 +279,54 @@ class Switch(ABC):
         """
         return self._connection.send_command("show version")
 
+    @contextmanager
+    def batch(self) -> Iterator[ConfigurationBatch]:
+        """
+        Coalesce configuration calls into one push.
+
+        Inside block configuration commands are queued instead of being sent, they are sent together on exit.
+        Commands which output is read (e.g. show commands) send queued commands first to keep order.
+        On exception inside block queued commands are dropped.
+
+        Usage:
+        >>>with switch.batch():
+        >>>    for port in ports:
+        >>>        switch.shutdown(shutdown=False, port=port)
+
+        Command lock is held for whole block, so commands of other threads are not queued into batch.
+        Calls can be named by batch.origin(), name is reported when switch rejects their command.
+
+        :return: Batch of queued commands
+        :raises NotImplementedError: if connection does not support batching, raised before block is run
+        :raises SwitchBatchException: if switch rejected command, message points to call which queued it
+        """
+        if not getattr(self._connection, "SUPPORTS_BATCH", False):
+            raise NotImplementedError(f"Batching is not implemented for {type(self._connection).__name__}")
+        with self._command_lock():
+            if self._connection._batch is not None:
+                yield self._connection._batch
+                return
+            batch = ConfigurationBatch(self._connection)
+            self._connection._batch = batch
+            try:
+                yield batch
+            except BaseException:
+                batch.discard()
+                raise
+            else:
+                batch.flush()
+            finally:
+                self._connection._batch = None
+
     def disconnect(self) -> None:
-        """Close connection with switch."""
-        self._connection.disconnect()
+        """Close connection with switch, pooled connection is returned to its pool."""
+        if self._connection_pool is not None:
+            # connection could be lent to another switch after release, so it is released only once
+            if not self._pool_released:
+                self._pool_released = True
+                self._connection_pool.release(self._connection)
+        else:
+            self._connection.disconnect()
 
     def _prepare_port_configuration(self, port: str) -> None:
         res = self.PORT_REGEX.search(port)
@@ -691,3 +814,6 @@ class Switch(ABC):
         raise: SwitchException if maximum mtu frame size is not found.
         """
         raise NotImplementedError("Get max mtu frame size is not implemented for this switch.")
+
+
+_serialize_public_methods(Switch)
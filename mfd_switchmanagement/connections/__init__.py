@@ -1,4 +1,17 @@
 """Module for switch connections."""
 
+import socket as _socket
+
 from .vendors.cisco_api import CiscoAPIConnection
+from .vendors.async_cisco_api import AsyncCiscoAPIConnection
 from .ssh import SSHSwitchConnection
+from .async_ssh import AsyncSSHSwitchConnection
+from .pool import SSHConnectionPool, get_connection_pool
+from .device_type_cache import DeviceTypeCache
+from .connection_profile import ConnectionProfileCache
+from .reachability import ReachabilityChecker
+from .batch import ConfigurationBatch
+
+# Unix sockets used by broker are not available on Windows
+if hasattr(_socket, "AF_UNIX"):
+    from .broker import BrokeredSwitchConnection, SwitchBroker
@@ -0,0 +1,117 @@
+# Copyright (C) 2025 Intel Corporation
+# SPDX-License-Identifier: MIT
+"""Module for base asyncio switch connection."""
+
+import asyncio
+from abc import ABC, abstractmethod
+from ipaddress import ip_address
+from typing import List, Optional, Type, Union
+
+from .base import BaseSwitchConnection
+
+
+class AsyncBaseSwitchConnection(ABC):
+    """
+    Base asyncio connection with switches.
+
+    Methods are coroutines equivalent to methods of blocking connection of SYNC_CONNECTION_TYPE, results have
+    the same format, so output parsers of vendor classes can be reused (see AsyncSwitch).
+    """
+
+    SYNC_CONNECTION_TYPE: Type[BaseSwitchConnection] = BaseSwitchConnection
+
+    def __init__(
+        self,
+        ip: str = None,
+        username: str = None,
+        password: Optional[str] = None,
+        secret: Optional[str] = None,
+        auth_timeout: Union[int, float] = 30,
+        device_type: Optional[str] = None,
+        *args,
+        **kwargs,
+    ):
+        """
+        Init connection with switch, connection is established by connect().
+
+        :param ip: IP address of switch
+        :param username: username for access
+        :param password: password for access
+        :param secret: secret password for access
+        :param auth_timeout: Timeout in seconds for authentication
+        :param device_type: device type from Netmiko SSH_MAPPER_BASE
+        """
+        self._ip = ip_address(ip)
+        self._username = username
+        self._password = password
+        self._secret = secret
+        self._auth_timeout = auth_timeout
+        self._device_type = device_type
+        self._connection = None
+        self._command_lock = asyncio.Lock()
+
+    @property
+    def command_lock(self) -> asyncio.Lock:
+        """Lock held for whole switch operation, waiting coroutines get it in order of their requests."""
+        return self._command_lock
+
+    async def __aenter__(self) -> "AsyncBaseSwitchConnection":
+        await self.connect()
+        return self
+
+    async def __aexit__(self, *args) -> None:
+        await self.disconnect()
+
+    @abstractmethod
+    async def connect(self) -> None:
+        """Establish connection with switch."""
+        raise NotImplementedError("Connecting method is not implemented")
+
+    @abstractmethod
+    async def send_command(self, command: str) -> Union[str, list]:
+        """
+        Send command via connection.
+
+        :param command: command for send
+        :return: Output from command
+        """
+        raise NotImplementedError("Send command is not implemented")
+
+    @abstractmethod
+    async def send_command_expect(self, command: str, prompt: str) -> str:
+        """
+        Send command with expected prompt via connection.
+
+        :param command: command for send
+        :param prompt: expected string
+        :return: Output from command
+        """
+        raise NotImplementedError("Send command expect is not implemented")
+
+    @abstractmethod
+    async def send_command_list(self, commands: List[str]) -> Union[str, list]:
+        """
+        Send commands list via connection.
+
+        :param commands: commands for send
+        :return: Output from commands
+        """
+        raise NotImplementedError("Send command list is not implemented")
+
+    async def send_configuration(self, commands: List[str]) -> str:
+        """
+        Send commands list via connection as configuration.
+
+        :param commands: commands for send
+        :return: Output from commands
+        """
+        raise NotImplementedError("Send configuration is not implemented")
+
+    async def exit_port_configuration(self) -> None:
+        """Exit config mode."""
+        raise NotImplementedError("Exit port configuration is not implemented")
+
+    @abstractmethod
+    async def disconnect(self) -> None:
+        """Close connection with switch."""
+        raise NotImplementedError("Disconnect is not implemented")
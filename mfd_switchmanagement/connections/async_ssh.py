@@ -0,0 +1,257 @@
+# Copyright (C) 2025 Intel Corporation
+# SPDX-License-Identifier: MIT
+"""Module for asyncio ssh connection."""
+
+import asyncio
+import logging
+import re
+import typing
+from typing import Dict, List, Optional, Tuple, Union
+
+from mfd_common_libs import add_logging_level, log_levels
+
+from .async_base import AsyncBaseSwitchConnection
+from .ssh import SSHSwitchConnection
+from ..exceptions import SwitchConnectionException, SwitchException
+
+if typing.TYPE_CHECKING:
+    from pathlib import Path
+
+logger = logging.getLogger(__name__)
+add_logging_level("MODULE_DEBUG", log_levels.MODULE_DEBUG)
+add_logging_level("CMD", log_levels.CMD)
+add_logging_level("OUT", log_levels.OUT)
+
+
+class AsyncSSHSwitchConnection(AsyncBaseSwitchConnection):
+    """
+    Implementation of asyncio SSH connection via asyncssh (optional dependency, extra 'async').
+
+    Single interactive shell is opened per switch, thousands of connections can be served by one event loop.
+    Device type is required, it is used for choosing paging and configuration mode commands.
+    """
+
+    SYNC_CONNECTION_TYPE = SSHSwitchConnection
+    RETURN = "\n"
+    PROMPT_END_REGEX = re.compile(r"[>#$%]\s*$")
+    ANSI_ESCAPE_REGEX = re.compile(r"\x1b\[[0-?]*[ -/]*[@-~]")
+    PAGING_COMMANDS: Dict[str, str] = {
+        "juniper": "set cli screen-length 0",
+        "extreme": "disable clipaging",
+        "mellanox": "terminal length 999",
+    }
+    CONFIG_MODE_COMMANDS: Dict[str, Tuple[str, str]] = {
+        "juniper": ("configure", "exit configuration-mode"),
+    }
+    DEFAULT_PAGING_COMMAND = "terminal length 0"
+    DEFAULT_CONFIG_MODE_COMMANDS = ("configure terminal", "end")
+    _TAIL_SIZE = 512
+
+    def __init__(self, *args, **kwargs):
+        """
+        Init for asyncio ssh connection.
+
+        :param use_ssh_key: Authenticate with key instead of password
+        :param ssh_key_file: Path to private key
+        :param read_timeout: Time in seconds to wait for prompt after command
+        """
+        super().__init__(*args, **kwargs)
+        if not self._device_type:
+            raise ValueError("Device type is required, autodetect is not supported by asyncio connection")
+        self._use_ssh_key: bool = kwargs.get("use_ssh_key", False)
+        self._ssh_key_file: Union[str, "Path"] = kwargs.get("ssh_key_file", "")
+        self._read_timeout: Union[int, float] = kwargs.get("read_timeout", 30)
+        self._process = None
+        self._base_prompt: Optional[str] = None
+        self._prompt_regex: Optional["re.Pattern"] = None
+        self._io_lock = asyncio.Lock()
+
+    def _vendor_value(self, values: Dict[str, typing.Any], default: typing.Any) -> typing.Any:
+        """Get vendor specific value by prefix of device type."""
+        for prefix, value in values.items():
+            if self._device_type.startswith(prefix):
+                return value
+        return default
+
+    @property
+    def base_prompt(self) -> Optional[str]:
+        """Prompt of switch without trailing mode character."""
+        return self._base_prompt
+
+    async def connect(self) -> None:
+        """
+        Connect via asyncssh, open interactive shell, enter enable mode and disable paging.
+
+        :raises SwitchException: if asyncssh is not installed
+        :raises SwitchConnectionException: on connection failure
+        """
+        try:
+            import asyncssh
+        except ImportError as e:
+            raise SwitchException(
+                "asyncssh is required by AsyncSSHSwitchConnection, install mfd-switchmanagement[async]"
+            ) from e
+        if self._use_ssh_key:
+            client_keys = [str(self._ssh_key_file)] if self._ssh_key_file else None
+        else:
+            client_keys = ()
+        try:
+            self._connection = await asyncio.wait_for(
+                asyncssh.connect(
+                    str(self._ip),
+                    username=self._username,
+                    password=self._password,
+                    client_keys=client_keys,
+                    known_hosts=None,
+                ),
+                timeout=self._auth_timeout,
+            )
+            self._process = await self._connection.create_process(term_type="vt100", term_size=(511, 24))
+        except (OSError, asyncio.TimeoutError, asyncssh.Error) as e:
+            raise SwitchConnectionException("Failure on connection") from e
+        await self._prepare_session()
+
+    async def _prepare_session(self) -> None:
+        """Discover prompt, enter enable mode and disable paging."""
+        self._process.stdin.write(self.RETURN)
+        prompt = self._last_line(await self._read_until(self.PROMPT_END_REGEX))
+        if prompt.endswith(">") and self._secret and not self._device_type.startswith("juniper"):
+            self._process.stdin.write(f"enable{self.RETURN}")
+            output = await self._read_until(re.compile(rf"(assword|{self.PROMPT_END_REGEX.pattern})"))
+            if "assword" in output:
+                self._process.stdin.write(f"{self._secret}{self.RETURN}")
+                output = await self._read_until(self.PROMPT_END_REGEX)
+            prompt = self._last_line(output)
+        self._base_prompt = prompt[:-1]
+        self._prompt_regex = re.compile(rf"^{re.escape(self._base_prompt)}(\([^)\n]*\))?[>#$%]\s*$", re.M)
+        logger.log(level=log_levels.MODULE_DEBUG, msg=f"Connected to {self._ip}, prompt: {prompt}")
+        await self._drain()
+        await self._send(self._vendor_value(self.PAGING_COMMANDS, self.DEFAULT_PAGING_COMMAND))
+
+    def _last_line(self, output: str) -> str:
+        """Get last not empty line of output."""
+        return self._normalize(output).rstrip().splitlines()[-1].strip()
+
+    def _normalize(self, output: str) -> str:
+        """Remove ANSI escape codes and carriage returns."""
+        return self.ANSI_ESCAPE_REGEX.sub("", output).replace("\r", "")
+
+    async def _read_until(self, pattern: "re.Pattern") -> str:
+        """
+        Read shell output until pattern is found at its tail.
+
+        :param pattern: pattern searched in tail of output
+        :return: Read output
+        :raises SwitchConnectionException: if shell was closed or pattern was not found within read timeout
+        """
+        chunks = []
+        tail = ""
+        while not pattern.search(self._normalize(tail)):
+            try:
+                chunk = await asyncio.wait_for(self._process.stdout.read(65535), timeout=self._read_timeout)
+            except asyncio.TimeoutError as e:
+                raise SwitchConnectionException(f"Pattern {pattern.pattern} not found in output") from e
+            if not chunk:
+                raise SwitchConnectionException("Connection closed by switch")
+            chunks.append(chunk)
+            tail = (tail + chunk)[-self._TAIL_SIZE :]
+        return "".join(chunks)
+
+    async def _drain(self, timeout: float = 0.2) -> None:
+        """Discard output left in shell, e.g. additional prompts printed after login."""
+        while True:
+            try:
+                chunk = await asyncio.wait_for(self._process.stdout.read(65535), timeout=timeout)
+            except asyncio.TimeoutError:
+                return
+            if not chunk:
+                return
+
+    async def _send(self, command: str, expect: Optional["re.Pattern"] = None, strip: bool = True) -> str:
+        """
+        Write command to shell and read its output.
+
+        :param command: command for send
+        :param expect: pattern ending output, prompt by default
+        :param strip: Remove command echo and trailing prompt from output
+        :return: Output from command
+        """
+        self._process.stdin.write(f"{command}{self.RETURN}")
+        output = self._normalize(await self._read_until(expect or self._prompt_regex))
+        if not strip:
+            return output
+        lines = output.split("\n")
+        if lines and command.strip() in lines[0]:
+            lines = lines[1:]
+        if lines and self._prompt_regex.match(lines[-1].strip()):
+            lines = lines[:-1]
+        return "\n".join(lines).strip("\n")
+
+    async def send_command(self, command: str) -> str:
+        """
+        Send command via connection.
+
+        :param command: command for send
+        :return: Output from command
+        """
+        logger.log(level=log_levels.CMD, msg=f"Executing '{command}'")
+        async with self._io_lock:
+            output = await self._send(command)
+        logger.log(level=log_levels.OUT, msg=output)
+        return output
+
+    async def send_command_expect(self, command: str, prompt: str) -> str:
+        """
+        Send command with expected prompt via connection.
+
+        :param command: command for send
+        :param prompt: expected string, regular expression
+        :return: Output from command
+        """
+        logger.log(level=log_levels.CMD, msg=f"Executing '{command}'    expect_string: {prompt}")
+        async with self._io_lock:
+            output = await self._send(command, expect=re.compile(prompt))
+        logger.log(level=log_levels.OUT, msg=output)
+        return output
+
+    async def send_command_list(self, commands: List[str]) -> str:
+        """
+        Send commands one by one, waiting for prompt after each of them.
+
+        :param commands: commands for send
+        :return: Output from commands, including echo of commands and prompts
+        """
+        logger.log(level=log_levels.CMD, msg=f"Executing command list: '{commands}'")
+        async with self._io_lock:
+            outputs = [await self._send(command, strip=False) for command in commands]
+        output = "".join(outputs)
+        logger.log(level=log_levels.OUT, msg=output)
+        return output
+
+    async def send_configuration(self, commands: List[str]) -> str:
+        """
+        Send commands list via connection as configuration.
+
+        Enter configuration mode, send commands, exit configuration mode
+
+        :param commands: commands for send
+        :return: Output from commands
+        """
+        enter, leave = self._vendor_value(self.CONFIG_MODE_COMMANDS, self.DEFAULT_CONFIG_MODE_COMMANDS)
+        return await self.send_command_list([enter, *commands, leave])
+
+    async def exit_port_configuration(self) -> None:
+        """Exit config mode."""
+        _, leave = self._vendor_value(self.CONFIG_MODE_COMMANDS, self.DEFAULT_CONFIG_MODE_COMMANDS)
+        await self.send_command(leave)
+
+    async def disconnect(self) -> None:
+        """Close connection with switch."""
+        if self._connection is None:
+            return
+        if self._process is not None:
+            self._process.close()
+        self._connection.close()
+        await self._connection.wait_closed()
+        self._connection = None
+        self._process = None
@@ -2,15 +2,34 @@
 # SPDX-License-Identifier: MIT
 """Module for base switch connection."""
 
+import logging
 from abc import ABC, abstractmethod
+from contextlib import contextmanager
 from ipaddress import ip_address
-from typing import Union, Optional
+from typing import TYPE_CHECKING, Iterator, List, Union, Optional
+
+from mfd_common_libs import add_logging_level, log_levels
+
+from ..exceptions import SwitchConnectionException
+from ..utils.governor import CommandGovernor, GovernorStatistics
+from ..utils.lock import FairRLock, LockStatistics
+
+if TYPE_CHECKING:
+    from .batch import ConfigurationBatch
+    from .reachability import ReachabilityChecker
+
+logger = logging.getLogger(__name__)
+add_logging_level("MODULE_DEBUG", log_levels.MODULE_DEBUG)
 
 
 class BaseSwitchConnection(ABC):
     """Base connection with switches."""
 
     _NETMIKO_INIT_DELAY = 2
+    # TCP port of switch service used by connection, probed by reachability checker
+    SERVICE_PORT: Optional[int] = None
+    # connection queues commands into batch of Switch.batch() and sends them by _send_batch()
+    SUPPORTS_BATCH = False
 
     def __init__(
         self,
@@ -35,6 +54,14 @@ class BaseSwitchConnection(ABC):
         :param device_type: device type from Netmiko SSH_MAPPER_BASE
         :param global_delay_factor: Multiplication factor affecting Netmiko delays (Netmiko default: 1)
                                     If not set, 2 will be set for connection creation time and 1 after it
+        :param governor: Rate limiter and concurrency cap shared with other connections, e.g. from get_governor()
+                         for all switches of one model
+        :param rate_limit: Maximal average number of commands per second sent to switch, used when governor
+                           is not passed
+        :param burst: Number of commands which can be sent at once after idle period, used with rate_limit
+        :param max_concurrency: Maximal number of commands in flight, used when governor is not passed
+        :param reachability: Checker of TCP reachability, connecting to switch marked as unreachable fails
+                             immediately
         """
         self._ip = ip_address(ip)
         self._username = username
@@ -44,6 +71,93 @@ class BaseSwitchConnection(ABC):
         self._device_type = device_type
         self._connection = None
         self._global_delay_factor = global_delay_factor
+        self._batch: Optional["ConfigurationBatch"] = None
+        self._command_lock = FairRLock()
+        self._governor: Optional[CommandGovernor] = kwargs.get("governor", None)
+        if self._governor is None and (kwargs.get("rate_limit") or kwargs.get("max_concurrency")):
+            self._governor = CommandGovernor(
+                rate=kwargs.get("rate_limit"),
+                burst=kwargs.get("burst", 1),
+                max_concurrency=kwargs.get("max_concurrency"),
+            )
+        self._reachability: Optional["ReachabilityChecker"] = kwargs.get("reachability", None)
+
+    @property
+    def command_lock(self) -> FairRLock:
+        """
+        Reentrant lock serialising commands sent to switch.
+
+        Holding lock keeps multi-command operation from being interleaved with commands of other threads.
+        Threads are granted lock in order of their requests.
+        """
+        return self._command_lock
+
+    @property
+    def lock_statistics(self) -> LockStatistics:
+        """Snapshot of command lock counters, including time spent by threads waiting for switch."""
+        return self._command_lock.statistics
+
+    @property
+    def governor_statistics(self) -> Optional[GovernorStatistics]:
+        """Snapshot of governor counters, including queueing delay of commands, None if switch is not governed."""
+        return self._governor.statistics if self._governor is not None else None
+
+    def _check_reachability(self) -> None:
+        """
+        Fail fast when switch is marked as unreachable by reachability checker.
+
+        Only SERVICE_PORT of connection is probed, all ports of checker if connection does not define it.
+
+        :raises SwitchConnectionException: if none of probed ports of switch accepts connection
+        """
+        if self._reachability is None:
+            return
+        ports = None if self.SERVICE_PORT is None else (self.SERVICE_PORT,)
+        if not self._reachability.is_reachable(str(self._ip), ports):
+            raise SwitchConnectionException(f"Switch {self._ip} is not reachable, connection is skipped")
+
+    @contextmanager
+    def _governed(self, cost: int = 1) -> Iterator[None]:
+        """
+        Hold slot of governor while command is sent, wait for rate limit and concurrency cap of switch.
+
+        :param cost: Number of command lines sent in slot
+        """
+        if self._governor is None:
+            yield
+            return
+        with self._governor.slot(cost) as delay:
+            if delay > 0.001:
+                logger.log(level=log_levels.MODULE_DEBUG, msg=f"Command to {self._ip} was delayed by {delay:.3f}s")
+            yield
+
+    def _queue(self, commands: List[str], configuration: bool = False) -> bool:
+        """
+        Queue commands if batch is in progress.
+
+        :param commands: commands for send
+        :param configuration: True if commands have to be sent in configuration mode
+        :return: True if commands were queued, False if they have to be sent immediately
+        """
+        if self._batch is None:
+            return False
+        self._batch.add(commands, configuration=configuration)
+        return True
+
+    def _flush_batch(self) -> None:
+        """Send queued commands before command which result depends on them."""
+        if self._batch is not None:
+            self._batch.flush()
+
+    def _send_batch(self, commands: List[str], configuration: bool = False) -> None:
+        """
+        Send batched commands in one push.
+
+        :param commands: commands for send
+        :param configuration: True if commands have to be sent in configuration mode
+        :raises SwitchCommandException: if switch rejected command
+        """
+        raise NotImplementedError("Batching is not implemented for this connection")
 
     @abstractmethod
     def connect(self) -> object:
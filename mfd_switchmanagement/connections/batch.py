@@ -0,0 +1,153 @@
+# Copyright (C) 2025 Intel Corporation
+# SPDX-License-Identifier: MIT
+"""Module for batching of configuration commands."""
+
+import logging
+from contextlib import contextmanager
+from dataclasses import dataclass
+from itertools import groupby
+from typing import TYPE_CHECKING, Iterator, List, Optional, Tuple
+
+from mfd_common_libs import add_logging_level, log_levels
+
+from .cli_mode import CliModeTracker
+from ..data_structures import CliMode
+from ..exceptions import SwitchBatchException, SwitchCommandException
+
+if TYPE_CHECKING:
+    from .base import BaseSwitchConnection
+
+logger = logging.getLogger(__name__)
+add_logging_level("MODULE_DEBUG", log_levels.MODULE_DEBUG)
+
+
+@dataclass
+class BatchEntry:
+    """Commands queued by single call."""
+
+    origin: str
+    commands: List[str]
+    configuration: bool = False
+
+
+class ConfigurationBatch:
+    """
+    Queue of configuration commands sent to switch in one push.
+
+    Commands of consecutive calls of the same kind (command list or configuration) are joined and sent together,
+    configuration mode entered by earlier call is not entered again.
+    """
+
+    def __init__(self, connection: "BaseSwitchConnection"):
+        """
+        Init of batch.
+
+        :param connection: Connection used for sending queued commands
+        """
+        self._connection = connection
+        self._entries: List[BatchEntry] = []
+        self._origin: Optional[str] = None
+        self._calls = 0
+
+    @property
+    def entries(self) -> List[BatchEntry]:
+        """Queued, not sent yet entries."""
+        return list(self._entries)
+
+    def add(self, commands: List[str], configuration: bool = False) -> None:
+        """
+        Queue commands.
+
+        :param commands: commands for send
+        :param configuration: True if commands have to be sent in configuration mode
+        """
+        self._calls += 1
+        origin = self._origin if self._origin is not None else f"call #{self._calls}"
+        self._entries.append(BatchEntry(origin=origin, commands=list(commands), configuration=configuration))
+
+    def discard(self) -> None:
+        """Drop queued commands."""
+        self._entries.clear()
+
+    @contextmanager
+    def origin(self, name: str) -> Iterator[None]:
+        """
+        Name calls queuing commands within context, name is reported when switch rejects one of their commands.
+
+        Calls queued outside of named context are named by their order in batch, e.g. 'call #3'.
+
+        Usage:
+        >>>with switch.batch() as batch:
+        >>>    for port in ports:
+        >>>        with batch.origin(f"enable_port({port})"):
+        >>>            switch.enable_port(port=port)
+
+        :param name: Name of calls, e.g. method and its arguments
+        """
+        previous, self._origin = self._origin, name
+        try:
+            yield
+        finally:
+            self._origin = previous
+
+    @staticmethod
+    def _merge(entries: List[BatchEntry]) -> Tuple[List[str], List[BatchEntry]]:
+        """
+        Join commands of entries, configuration mode entered by earlier entry is not entered again.
+
+        :param entries: entries of the same kind
+        :return: Joined commands and entry which queued each of them
+        """
+        tracker = CliModeTracker()
+        commands: List[str] = []
+        owners: List[BatchEntry] = []
+        for entry in entries:
+            leading = True
+            for command in entry.commands:
+                leading = leading and bool(CliModeTracker.CONFIGURE_REGEX.match(" ".join(command.split())))
+                if leading and tracker.mode is CliMode.CONFIG:
+                    continue
+                tracker.update(command)
+                commands.append(command)
+                owners.append(entry)
+        return commands, owners
+
+    @contextmanager
+    def _suspended(self) -> Iterator[None]:
+        """Send commands directly while flushing."""
+        self._connection._batch = None
+        try:
+            yield
+        finally:
+            self._connection._batch = self
+
+    def flush(self) -> None:
+        """
+        Send queued commands.
+
+        :raises SwitchBatchException: if switch rejected command, message points to call which queued it
+        """
+        entries, self._entries = self._entries, []
+        if not entries:
+            return
+        with self._suspended():
+            for configuration, group in groupby(entries, key=lambda entry: entry.configuration):
+                group = list(group)
+                commands, owners = self._merge(group)
+                if not commands:
+                    continue
+                logger.log(
+                    level=log_levels.MODULE_DEBUG,
+                    msg=f"Sending {len(commands)} batched commands queued by {len(group)} calls",
+                )
+                try:
+                    self._connection._send_batch(commands, configuration=configuration)
+                except SwitchCommandException as e:
+                    if e.command_index is None or not 0 <= e.command_index < len(owners):
+                        origins = ", ".join(entry.origin for entry in group)
+                        raise SwitchBatchException(f"Command queued by one of {origins} failed: {e}") from e
+                    entry = owners[e.command_index]
+                    raise SwitchBatchException(
+                        f"Command queued by {entry.origin} failed: {e}, queued commands: {entry.commands}"
+                    ) from e
+
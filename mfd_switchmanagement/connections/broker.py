@@ -0,0 +1,411 @@
+# Copyright (C) 2025 Intel Corporation
+# SPDX-License-Identifier: MIT
+"""Module for local broker sharing switch connections between processes."""
+
+import argparse
+import getpass
+import json
+import logging
+import os
+import socket
+import socketserver
+import tempfile
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple, Type, Union
+
+from mfd_common_libs import add_logging_level, log_levels
+
+from .base import BaseSwitchConnection
+from .pool import PoolKey, SSHConnectionPool
+from .ssh import SSHSwitchConnection
+from .. import exceptions
+from ..exceptions import SwitchCommandException, SwitchConnectionException, SwitchException
+from ..utils.lock import FairRLock
+
+logger = logging.getLogger(__name__)
+add_logging_level("MODULE_DEBUG", log_levels.MODULE_DEBUG)
+add_logging_level("CMD", log_levels.CMD)
+add_logging_level("OUT", log_levels.OUT)
+
+DEFAULT_BROKER_SOCKET = Path(tempfile.gettempdir()) / f"mfd_switchmanagement_{getpass.getuser()}.sock"
+BROKERED_METHODS = (
+    "send_command",
+    "send_command_expect",
+    "send_command_list",
+    "send_configuration",
+    "exit_port_configuration",
+    "_send_batch",
+)
+
+
+class _BrokerRequestHandler(socketserver.StreamRequestHandler):
+    """Handler of single client, requests of client are handled in order in dedicated thread."""
+
+    server: "SwitchBroker"
+
+    def handle(self) -> None:
+        connection = None
+        held = 0
+        try:
+            for line in self.rfile:
+                request = json.loads(line)
+                method = request.get("method")
+                try:
+                    result = None
+                    if method == "open":
+                        connection = self.server.get_connection(request["params"])
+                    elif connection is None:
+                        raise SwitchConnectionException("Connection is not opened")
+                    elif method == "acquire":
+                        result = connection.command_lock.acquire(*request.get("args", []))
+                        held += int(result)
+                    elif method == "release":
+                        connection.command_lock.release()
+                        held -= 1
+                    elif method in BROKERED_METHODS:
+                        result = getattr(connection, method)(*request.get("args", []))
+                    else:
+                        raise ValueError(f"Method {method} is not supported by broker")
+                    response = {"result": result}
+                except Exception as e:
+                    error = {"type": type(e).__name__, "message": str(e)}
+                    if isinstance(e, SwitchCommandException):
+                        error["command_index"] = e.command_index
+                    response = {"error": error}
+                self.wfile.write(f"{json.dumps(response)}\n".encode())
+                self.wfile.flush()
+        finally:
+            # lock of client which disconnected without releasing it is not left held
+            for _ in range(held):
+                connection.command_lock.release()
+
+
+class SwitchBroker(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    """
+    Local daemon owning long-lived switch connections and sharing them between processes.
+
+    Clients (BrokeredSwitchConnection) connect over Unix socket, commands of many clients sent to the same switch
+    are queued by command lock of single connection.
+    Unix sockets are not available on Windows, so broker is not exported by package there.
+    """
+
+    daemon_threads = True
+
+    def __init__(
+        self,
+        socket_path: Union[str, Path] = DEFAULT_BROKER_SOCKET,
+        connection_type: Type[BaseSwitchConnection] = SSHSwitchConnection,
+    ):
+        """
+        Init of broker, socket is bound and accessible only for current user.
+
+        Socket left by broker which is not running anymore is removed.
+
+        :param socket_path: Path of Unix socket
+        :param connection_type: Connection class used for connections to switches
+        :raises SwitchConnectionException: if other broker is running on socket_path
+        """
+        self._socket_path = Path(socket_path)
+        self._connection_type = connection_type
+        self._connections: Dict[PoolKey, BaseSwitchConnection] = {}
+        self._connections_lock = threading.Lock()
+        self._remove_stale_socket()
+        # socket is created with permissions of umask, so it is never accessible for other users
+        umask = os.umask(0o077)
+        try:
+            super().__init__(str(self._socket_path), _BrokerRequestHandler)
+        finally:
+            os.umask(umask)
+
+    def _remove_stale_socket(self) -> None:
+        """
+        Remove socket of broker which is not running anymore.
+
+        :raises SwitchConnectionException: if broker is listening on socket
+        """
+        if not self._socket_path.exists():
+            return
+        client = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        try:
+            client.connect(str(self._socket_path))
+        except OSError:
+            logger.log(level=log_levels.MODULE_DEBUG, msg=f"Removing stale broker socket {self._socket_path}")
+            self._socket_path.unlink()
+            return
+        finally:
+            client.close()
+        raise SwitchConnectionException(f"Switch broker is already running on {self._socket_path}")
+
+    @property
+    def connections(self) -> List[BaseSwitchConnection]:
+        """Connections owned by broker."""
+        with self._connections_lock:
+            return list(self._connections.values())
+
+    def get_connection(self, params: Dict[str, Any]) -> BaseSwitchConnection:
+        """
+        Get connection to switch, create it if it does not exist yet.
+
+        Connection is shared only by clients passing the same credentials and options, others open new connection.
+
+        :param params: Parameters of connection
+        :return: Connection shared by all clients of switch
+        """
+        key = SSHConnectionPool.make_key(
+            params.get("ip"),
+            params.get("username"),
+            params.get("device_type"),
+            connection_type=self._connection_type,
+            password=params.get("password"),
+            secret=params.get("secret"),
+            ssh_key_file=params.get("ssh_key_file") if params.get("use_ssh_key") else None,
+            options=params,
+        )
+        with self._connections_lock:
+            if key not in self._connections:
+                logger.log(level=log_levels.MODULE_DEBUG, msg=f"Broker is connecting to {key[0]}")
+                self._connections[key] = self._connection_type(**params)
+            return self._connections[key]
+
+    def server_close(self) -> None:
+        """Close socket and disconnect all connections."""
+        super().server_close()
+        with self._connections_lock:
+            connections, self._connections = list(self._connections.values()), {}
+        for connection in connections:
+            try:
+                connection.disconnect()
+            except Exception as e:
+                logger.log(level=log_levels.MODULE_DEBUG, msg=f"Failure on disconnecting brokered connection: {e}")
+        if self._socket_path.exists():
+            self._socket_path.unlink()
+
+
+class _BrokerLock(FairRLock):
+    """Command lock of client, outermost acquisition holds lock of connection in broker as well."""
+
+    def __init__(self, connection: "BrokeredSwitchConnection"):
+        super().__init__()
+        self._connection = connection
+
+    def acquire(self, blocking: bool = True, timeout: float = -1) -> bool:
+        """
+        Acquire lock, outermost acquisition waits for lock of connection in broker in remaining time.
+
+        :param blocking: Wait for lock, if False lock is acquired only when it is free and no thread is waiting
+        :param timeout: Maximal time in seconds to wait for lock, -1 waits without limit
+        :return: True when lock is acquired, False when it is not free or timeout expired
+        """
+        start = time.monotonic()
+        if not super().acquire(blocking, timeout):
+            return False
+        if self._count == 1:
+            remaining = max(timeout - (time.monotonic() - start), 0) if timeout >= 0 else -1
+            try:
+                acquired = self._connection._request("acquire", blocking, remaining)
+            except BaseException:
+                super().release()
+                raise
+            if not acquired:
+                super().release()
+                return False
+        return True
+
+    def release(self) -> None:
+        try:
+            if self._count == 1 and self._owner == threading.get_ident():
+                self._connection._request("release")
+        finally:
+            super().release()
+
+
+class BrokeredSwitchConnection(BaseSwitchConnection):
+    """
+    Connection with switch via local broker (SwitchBroker).
+
+    Broker owns SSH session, so processes sharing broker do not open own sessions to switch.
+    """
+
+    SUPPORTS_BATCH = True
+
+    def __init__(self, *args, **kwargs):
+        """
+        Init of brokered connection.
+
+        Connection parameters are passed to broker, which uses them when connection to switch does not exist yet.
+
+        :param broker_socket: Path of broker Unix socket
+        """
+        super().__init__(*args, **kwargs)
+        self._broker_socket = Path(kwargs.pop("broker_socket", DEFAULT_BROKER_SOCKET))
+        # only options which can be sent to broker are passed, e.g. caches and pools are objects local to process
+        self._params = {
+            key: str(value) if isinstance(value, Path) else value
+            for key, value in kwargs.items()
+            if key != "connection_type" and isinstance(value, (str, int, float, bool, type(None), Path))
+        }
+        self._params.update(
+            ip=str(self._ip),
+            username=self._username,
+            password=self._password,
+            secret=self._secret,
+            auth_timeout=self._auth_timeout,
+            device_type=self._device_type,
+            global_delay_factor=self._global_delay_factor,
+        )
+        self._command_lock = _BrokerLock(self)
+        self._io_lock = threading.Lock()
+        self._stream = None
+        self._connection = self.connect()
+
+    def connect(self) -> socket.socket:
+        """
+        Connect to broker and open connection to switch in it.
+
+        :return: Socket connected to broker
+        :raises SwitchConnectionException: if broker is not running
+        """
+        client = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        try:
+            client.connect(str(self._broker_socket))
+        except OSError as e:
+            client.close()
+            raise SwitchConnectionException(f"Switch broker is not available on {self._broker_socket}") from e
+        self._connection = client
+        self._stream = client.makefile("rwb")
+        self._request("open", params=self._params)
+        return client
+
+    def _request(self, method: str, *args, params: Optional[Dict[str, Any]] = None) -> Any:
+        """
+        Send request to broker and wait for its response.
+
+        :param method: Name of broker method
+        :param args: Arguments of method
+        :param params: Connection parameters for open request
+        :return: Result of method
+        :raises SwitchException: if method failed in broker
+        """
+        request = {"method": method, "args": list(args)}
+        if params is not None:
+            request["params"] = params
+        with self._io_lock:
+            self._stream.write(f"{json.dumps(request)}\n".encode())
+            self._stream.flush()
+            line = self._stream.readline()
+        if not line:
+            raise SwitchConnectionException("Connection with switch broker was closed")
+        response = json.loads(line)
+        if "error" in response:
+            self._raise(response["error"])
+        return response["result"]
+
+    @staticmethod
+    def _raise(error: Dict[str, Any]) -> None:
+        """Raise exception reported by broker, exceptions of this module keep their type."""
+        message = error["message"]
+        exception_type = getattr(exceptions, error["type"], None)
+        if exception_type is SwitchCommandException:
+            raise SwitchCommandException(message, command_index=error.get("command_index", 0))
+        if isinstance(exception_type, type) and issubclass(exception_type, SwitchException):
+            raise exception_type(message)
+        raise SwitchConnectionException(f"{error['type']}: {message}")
+
+    def send_command(self, command: str) -> str:
+        """
+        Send command via broker.
+
+        :param command: command for send
+        :return: Output from command
+        """
+        self._flush_batch()
+        logger.log(level=log_levels.CMD, msg=f"Executing via broker '{command}'")
+        output = self._request("send_command", command)
+        logger.log(level=log_levels.OUT, msg=output)
+        return output
+
+    def send_command_expect(self, command: str, prompt: str) -> str:
+        """
+        Send command with expected prompt via broker.
+
+        :param command: command for send
+        :param prompt: expected string
+        :return: Output from command
+        """
+        self._flush_batch()
+        logger.log(level=log_levels.CMD, msg=f"Executing via broker '{command}'    expect_string: {prompt}")
+        output = self._request("send_command_expect", command, prompt)
+        logger.log(level=log_levels.OUT, msg=output)
+        return output
+
+    def send_command_list(self, commands: List[str]) -> str:
+        """
+        Send commands list via broker.
+
+        :param commands: commands for send
+        :return: Output from commands
+        """
+        if self._queue(commands):
+            return ""
+        logger.log(level=log_levels.CMD, msg=f"Executing command list via broker: '{commands}'")
+        output = self._request("send_command_list", list(commands))
+        logger.log(level=log_levels.OUT, msg=output)
+        return output
+
+    def send_configuration(self, commands: List[str]) -> str:
+        """
+        Send commands list via broker as configuration.
+
+        :param commands: commands for send
+        :return: Output from commands
+        """
+        if self._queue(commands, configuration=True):
+            return ""
+        logger.log(level=log_levels.CMD, msg=f"Executing configuration via broker: '{commands}'")
+        output = self._request("send_configuration", list(commands))
+        logger.log(level=log_levels.OUT, msg=output)
+        return output
+
+    def exit_port_configuration(self) -> None:
+        """Exit config mode."""
+        self._flush_batch()
+        self._request("exit_port_configuration")
+
+    def _send_batch(self, commands: List[str], configuration: bool = False) -> None:
+        """
+        Send batched commands in one push.
+
+        :param commands: commands for send
+        :param configuration: True if commands have to be sent in configuration mode
+        :raises SwitchCommandException: if switch rejected command
+        """
+        self._request("_send_batch", list(commands), configuration)
+
+    def disconnect(self) -> None:
+        """Close connection with broker, connection to switch is kept by broker."""
+        if self._connection is None:
+            return
+        self._stream.close()
+        self._connection.close()
+        self._connection = None
+
+
+def main() -> None:
+    """Run broker until interrupted."""
+    parser = argparse.ArgumentParser(description="Broker sharing SSH connections to switches between processes")
+    parser.add_argument("--socket", default=str(DEFAULT_BROKER_SOCKET), help="Path of Unix socket")
+    args = parser.parse_args()
+    broker = SwitchBroker(socket_path=args.socket)
+    logger.log(level=log_levels.MODULE_DEBUG, msg=f"Switch broker is listening on {args.socket}")
+    try:
+        broker.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        broker.server_close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,166 @@
+# Copyright (C) 2025 Intel Corporation
+# SPDX-License-Identifier: MIT
+"""Module for tracking CLI mode of switch session."""
+
+import re
+from typing import List, Optional
+
+from ..data_structures import CliMode
+
+
+class CliModeTracker:
+    """
+    Track CLI mode and configuration context of switch session.
+
+    State is derived from commands sent through session. When state is not known (None) nothing is skipped.
+    """
+
+    CONFIGURE_REGEX = re.compile(r"^conf(igure)?(\s+t(erminal)?)?$", re.I)
+    INTERFACE_REGEX = re.compile(r"^int(erface)?\s+(?P<name>\S.*)$", re.I)
+    NO_INTERFACE_REGEX = re.compile(r"^no\s+int(erface)?\s+", re.I)
+    SUBMODE_REGEX = re.compile(
+        r"^(vlan|class-map|policy-map|class|router|line|dcb-map|qos-map|protocol|port-profile|system\s+qos"
+        r"|spanning-tree\s+mst\s+configuration)\b",
+        re.I,
+    )
+    # commands known to stay in context, any other command could implicitly leave it (e.g. global command
+    # sent in interface context), so context is no longer tracked after it
+    INTERFACE_COMMAND_REGEX = re.compile(
+        r"^(no\s+|default\s+)?(shut(down)?|switchport|description|mtu|speed|duplex|channel-group|lacp|lldp|dcbx"
+        r"|flowcontrol|flow-control|priority-flow-control|pfc|ets|fec|error-correction|negotiation|auto-negotiate"
+        r"|service-policy|storm-control|spanning-tree\s+(port|portfast|bpdu\S*|guard|link-type|cost|port-priority)"
+        r"|ipv?6?\s+address|(un)?tagged|load-interval|bandwidth|encapsulation|cdp|udld|vpc|dcb|qos|portmode)\b",
+        re.I,
+    )
+    VLAN_COMMAND_REGEX = re.compile(r"^(no\s+)?(name|state|vn-segment|shutdown|(un)?tagged)\b", re.I)
+    LEAVE_CONFIG_COMMANDS = ("quit", "disable", "commit and-quit", "exit configuration-mode")
+
+    def __init__(self, mode: Optional[CliMode] = None):
+        """
+        Init of tracker.
+
+        :param mode: Initial CLI mode, None if unknown
+        """
+        self.mode = mode
+        self.context: Optional[str] = None
+
+    @property
+    def interface(self) -> Optional[str]:
+        """Interface which configuration context is entered, None if outside of interface context."""
+        match = self.INTERFACE_REGEX.match(self.context) if self.context else None
+        return match.group("name") if match else None
+
+    @classmethod
+    def enters_interface(cls, command: str) -> bool:
+        """
+        Check if command enters interface configuration context.
+
+        One-line interface commands (e.g. 'interface ethernet 1/1 shutdown') are configuring interface without
+        entering its context, they are recognized by keyword following interface identifier.
+
+        :param command: command to check
+        :return: True if command enters interface context
+        """
+        match = cls.INTERFACE_REGEX.match(command)
+        if not match:
+            return False
+        identifier_found = False
+        previous = ""
+        for token in match.group("name").split():
+            has_digit = any(char.isdigit() for char in token)
+            if identifier_found and not has_digit and token != "," and not previous.endswith(","):
+                return False
+            identifier_found = identifier_found or has_digit
+            previous = token
+        return identifier_found
+
+    def reset(self, mode: Optional[CliMode] = None) -> None:
+        """
+        Set state of session, e.g. after reconnection or failure.
+
+        :param mode: CLI mode of session, None if unknown
+        """
+        self.mode = mode
+        self.context = None
+
+    def copy(self) -> "CliModeTracker":
+        """Get snapshot of current state."""
+        tracker = CliModeTracker(self.mode)
+        tracker.context = self.context
+        return tracker
+
+    @staticmethod
+    def _normalize(command: str) -> str:
+        return " ".join(command.split())
+
+    def is_redundant(self, command: str) -> bool:
+        """
+        Check if command is mode transition already satisfied by current state.
+
+        :param command: command to check
+        :return: True if sending command would not change state
+        """
+        command = self._normalize(command)
+        if self.mode is not CliMode.CONFIG:
+            return False
+        if self.CONFIGURE_REGEX.match(command):
+            return True
+        return self.interface is not None and self.enters_interface(command) and self.context.lower() == command.lower()
+
+    def update(self, command: str) -> None:
+        """
+        Update state with command sent to switch.
+
+        :param command: command sent to switch
+        """
+        command = self._normalize(command)
+        lowered = command.lower()
+        if self.CONFIGURE_REGEX.match(command):
+            if self.mode is not CliMode.CONFIG:
+                self.mode = CliMode.CONFIG
+                self.context = None
+        elif lowered == "end":
+            self.reset(CliMode.EXEC)
+        elif lowered == "exit":
+            if self.context is not None:
+                self.context = None
+            elif self.mode is CliMode.CONFIG:
+                self.mode = CliMode.EXEC
+        elif lowered in self.LEAVE_CONFIG_COMMANDS:
+            self.reset()
+        elif self.mode is not CliMode.CONFIG:
+            return
+        elif self.NO_INTERFACE_REGEX.match(command):
+            self.context = None
+        elif self.enters_interface(command) or self.SUBMODE_REGEX.match(command):
+            self.context = command
+        elif self.context is not None and not self._stays_in_context(command):
+            self.context = None
+
+    def _stays_in_context(self, command: str) -> bool:
+        """
+        Check if command is known to be executed in current configuration context without leaving it.
+
+        :param command: normalized command sent to switch
+        :return: True if context is kept after command
+        """
+        if self.interface is not None:
+            return bool(self.INTERFACE_COMMAND_REGEX.match(command))
+        if self.context.lower().startswith("vlan"):
+            return bool(self.VLAN_COMMAND_REGEX.match(command))
+        return False
+
+    def filter(self, commands: List[str]) -> List[str]:
+        """
+        Drop mode transitions already satisfied, update state with remaining commands.
+
+        :param commands: commands to send
+        :return: commands which have to be sent
+        """
+        required = []
+        for command in commands:
+            if self.is_redundant(command):
+                continue
+            self.update(command)
+            required.append(command)
+        return required
@@ -0,0 +1,90 @@
+# Copyright (C) 2025 Intel Corporation
+# SPDX-License-Identifier: MIT
+"""Module for persistent profiles of SSH session preparation."""
+
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Optional, Union
+
+from .device_type_cache import JsonFileCache
+
+DEFAULT_PROFILE_FILE = Path.home() / ".cache" / "mfd_switchmanagement" / "connection_profiles.json"
+
+
+@dataclass
+class ConnectionProfile:
+    """Session details learned on first connect to switch."""
+
+    base_prompt: str
+    paging_command: str
+    width_command: Optional[str] = None
+
+
+class ConnectionProfileCache(JsonFileCache):
+    """
+    Persistent store of connection profiles.
+
+    Paging and terminal width commands are learned per device type, prompt per switch IP.
+    """
+
+    def __init__(self, path: Union[str, Path] = DEFAULT_PROFILE_FILE, ttl: float = 7 * 24 * 3600):
+        """
+        Init of connection profile cache.
+
+        :param path: Path to JSON file with cached profiles
+        :param ttl: Time in seconds after which cached profile is considered outdated
+        """
+        super().__init__(path, ttl)
+
+    def get(self, device_type: str, ip: str) -> Optional[ConnectionProfile]:
+        """
+        Get profile of switch.
+
+        :param device_type: device type from Netmiko SSH_MAPPER_BASE
+        :param ip: IP address of switch
+        :return: Profile or None if prompt of switch or commands of device type are not cached
+        """
+        entry = self._get_entry(device_type)
+        if not entry or str(ip) not in entry.get("prompts", {}):
+            return None
+        return ConnectionProfile(
+            base_prompt=entry["prompts"][str(ip)],
+            paging_command=entry["paging_command"],
+            width_command=entry.get("width_command"),
+        )
+
+    def set(self, device_type: str, ip: str, profile: ConnectionProfile) -> None:
+        """
+        Store profile of switch.
+
+        :param device_type: device type from Netmiko SSH_MAPPER_BASE
+        :param ip: IP address of switch
+        :param profile: Learned profile
+        """
+        with self._lock:
+            entries = self._load()
+            prompts = entries.get(device_type, {}).get("prompts", {})
+            prompts[str(ip)] = profile.base_prompt
+            entries[device_type] = {
+                "paging_command": profile.paging_command,
+                "width_command": profile.width_command,
+                "prompts": prompts,
+                "timestamp": time.time(),
+            }
+            self._save(entries)
+
+    def invalidate(self, device_type: Optional[str] = None, ip: Optional[str] = None) -> None:
+        """
+        Remove cached profile.
+
+        :param device_type: device type of removed profile, if not passed whole cache is cleared
+        :param ip: IP address of switch which prompt is removed, if not passed whole device type entry is removed
+        """
+        if device_type is None or ip is None:
+            self._remove_entry(device_type)
+            return
+        with self._lock:
+            entries = self._load()
+            entries.get(device_type, {}).get("prompts", {}).pop(str(ip), None)
+            self._save(entries)
@@ -0,0 +1,137 @@
+# Copyright (C) 2025 Intel Corporation
+# SPDX-License-Identifier: MIT
+"""Module for persistent caches of switch details learned on connect."""
+
+import json
+import logging
+import os
+import tempfile
+import threading
+import time
+from pathlib import Path
+from typing import Dict, Optional, Union
+
+from mfd_common_libs import add_logging_level, log_levels
+
+logger = logging.getLogger(__name__)
+add_logging_level("MODULE_DEBUG", log_levels.MODULE_DEBUG)
+
+DEFAULT_CACHE_FILE = Path.home() / ".cache" / "mfd_switchmanagement" / "device_types.json"
+
+
+class JsonFileCache:
+    """Small persistent key-value store kept in JSON file, every entry expires after ttl seconds."""
+
+    def __init__(self, path: Union[str, Path], ttl: float):
+        """
+        Init of cache.
+
+        :param path: Path to JSON file with cached entries
+        :param ttl: Time in seconds after which cached entry is considered outdated
+        """
+        self._path = Path(path)
+        self._ttl = ttl
+        self._lock = threading.Lock()
+
+    def _get_entry(self, key: str) -> Optional[Dict]:
+        """
+        Get cached entry.
+
+        :param key: key of entry
+        :return: Entry or None if not cached or expired
+        """
+        with self._lock:
+            entry = self._load().get(key)
+        if not entry or time.time() - entry.get("timestamp", 0) > self._ttl:
+            return None
+        return entry
+
+    def _set_entry(self, key: str, entry: Dict) -> None:
+        """
+        Store entry, timestamp of entry is refreshed.
+
+        :param key: key of entry
+        :param entry: JSON serializable entry
+        """
+        with self._lock:
+            entries = self._load()
+            entries[key] = {**entry, "timestamp": time.time()}
+            self._save(entries)
+
+    def _remove_entry(self, key: Optional[str] = None) -> None:
+        """
+        Remove cached entry.
+
+        :param key: key of entry, if not passed whole cache is cleared
+        """
+        with self._lock:
+            entries = self._load()
+            if key is None:
+                entries.clear()
+            else:
+                entries.pop(key, None)
+            self._save(entries)
+
+    def _load(self) -> Dict[str, Dict]:
+        """Read entries from cache file, unreadable file is treated as empty cache."""
+        try:
+            with open(self._path, "r") as cache_file:
+                entries = json.load(cache_file)
+        except (OSError, ValueError):
+            return {}
+        return entries if isinstance(entries, dict) else {}
+
+    def _save(self, entries: Dict[str, Dict]) -> None:
+        """Atomically write entries to cache file."""
+        try:
+            self._path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=self._path.parent, prefix=self._path.name)
+            with os.fdopen(fd, "w") as cache_file:
+                json.dump(entries, cache_file)
+            os.replace(tmp_path, self._path)
+        except OSError as e:
+            logger.log(level=log_levels.MODULE_DEBUG, msg=f"Could not write cache {self._path}: {e}")
+
+
+class DeviceTypeCache(JsonFileCache):
+    """
+    Persistent store of Netmiko device types detected per switch IP.
+
+    Entries are kept in small JSON file, every entry expires after ttl seconds.
+    """
+
+    def __init__(self, path: Union[str, Path] = DEFAULT_CACHE_FILE, ttl: float = 7 * 24 * 3600):
+        """
+        Init of device type cache.
+
+        :param path: Path to JSON file with cached entries
+        :param ttl: Time in seconds after which cached device type is considered outdated
+        """
+        super().__init__(path, ttl)
+
+    def get(self, ip: str) -> Optional[str]:
+        """
+        Get cached device type of switch.
+
+        :param ip: IP address of switch
+        :return: Device type or None if not cached or expired
+        """
+        entry = self._get_entry(str(ip))
+        return entry.get("device_type") if entry else None
+
+    def set(self, ip: str, device_type: str) -> None:
+        """
+        Store device type of switch.
+
+        :param ip: IP address of switch
+        :param device_type: device type from Netmiko SSH_MAPPER_BASE
+        """
+        self._set_entry(str(ip), {"device_type": device_type})
+
+    def invalidate(self, ip: Optional[str] = None) -> None:
+        """
+        Remove cached device type.
+
+        :param ip: IP address of switch, if not passed whole cache is cleared
+        """
+        self._remove_entry(None if ip is None else str(ip))
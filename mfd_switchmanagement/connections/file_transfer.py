@@ -0,0 +1,179 @@
+# Copyright (C) 2025 Intel Corporation
+# SPDX-License-Identifier: MIT
+"""Module for pushing configuration to switch as file."""
+
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional
+
+from .cli_mode import CliModeTracker
+from ..data_structures import CliMode
+
+
+@dataclass
+class ConfigFilePlan:
+    """Configuration rendered to file and commands applying it."""
+
+    lines: List[str]
+    apply_commands: List[str] = field(default_factory=list)
+
+    @property
+    def content(self) -> str:
+        """Content of configuration file."""
+        return "\n".join(self.lines) + "\n"
+
+
+class ConfigFileHandler:
+    """Base of vendor specific way of applying configuration file."""
+
+    FILE_NAME = "mfd_config.cfg"
+
+    @property
+    def remote_path(self) -> str:
+        """Destination of file transfer."""
+        raise NotImplementedError("Remote path is not implemented for this switch")
+
+    @property
+    def delete_command(self) -> str:
+        """Command removing transferred file from switch, run in exec mode."""
+        raise NotImplementedError("Deleting of configuration file is not implemented for this switch")
+
+    def build(self, commands: List[str], configuration: bool, mode: Optional[CliMode]) -> Optional[ConfigFilePlan]:
+        """
+        Render commands to configuration file.
+
+        :param commands: commands for send
+        :param configuration: True if commands are sent in configuration mode entered by connection
+        :param mode: Current CLI mode of session, None if unknown
+        :return: Plan of file push or None if commands can not be applied as file
+        """
+        raise NotImplementedError("Configuration file push is not implemented for this switch")
+
+
+class CopyConfigFileHandler(ConfigFileHandler):
+    """Configuration file merged into running config with copy command from exec mode."""
+
+    def __init__(self, remote_path: str, copy_command: str, delete_command: str):
+        """
+        Init of handler.
+
+        :param remote_path: Destination of file transfer
+        :param copy_command: Command merging file into running config
+        :param delete_command: Command removing transferred file from switch
+        """
+        self._remote_path = remote_path
+        self._copy_command = copy_command
+        self._delete_command = delete_command
+
+    @property
+    def remote_path(self) -> str:
+        """Destination of file transfer."""
+        return self._remote_path
+
+    @property
+    def delete_command(self) -> str:
+        """Command removing transferred file from switch, run in exec mode."""
+        return self._delete_command
+
+    def build(self, commands: List[str], configuration: bool, mode: Optional[CliMode]) -> Optional[ConfigFilePlan]:
+        """
+        Render commands to configuration file.
+
+        Command list has to start with entering configuration mode, context left by commands is entered again
+        after file is applied.
+
+        :param commands: commands for send
+        :param configuration: True if commands are sent in configuration mode entered by connection
+        :param mode: Current CLI mode of session, None if unknown
+        :return: Plan of file push or None if commands can not be applied as file
+        """
+        apply_commands = [] if mode is CliMode.EXEC else ["end"]
+        if configuration:
+            return ConfigFilePlan(lines=list(commands), apply_commands=apply_commands + [self._copy_command])
+        if not commands or not CliModeTracker.CONFIGURE_REGEX.match(commands[0].strip()):
+            return None
+        tracker = CliModeTracker(CliMode.EXEC)
+        for command in commands:
+            tracker.update(command)
+        lines = list(commands[1:])
+        while lines and lines[-1].strip().lower() == "end":
+            lines.pop()
+        apply_commands.append(self._copy_command)
+        if tracker.mode is CliMode.CONFIG:
+            apply_commands.append(commands[0])
+            if tracker.context:
+                apply_commands.append(tracker.context)
+        return ConfigFilePlan(lines=lines, apply_commands=apply_commands)
+
+
+class JunosConfigFileHandler(ConfigFileHandler):
+    """Set commands loaded into candidate configuration with load set."""
+
+    ENTER_COMMANDS = ("edit", "configure", "configure private", "configure exclusive")
+    FILE_COMMANDS = ("set ", "delete ", "activate ", "deactivate ")
+
+    @property
+    def remote_path(self) -> str:
+        """Destination of file transfer."""
+        return f"/var/tmp/{self.FILE_NAME}"
+
+    @property
+    def delete_command(self) -> str:
+        """Command removing transferred file from switch, run in exec mode."""
+        return f"file delete {self.remote_path}"
+
+    def build(self, commands: List[str], configuration: bool, mode: Optional[CliMode]) -> Optional[ConfigFilePlan]:
+        """
+        Render set commands to file loaded with 'load set', commit and exit commands are sent as usual.
+
+        :param commands: commands for send
+        :param configuration: True if commands are sent in configuration mode entered by connection
+        :param mode: Current CLI mode of session, None if unknown
+        :return: Plan of file push or None if commands can not be applied as file
+        """
+        if configuration:
+            enter, commands = "configure", list(commands)
+        elif commands and commands[0].strip().lower() in self.ENTER_COMMANDS:
+            enter, commands = commands[0], list(commands[1:])
+        else:
+            return None
+        lines = []
+        while commands and commands[0].strip().lower().startswith(self.FILE_COMMANDS):
+            lines.append(commands.pop(0))
+        if not lines:
+            return None
+        apply_commands = [enter, f"load set {self.remote_path}"] + commands
+        if configuration:
+            apply_commands.append("exit configuration-mode")
+        return ConfigFilePlan(lines=lines, apply_commands=apply_commands)
+
+
+CONFIG_FILE_HANDLERS: Dict[str, ConfigFileHandler] = {
+    "cisco_nxos": CopyConfigFileHandler(
+        remote_path=f"bootflash:{ConfigFileHandler.FILE_NAME}",
+        copy_command=f"copy bootflash:{ConfigFileHandler.FILE_NAME} running-config",
+        delete_command=f"delete bootflash:{ConfigFileHandler.FILE_NAME} no-prompt",
+    ),
+    "arista_eos": CopyConfigFileHandler(
+        remote_path=f"/mnt/flash/{ConfigFileHandler.FILE_NAME}",
+        copy_command=f"copy flash:{ConfigFileHandler.FILE_NAME} running-config",
+        delete_command=f"delete flash:{ConfigFileHandler.FILE_NAME}",
+    ),
+    "dell_os10": CopyConfigFileHandler(
+        remote_path=ConfigFileHandler.FILE_NAME,
+        copy_command=f"copy home://{ConfigFileHandler.FILE_NAME} running-configuration",
+        delete_command=f"delete home://{ConfigFileHandler.FILE_NAME}",
+    ),
+    "juniper_junos": JunosConfigFileHandler(),
+}
+
+
+def get_config_file_handler(device_type: Optional[str]) -> Optional[ConfigFileHandler]:
+    """
+    Get handler of configuration file push for device type.
+
+    :param device_type: device type from Netmiko SSH_MAPPER_BASE
+    :return: Handler or None if device type is not supported
+    """
+    if not device_type:
+        return None
+    return CONFIG_FILE_HANDLERS.get(device_type.removesuffix("_ssh"))
@@ -0,0 +1,128 @@
+# Copyright (C) 2025 Intel Corporation
+# SPDX-License-Identifier: MIT
+"""Module for tracking of command latency."""
+
+import math
+import re
+import threading
+from collections import deque
+from dataclasses import dataclass
+from typing import Deque, Dict, Optional, Union
+
+
+@dataclass
+class CommandLatency:
+    """Latency statistics of command class."""
+
+    count: int
+    ewma: float
+    p99: float
+    last: float
+    timeouts: int = 0
+
+
+class LatencyTracker:
+    """
+    Latency statistics of commands grouped by command class.
+
+    Command class is command without its arguments, e.g. 'show interface' for 'show interface ethernet 1/1'.
+    Read timeout of command is derived from observed latency of its class.
+    """
+
+    ARGUMENT_REGEX = re.compile(r"[\d/:.,|\"']")
+
+    def __init__(
+        self,
+        alpha: float = 0.2,
+        samples: int = 100,
+        min_samples: int = 3,
+        timeout_factor: Union[int, float] = 4,
+        min_timeout: Union[int, float] = 10,
+        max_timeout: Union[int, float] = 600,
+    ):
+        """
+        Init of tracker.
+
+        :param alpha: Weight of new sample in exponentially weighted moving average
+        :param samples: Number of latest samples used for p99
+        :param min_samples: Number of samples required before read timeout is derived from statistics
+        :param timeout_factor: Multiplier of observed latency giving read timeout
+        :param min_timeout: Lower bound of read timeout in seconds, Netmiko default read timeout by default
+        :param max_timeout: Upper bound of read timeout in seconds
+        """
+        self._alpha = alpha
+        self._min_samples = min_samples
+        self._timeout_factor = timeout_factor
+        self._min_timeout = min_timeout
+        self._max_timeout = max_timeout
+        self._samples: Dict[str, Deque[float]] = {}
+        self._samples_count = samples
+        self._statistics: Dict[str, CommandLatency] = {}
+        self._lock = threading.Lock()
+
+    @classmethod
+    def command_class(cls, command: str) -> str:
+        """
+        Get class of command.
+
+        :param command: command sent to switch
+        :return: Leading words of command without arguments (numbers, port names, addresses, filters)
+        """
+        words = []
+        for word in command.strip().lower().split():
+            if cls.ARGUMENT_REGEX.search(word):
+                break
+            words.append(word)
+            if len(words) == 3:
+                break
+        return " ".join(words)
+
+    def record(self, command: str, duration: float, timed_out: bool = False) -> None:
+        """
+        Store latency of command.
+
+        :param command: command sent to switch
+        :param duration: Time in seconds from sending command to reading prompt, read timeout if command timed out
+        :param timed_out: True if prompt was not read within read timeout
+        """
+        command_class = self.command_class(command)
+        with self._lock:
+            samples = self._samples.setdefault(command_class, deque(maxlen=self._samples_count))
+            samples.append(duration)
+            p99 = sorted(samples)[math.ceil(len(samples) * 0.99) - 1]
+            statistics = self._statistics.get(command_class)
+            if statistics is None:
+                self._statistics[command_class] = CommandLatency(
+                    count=1, ewma=duration, p99=p99, last=duration, timeouts=int(timed_out)
+                )
+                return
+            statistics.count += 1
+            statistics.ewma = self._alpha * duration + (1 - self._alpha) * statistics.ewma
+            statistics.p99 = p99
+            statistics.last = duration
+            statistics.timeouts += int(timed_out)
+
+    def read_timeout(self, command: str, min_timeout: Optional[Union[int, float]] = None) -> Optional[float]:
+        """
+        Get read timeout for command.
+
+        :param command: command sent to switch
+        :param min_timeout: Lower bound of read timeout in seconds (e.g. read timeout requested by caller),
+                            lower bound of tracker if not passed
+        :return: Read timeout in seconds, None if there are not enough samples of command class
+        """
+        with self._lock:
+            statistics = self._statistics.get(self.command_class(command))
+            if statistics is None or (statistics.count < self._min_samples and not statistics.timeouts):
+                return None
+            timeout = max(statistics.p99, statistics.ewma) * self._timeout_factor
+        min_timeout = self._min_timeout if min_timeout is None else min_timeout
+        return min(max(timeout, min_timeout), max(self._max_timeout, min_timeout))
+
+    @property
+    def statistics(self) -> Dict[str, CommandLatency]:
+        """Snapshot of latency statistics per command class."""
+        with self._lock:
+            return {
+                command_class: CommandLatency(**vars(latency)) for command_class, latency in self._statistics.items()
+            }
@@ -0,0 +1,226 @@
+# Copyright (C) 2025 Intel Corporation
+# SPDX-License-Identifier: MIT
+"""Module for pool of SSH switch connections."""
+
+import hashlib
+import logging
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Set, Tuple, Type
+
+from mfd_common_libs import add_logging_level, log_levels
+
+from .ssh import SSHSwitchConnection
+
+logger = logging.getLogger(__name__)
+add_logging_level("MODULE_DEBUG", log_levels.MODULE_DEBUG)
+
+PoolKey = Tuple[str, Optional[str], Optional[str], str, str, str]
+
+# parameters identifying switch and credentials, all other parameters of connection are its options
+IDENTITY_PARAMS = frozenset({"ip", "username", "device_type", "password", "secret", "ssh_key_file", "use_ssh_key"})
+
+
+@dataclass
+class PoolStatistics:
+    """Counters of connection pool."""
+
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    idle: int = 0
+
+
+class SSHConnectionPool:
+    """
+    Pool of live SSH connections shared between Switch objects.
+
+    Connections are keyed by (ip, username, device_type, connection type, credentials, options), so borrower gets
+    connection configured the way it asked for (lazy connect, keepalive, caches, governor, ...). Borrowed connection
+    is owned exclusively by borrower until it is released back to pool. Connections idle longer than max_idle_time
+    are disconnected.
+    """
+
+    def __init__(self, max_idle_time: float = 300, max_idle_per_key: int = 4):
+        """
+        Init of connection pool.
+
+        :param max_idle_time: Time in seconds after which idle connection is evicted from pool
+        :param max_idle_per_key: Maximum number of idle connections kept for single key
+        """
+        self._max_idle_time = max_idle_time
+        self._max_idle_per_key = max_idle_per_key
+        self._idle: Dict[PoolKey, List[Tuple[SSHSwitchConnection, float]]] = {}
+        self._borrowed: Set[int] = set()
+        self._lock = threading.Lock()
+        self._statistics = PoolStatistics()
+
+    @staticmethod
+    def make_key(
+        ip: str,
+        username: Optional[str] = None,
+        device_type: Optional[str] = None,
+        connection_type: Type[SSHSwitchConnection] = SSHSwitchConnection,
+        password: Optional[str] = None,
+        secret: Optional[str] = None,
+        ssh_key_file: Optional[str] = None,
+        options: Optional[Dict[str, Any]] = None,
+    ) -> PoolKey:
+        """
+        Build pool key for connection parameters.
+
+        Credentials are part of key as digest only, so they are not kept in plain text by pool.
+        Options of plain types are compared by value, other options (caches, governor, ...) by identity.
+
+        :param ip: IP address of switch
+        :param username: username for access
+        :param device_type: device type from Netmiko SSH_MAPPER_BASE
+        :param connection_type: SSH connection class
+        :param password: password for access
+        :param secret: secret password for access
+        :param ssh_key_file: path to SSH key used for access
+        :param options: other parameters of connection
+        :return: Pool key
+        """
+        credentials = hashlib.sha256(repr((password, secret, str(ssh_key_file or ""))).encode()).hexdigest()
+        connection_type_name = f"{connection_type.__module__}.{connection_type.__qualname__}"
+        options = sorted(
+            (name, value if isinstance(value, (str, int, float, bool, type(None))) else f"<{id(value):#x}>")
+            for name, value in (options or {}).items()
+            if name not in IDENTITY_PARAMS
+        )
+        return str(ip), username, device_type, connection_type_name, credentials, repr(options)
+
+    @property
+    def statistics(self) -> PoolStatistics:
+        """Snapshot of pool counters."""
+        with self._lock:
+            return PoolStatistics(
+                hits=self._statistics.hits,
+                misses=self._statistics.misses,
+                evictions=self._statistics.evictions,
+                idle=sum(len(entries) for entries in self._idle.values()),
+            )
+
+    def acquire(
+        self, connection_type: Type[SSHSwitchConnection] = SSHSwitchConnection, **kwargs
+    ) -> SSHSwitchConnection:
+        """
+        Borrow live connection from pool or create new one.
+
+        Idle connections are checked for health before they are lent, dead ones are dropped.
+
+        :param connection_type: SSH connection class used when new connection has to be created
+        :param kwargs: Parameters of connection, passed to connection_type on pool miss
+        :return: Connection owned by caller until release
+        """
+        key = self.make_key(
+            kwargs.get("ip"),
+            kwargs.get("username"),
+            kwargs.get("device_type"),
+            connection_type=connection_type,
+            password=kwargs.get("password"),
+            secret=kwargs.get("secret"),
+            ssh_key_file=kwargs.get("ssh_key_file") if kwargs.get("use_ssh_key") else None,
+            options=kwargs,
+        )
+        self.evict_idle()
+        while True:
+            with self._lock:
+                entries = self._idle.get(key)
+                if not entries:
+                    self._statistics.misses += 1
+                    break
+                connection, _ = entries.pop()
+            if self._is_healthy(connection):
+                with self._lock:
+                    self._statistics.hits += 1
+                    self._borrowed.add(id(connection))
+                logger.log(level=log_levels.MODULE_DEBUG, msg=f"Reusing pooled connection to {key[0]}")
+                return connection
+            self._drop(connection)
+
+        logger.log(level=log_levels.MODULE_DEBUG, msg=f"Creating new pooled connection to {key[0]}")
+        connection = connection_type(**kwargs)
+        connection._pool_key = key
+        with self._lock:
+            self._borrowed.add(id(connection))
+        return connection
+
+    def release(self, connection: SSHSwitchConnection) -> None:
+        """
+        Return borrowed connection to pool.
+
+        Releasing connection which is not borrowed (e.g. released twice) does nothing.
+
+        :param connection: Connection acquired from this pool
+        """
+        key = getattr(connection, "_pool_key", None)
+        if key is None:
+            raise ValueError("Connection was not acquired from connection pool")
+        with self._lock:
+            if id(connection) not in self._borrowed:
+                logger.log(level=log_levels.MODULE_DEBUG, msg=f"Connection to {key[0]} is already released")
+                return
+            self._borrowed.discard(id(connection))
+            entries = self._idle.setdefault(key, [])
+            if len(entries) < self._max_idle_per_key:
+                entries.append((connection, time.monotonic()))
+                return
+        self._drop(connection)
+
+    def evict_idle(self) -> None:
+        """Disconnect connections idle longer than allowed time."""
+        deadline = time.monotonic() - self._max_idle_time
+        expired = []
+        with self._lock:
+            for entries in self._idle.values():
+                expired.extend(connection for connection, released in entries if released < deadline)
+                entries[:] = [(connection, released) for connection, released in entries if released >= deadline]
+        for connection in expired:
+            self._drop(connection)
+
+    def clear(self) -> None:
+        """Disconnect all idle connections."""
+        with self._lock:
+            expired = [connection for entries in self._idle.values() for connection, _ in entries]
+            self._idle.clear()
+        for connection in expired:
+            self._drop(connection)
+
+    @staticmethod
+    def _is_healthy(connection: SSHSwitchConnection) -> bool:
+        """Check if transport of connection is still alive, lazy connection not connected yet is healthy."""
+        if connection._connection is None:
+            return True
+        try:
+            return bool(connection._check_connection())
+        except Exception:
+            return False
+
+    def _drop(self, connection: SSHSwitchConnection) -> None:
+        """Disconnect connection removed from pool, its keepalive is stopped too."""
+        with self._lock:
+            self._statistics.evictions += 1
+        try:
+            connection.disconnect()
+        except Exception as e:
+            logger.log(level=log_levels.MODULE_DEBUG, msg=f"Failure on disconnecting pooled connection: {e}")
+
+
+_default_pool: Optional[SSHConnectionPool] = None
+_default_pool_lock = threading.Lock()
+
+
+def get_connection_pool() -> SSHConnectionPool:
+    """
+    Get process-wide connection pool.
+
+    :return: Connection pool shared by whole process
+    """
+    global _default_pool
+    with _default_pool_lock:
+        if _default_pool is None:
+            _default_pool = SSHConnectionPool()
+        return _default_pool
@@ -0,0 +1,164 @@
+# Copyright (C) 2025 Intel Corporation
+# SPDX-License-Identifier: MIT
+"""Module for TCP reachability pre-check of switches."""
+
+import asyncio
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from ipaddress import ip_address
+from typing import Dict, Iterable, Optional, Sequence, Tuple
+
+from mfd_common_libs import add_logging_level, log_levels
+
+logger = logging.getLogger(__name__)
+add_logging_level("MODULE_DEBUG", log_levels.MODULE_DEBUG)
+
+
+@dataclass
+class ReachabilityState:
+    """Result of probe of TCP port of switch."""
+
+    reachable: bool
+    port: int
+    timestamp: float
+
+
+class ReachabilityChecker:
+    """
+    Pre-flight check of switches, TCP ports of all switches are probed concurrently with short timeout.
+
+    Switch is reachable when any of probed ports accepts connection. Connections getting checker (reachability
+    parameter) probe only port of their service (e.g. 22 for SSH) and fail immediately for switches marked as
+    unreachable, instead of waiting for whole auth_timeout. States of ports are cached for ttl seconds.
+    """
+
+    def __init__(
+        self,
+        ports: Sequence[int] = (22, 80, 443),
+        timeout: float = 1.0,
+        ttl: float = 60,
+        max_concurrency: int = 256,
+    ):
+        """
+        Init of checker.
+
+        :param ports: TCP ports probed on each switch when ports are not passed to check
+        :param timeout: Time in seconds to wait for TCP handshake
+        :param ttl: Time in seconds after which cached state is probed again
+        :param max_concurrency: Maximal number of probes in flight
+        """
+        self._ports = tuple(ports)
+        self._timeout = timeout
+        self._ttl = ttl
+        self._max_concurrency = max_concurrency
+        self._states: Dict[Tuple[str, int], ReachabilityState] = {}
+        self._lock = threading.Lock()
+
+    @property
+    def states(self) -> Dict[Tuple[str, int], ReachabilityState]:
+        """Cached states of ports of switches by IP address and port, including expired ones."""
+        with self._lock:
+            return dict(self._states)
+
+    @property
+    def unreachable(self) -> Tuple[str, ...]:
+        """Switches which all ports are marked as closed by not expired state."""
+        now = time.monotonic()
+        reachable: Dict[str, bool] = {}
+        with self._lock:
+            for (ip, _), state in self._states.items():
+                if now - state.timestamp <= self._ttl:
+                    reachable[ip] = reachable.get(ip, False) or state.reachable
+        return tuple(ip for ip, is_reachable in reachable.items() if not is_reachable)
+
+    def _cached(self, ip: str, port: int) -> Optional[ReachabilityState]:
+        with self._lock:
+            state = self._states.get((ip, port))
+        if state is None or time.monotonic() - state.timestamp > self._ttl:
+            return None
+        return state
+
+    def invalidate(self, ip: Optional[str] = None) -> None:
+        """
+        Remove cached state.
+
+        :param ip: IP address of switch, all states are removed if not passed
+        """
+        with self._lock:
+            if ip is None:
+                self._states.clear()
+            else:
+                ip = str(ip_address(ip))
+                for key in [key for key in self._states if key[0] == ip]:
+                    del self._states[key]
+
+    async def _probe_port(self, ip: str, port: int, semaphore: asyncio.Semaphore) -> bool:
+        async with semaphore:
+            try:
+                _, writer = await asyncio.wait_for(asyncio.open_connection(ip, port), timeout=self._timeout)
+            except (OSError, asyncio.TimeoutError):
+                return False
+            writer.close()
+            try:
+                await writer.wait_closed()
+            except OSError:
+                pass
+            return True
+
+    async def check_async(self, ips: Iterable[str], ports: Optional[Sequence[int]] = None) -> Dict[str, bool]:
+        """
+        Probe ports of switches without valid cached state concurrently.
+
+        :param ips: IP addresses of switches
+        :param ports: TCP ports probed on each switch, ports of checker if not passed
+        :return: Reachability of each switch
+        """
+        ports = self._ports if ports is None else tuple(ports)
+        ips = [str(ip_address(ip)) for ip in ips]
+        states = {(ip, port): self._cached(ip, port) for ip in ips for port in ports}
+        to_probe = [key for key, state in states.items() if state is None]
+        if to_probe:
+            semaphore = asyncio.Semaphore(self._max_concurrency)
+            results = await asyncio.gather(*(self._probe_port(ip, port, semaphore) for ip, port in to_probe))
+            timestamp = time.monotonic()
+            probed = {
+                (ip, port): ReachabilityState(reachable=is_open, port=port, timestamp=timestamp)
+                for (ip, port), is_open in zip(to_probe, results)
+            }
+            with self._lock:
+                self._states.update(probed)
+            states.update(probed)
+        reachable = {ip: any(states[(ip, port)].reachable for port in ports) for ip in ips}
+        for ip in dict.fromkeys(ip for ip, _ in to_probe):
+            if not reachable[ip]:
+                logger.log(level=log_levels.MODULE_DEBUG, msg=f"Switch {ip} is not reachable on {ports}")
+        return reachable
+
+    def check(self, ips: Iterable[str], ports: Optional[Sequence[int]] = None) -> Dict[str, bool]:
+        """
+        Probe ports of switches without valid cached state concurrently, blocking variant of check_async().
+
+        :param ips: IP addresses of switches
+        :param ports: TCP ports probed on each switch, ports of checker if not passed
+        :return: Reachability of each switch
+        """
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return asyncio.run(self.check_async(ips, ports))
+        # event loop of current thread cannot be blocked by nested loop, probes are run in separate thread
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            return executor.submit(asyncio.run, self.check_async(ips, ports)).result()
+
+    def is_reachable(self, ip: str, ports: Optional[Sequence[int]] = None) -> bool:
+        """
+        Check if switch is reachable, cached states are used if they are not expired.
+
+        :param ip: IP address of switch
+        :param ports: TCP ports probed on switch, ports of checker if not passed
+        :return: True if any of probed ports accepts connection
+        """
+        return self.check([ip], ports)[str(ip_address(ip))]
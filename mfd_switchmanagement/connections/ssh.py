@@ -2,15 +2,31 @@
 # SPDX-License-Identifier: MIT
 """Module for ssh connection."""
 
+import inspect
+import queue
+import random
+import re
+import threading
+from contextlib import contextmanager
+from dataclasses import dataclass
+from io import BytesIO
+import time
 import typing
-from typing import List, Optional, Union
+from typing import Callable, Dict, Iterator, List, Optional, Tuple, Union
 
-from netmiko import Netmiko, SSHDetect
+from netmiko import Netmiko, NetmikoAuthenticationException, ReadException, ReadTimeout, SSHDetect
 from paramiko import SSHException
+from scp import SCPClient
 import logging
 
 from .base import BaseSwitchConnection
-from ..exceptions import SwitchException, SwitchConnectionException
+from .cli_mode import CliModeTracker
+from .connection_profile import ConnectionProfile, ConnectionProfileCache
+from .device_type_cache import DeviceTypeCache
+from .file_transfer import ConfigFileHandler, get_config_file_handler
+from .latency import CommandLatency, LatencyTracker
+from ..data_structures import CliMode
+from ..exceptions import SwitchCommandException, SwitchException, SwitchConnectionException
 from mfd_common_libs import add_logging_level, log_levels
 
 logger = logging.getLogger(__name__)
@@ -25,15 +41,116 @@ if typing.TYPE_CHECKING:
     from pathlib import Path
 
 
+@dataclass
+class ReconnectStatistics:
+    """Counters of reconnections."""
+
+    count: int = 0
+    failed_attempts: int = 0
+    total_duration: float = 0.0
+    last_duration: float = 0.0
+
+
+@dataclass
+class KeepaliveStatistics:
+    """Counters of keepalive thread."""
+
+    sent: int = 0
+    failed: int = 0
+    skipped: int = 0
+    reconnects: int = 0
+
+
 class SSHSwitchConnection(BaseSwitchConnection):
     """Implementation of SSH Connection."""
 
+    CONFIG_ERROR_REGEX = re.compile(
+        r"(%\s*(Invalid|Incomplete|Ambiguous|Unrecognized|Error)|^\s*Error:|syntax error|unknown command)", re.I
+    )
+    SERVICE_PORT = 22
+    SUPPORTS_BATCH = True
+    _NETMIKO_READ_TIMEOUT = 10
+    _MAX_RECONNECT_BACKOFF = 30
+    _STREAM_QUEUE_SIZE = 64
+    # failures of session preparation caused by device type not matching switch (unknown driver, prompt not found),
+    # connectivity and authentication failures are not among them
+    _DEVICE_TYPE_MISMATCH_ERRORS = (ValueError, ReadException)
+
     def __init__(self, *args, **kwargs):
-        """Init for ssh connection via Netimko."""
+        """
+        Init for ssh connection via Netimko.
+
+        :param device_type_cache: Persistent cache of autodetected device types, used when device_type is not passed
+        :param lazy_connect: Postpone establishing of connection until first command is sent
+        :param liveness_window: Time in seconds after successful I/O in which transport is trusted without checking
+        :param ssh_keepalive: Interval in seconds of SSH keepalive packets sent by transport thread, 0 disables them
+        :param skip_redundant_transitions: Do not send configuration mode and interface context transitions
+                                           already satisfied by tracked CLI mode
+        :param file_transfer_threshold: Minimal number of configuration commands pushed to switch as file copied
+                                        over SCP and merged by vendor command, 0 disables file push
+        :param max_exec_channels: Maximal number of concurrent exec channels opened on SSH transport for read-only
+                                  commands, 0 disables them and commands are sent via Netmiko session
+        :param connection_profile_cache: Persistent cache of prompt, paging and terminal width commands learned
+                                         on first connect, later connects skip prompt discovery and run
+                                         with delay factor 1
+        :param adaptive_read_timeout: Derive read timeout of command from observed latency of its command class
+                                      instead of fixed Netmiko timeout
+        :param reconnect_attempts: Number of attempts of reconnecting dropped connection
+        :param reconnect_backoff: Base delay in seconds between reconnect attempts, doubled with every attempt
+                                  (up to 30 seconds) and randomized by jitter
+        :param keepalive_interval: Idle time in seconds after which background thread sends no-op to switch,
+                                   so session is not dropped by exec-timeout of switch, 0 disables it
+        :param keepalive_command: Command sent as no-op, empty line (prompt check) by default
+        :param fast_config_window: Number of command list lines written at once without waiting for echo of each
+                                   line, echo is checked at window boundaries and output is scanned for errors,
+                                   0 disables it (see fast_config())
+        """
         super().__init__(*args, **kwargs)
         self._use_ssh_key: bool = kwargs.get("use_ssh_key", False)
         self._ssh_key_file: Union[str, "Path"] = kwargs.get("ssh_key_file", "")
-        self._connection = self.connect()
+        self._device_type_cache: Optional[DeviceTypeCache] = kwargs.get("device_type_cache", None)
+        self._lazy_connect: bool = kwargs.get("lazy_connect", False)
+        self._liveness_window: Union[int, float] = kwargs.get("liveness_window", 5)
+        self._ssh_keepalive: int = kwargs.get("ssh_keepalive", 0)
+        self._last_alive: Optional[float] = None
+        self._skip_redundant_transitions: bool = kwargs.get("skip_redundant_transitions", False)
+        self._cli_mode = CliModeTracker()
+        self._file_transfer_threshold: int = kwargs.get("file_transfer_threshold", 0)
+        self._max_exec_channels: int = kwargs.get("max_exec_channels", 0)
+        self._exec_channels = threading.BoundedSemaphore(self._max_exec_channels or 1)
+        self._connection_profile_cache: Optional[ConnectionProfileCache] = kwargs.get(
+            "connection_profile_cache", None
+        )
+        self._adaptive_read_timeout: bool = kwargs.get("adaptive_read_timeout", False)
+        self._latency = LatencyTracker()
+        self._reconnect_attempts: int = kwargs.get("reconnect_attempts", 1)
+        self._reconnect_backoff: Union[int, float] = kwargs.get("reconnect_backoff", 1)
+        self._reconnect_statistics = ReconnectStatistics()
+        self._fast_config_window: int = kwargs.get("fast_config_window", 0)
+        self._connect_lock = threading.Lock()
+        self._keepalive_interval: Union[int, float] = kwargs.get("keepalive_interval", 0)
+        self._keepalive_command: Optional[str] = kwargs.get("keepalive_command", None)
+        self._keepalive_statistics = KeepaliveStatistics()
+        self._keepalive_statistics_lock = threading.Lock()
+        self._keepalive_stop = threading.Event()
+        self._keepalive_thread: Optional[threading.Thread] = None
+        self._keepalive_thread_lock = threading.Lock()
+        if not self._lazy_connect:
+            self._connection = self.connect()
+
+    @property
+    def is_connected(self) -> bool:
+        """Check if Netmiko session was already established."""
+        return self._connection is not None
+
+    def _ensure_connected(self) -> None:
+        """Establish postponed connection, concurrent callers wait for single in-flight connect."""
+        if self._connection is not None:
+            return
+        with self._connect_lock:
+            if self._connection is None:
+                logger.log(level=log_levels.MODULE_DEBUG, msg=f"Establishing postponed connection to {self._ip}")
+                self._connection = self.connect()
 
     def connect(self) -> Netmiko:
         """
@@ -42,7 +159,9 @@ class SSHSwitchConnection(BaseSwitchConnection):
         Setup connection details, guest netmiko switch class and establish connection.
 
         :raises SwitchException on connection failure
+        :raises SwitchConnectionException if switch is marked as unreachable
         """
+        self._check_reachability()
         if not self._secret:
             self._secret = self._password
         switch = {
@@ -55,6 +174,14 @@ class SSHSwitchConnection(BaseSwitchConnection):
             "device_type": self._device_type if self._device_type else "autodetect",
             "auth_timeout": self._auth_timeout,
         }
+        if self._ssh_keepalive:
+            switch["keepalive"] = self._ssh_keepalive
+        cached_device_type = None
+        if switch["device_type"] == "autodetect" and self._device_type_cache is not None:
+            cached_device_type = self._device_type_cache.get(self._ip)
+            if cached_device_type:
+                logger.log(level=log_levels.MODULE_DEBUG, msg=f'Using cached "{cached_device_type}" switch type.')
+                switch["device_type"] = cached_device_type
         # creating probably similar Netmiko class of switch
         try:
             delay = self._global_delay_factor if self._global_delay_factor is not None else self._NETMIKO_INIT_DELAY
@@ -66,28 +193,271 @@ class SSHSwitchConnection(BaseSwitchConnection):
                     raise SwitchException("Detected not supported OS Switch, contact with developers of module")
                 else:
                     logger.log(level=log_levels.MODULE_DEBUG, msg=f'Detected "{best_match}" switch type.')
-            # to properly identify prompt on slower switches we're temporally increasing delay
-            connection = Netmiko(**switch, global_delay_factor=delay)
+                    if self._device_type_cache is not None:
+                        self._device_type_cache.set(self._ip, best_match)
+            try:
+                connection = self._open_session(switch, delay)
+            except self._DEVICE_TYPE_MISMATCH_ERRORS:
+                if cached_device_type:
+                    # cached device type could be outdated, e.g. switch OS was replaced
+                    self._device_type_cache.invalidate(self._ip)
+                    return self.connect()
+                raise
             # if user did not provide delay, let's restore Netmiko default after setup
             if self._global_delay_factor is None:
                 connection.global_delay_factor = 1
             connection.enable()
         except SSHException as e:
             raise SwitchException("Failure on connection") from e
+        self._cli_mode.reset(CliMode.EXEC)
+        self._start_keepalive()
         return connection
 
-    def _reconnect(self) -> None:
+    def _open_session(self, switch: dict, delay: Union[int, float]) -> Netmiko:
+        """
+        Open Netmiko session, with known connection profile session is prepared without prompt discovery.
+
+        :param switch: Netmiko connection parameters with resolved device type
+        :param delay: Delay factor used when connection profile is not known
+        :return: Netmiko connection
+        """
+        if self._connection_profile_cache is None:
+            # to properly identify prompt on slower switches we're temporally increasing delay
+            return Netmiko(**switch, global_delay_factor=delay)
+        profile = self._connection_profile_cache.get(switch["device_type"], self._ip)
+        if profile is not None:
+            try:
+                return self._fast_connect(switch, profile)
+            except NetmikoAuthenticationException:
+                raise
+            except Exception as e:
+                # prompt or commands of switch could change since profile was learned
+                logger.log(level=log_levels.MODULE_DEBUG, msg=f"Connecting with cached profile failed: {e}")
+                self._connection_profile_cache.invalidate(switch["device_type"], self._ip)
+        return self._learn_profile(switch, delay)
+
+    def _fast_connect(self, switch: dict, profile: ConnectionProfile) -> Netmiko:
+        """
+        Open Netmiko session using connection profile.
+
+        Prompt is not discovered, paging and terminal width commands wait for known prompt instead of command echo.
+        Public hooks called by session preparation of device type are replaced on connection object only.
+
+        :param switch: Netmiko connection parameters with resolved device type
+        :param profile: Cached connection profile
+        :return: Netmiko connection
+        """
+        delay = self._global_delay_factor if self._global_delay_factor is not None else 1
+        connection = Netmiko(**switch, global_delay_factor=delay, fast_cli=True, auto_connect=False)
+        connection.base_prompt = profile.base_prompt
+
+        def send_prepared(command: Optional[str]) -> str:
+            if not command:
+                return ""
+            connection.write_channel(connection.normalize_cmd(command))
+            return connection.read_until_prompt()
+
+        connection.set_base_prompt = lambda *args, **kwargs: profile.base_prompt
+        connection.disable_paging = lambda *args, **kwargs: send_prepared(profile.paging_command)
+        connection.set_terminal_width = lambda *args, **kwargs: send_prepared(profile.width_command)
+        try:
+            self._prepare_session(connection)
+        finally:
+            del connection.set_base_prompt, connection.disable_paging, connection.set_terminal_width
+        logger.log(level=log_levels.MODULE_DEBUG, msg=f"Connected to {self._ip} with cached connection profile.")
+        return connection
+
+    def _learn_profile(self, switch: dict, delay: Union[int, float]) -> Netmiko:
+        """
+        Open Netmiko session with full session preparation and store its connection profile.
+
+        Profile is not stored when paging or terminal width command of device type can not be recorded,
+        e.g. its hook does not take command parameter.
+
+        :param switch: Netmiko connection parameters with resolved device type
+        :param delay: Delay factor used during session preparation
+        :return: Netmiko connection
+        """
+        connection = Netmiko(**switch, global_delay_factor=delay, auto_connect=False)
+        commands: Dict[str, Optional[str]] = {}
+
+        def record(name: str) -> Callable[..., str]:
+            method = getattr(connection, name)
+
+            def recorder(*args, **kwargs) -> str:
+                try:
+                    arguments = inspect.signature(method).bind(*args, **kwargs)
+                    arguments.apply_defaults()
+                    commands[name] = arguments.arguments.get("command")
+                except TypeError:
+                    commands[name] = None
+                return method(*args, **kwargs)
+
+            return recorder
+
+        connection.disable_paging = record("disable_paging")
+        connection.set_terminal_width = record("set_terminal_width")
+        try:
+            self._prepare_session(connection)
+        finally:
+            del connection.disable_paging, connection.set_terminal_width
+        # profile is stored only if paging is disabled by session preparation, it could not be replayed otherwise
+        if commands.get("disable_paging") and all(command is not None for command in commands.values()):
+            profile = ConnectionProfile(
+                base_prompt=connection.base_prompt,
+                paging_command=commands["disable_paging"],
+                width_command=commands.get("set_terminal_width") or None,
+            )
+            self._connection_profile_cache.set(switch["device_type"], self._ip, profile)
+        else:
+            logger.log(level=log_levels.MODULE_DEBUG, msg="Connection profile can not be recorded, it is not cached.")
+        return connection
+
+    @staticmethod
+    def _prepare_session(connection: Netmiko) -> None:
+        """
+        Establish transport and run session preparation of device type, connection is closed if preparation fails.
+
+        :param connection: Netmiko connection created without auto_connect
+        """
+        connection.establish_connection()
+        try:
+            # session preparation needs data in channel
+            connection.write_channel(connection.RETURN)
+            connection.session_preparation()
+        except Exception:
+            connection.disconnect()
+            raise
+
+    def _reconnect(self, cli_mode: Optional[CliModeTracker] = None) -> None:
         """
         Reconnect to switch.
 
-        Reconnect and check connection status, if connection can not established return exception.
+        Reconnect with exponential backoff and check connection status, if connection can not established
+        return exception. Configuration mode and context of session are entered again.
 
+        :param cli_mode: CLI mode to restore after reconnection, current tracked mode if not passed
         :raises SwitchConnectionException on reconnection failure
         """
-        self._connection._open()
-        self._connection.enable()
-        if not self._check_connection():
-            raise SwitchConnectionException("Connection cannot be established!")
+        cli_mode = cli_mode.copy() if cli_mode is not None else self._cli_mode.copy()
+        start = time.monotonic()
+        for attempt in range(max(self._reconnect_attempts, 1)):
+            if attempt:
+                delay = min(self._reconnect_backoff * 2 ** (attempt - 1), self._MAX_RECONNECT_BACKOFF)
+                time.sleep(random.uniform(delay / 2, delay))
+            self._cli_mode.reset()
+            try:
+                self._connection._open()
+                self._connection.enable()
+                self._cli_mode.reset(CliMode.EXEC)
+                if self._check_connection():
+                    break
+                error = SwitchConnectionException("Connection cannot be established!")
+            except Exception as e:
+                error = e
+            self._reconnect_statistics.failed_attempts += 1
+            logger.log(level=log_levels.MODULE_DEBUG, msg=f"Reconnect attempt {attempt + 1} failed: {error}")
+        else:
+            raise error
+        self._restore_cli_mode(cli_mode)
+        duration = time.monotonic() - start
+        self._reconnect_statistics.count += 1
+        self._reconnect_statistics.total_duration += duration
+        self._reconnect_statistics.last_duration = duration
+        self._last_alive = time.monotonic()
+        # session reopened after disconnect() is kept alive again
+        self._start_keepalive()
+
+    def _restore_cli_mode(self, cli_mode: CliModeTracker) -> None:
+        """
+        Enter configuration mode and context which session was in before connection dropped.
+
+        :param cli_mode: CLI mode to restore
+        """
+        if cli_mode.mode is not CliMode.CONFIG:
+            return
+        logger.log(level=log_levels.MODULE_DEBUG, msg=f"Restoring configuration context: {cli_mode.context}")
+        self._connection.config_mode()
+        self._cli_mode.reset(CliMode.CONFIG)
+        if cli_mode.context:
+            self._send_tracked_command_list(self._connection, [cli_mode.context])
+
+    @property
+    def reconnect_statistics(self) -> ReconnectStatistics:
+        """Snapshot of reconnection counters."""
+        return ReconnectStatistics(**vars(self._reconnect_statistics))
+
+    def _start_keepalive(self) -> None:
+        """Start keepalive thread for established session, if keepalive is enabled and thread is not running."""
+        if not self._keepalive_interval:
+            return
+        with self._keepalive_thread_lock:
+            thread = self._keepalive_thread
+            # reconnection done by keepalive itself does not restart it, e.g. when disconnect() waits for it
+            if thread is threading.current_thread():
+                return
+            if thread is not None and thread.is_alive():
+                if not self._keepalive_stop.is_set():
+                    return
+                # thread stopped by disconnect() has to finish before new one is started
+                thread.join()
+            self._keepalive_stop.clear()
+            self._keepalive_thread = threading.Thread(
+                target=self._keepalive_loop, name=f"switch-keepalive-{self._ip}", daemon=True
+            )
+            self._keepalive_thread.start()
+
+    def _stop_keepalive(self) -> None:
+        """Stop keepalive thread and wait for it, unless called by keepalive itself."""
+        self._keepalive_stop.set()
+        thread = self._keepalive_thread
+        if thread is not None and thread is not threading.current_thread():
+            thread.join()
+
+    def _count_keepalive(self, **counters: int) -> None:
+        """Add values to keepalive counters."""
+        with self._keepalive_statistics_lock:
+            for name, value in counters.items():
+                setattr(self._keepalive_statistics, name, getattr(self._keepalive_statistics, name) + value)
+
+    def _keepalive_loop(self) -> None:
+        """Send no-op when session was idle for keepalive interval, skip it when command lock is busy."""
+        started = time.monotonic()
+        while True:
+            idle = time.monotonic() - (self._last_alive or started)
+            if self._keepalive_stop.wait(max(self._keepalive_interval - idle, 0.1)):
+                return
+            if self._connection is None or time.monotonic() - (self._last_alive or started) < self._keepalive_interval:
+                continue
+            # real traffic is never delayed nor interleaved by keepalive
+            if not self._command_lock.acquire(blocking=False):
+                self._count_keepalive(skipped=1)
+                continue
+            reconnects = self._reconnect_statistics.count
+            try:
+                if self._keepalive_stop.is_set():
+                    return
+                self._send_keepalive()
+                self._count_keepalive(sent=1)
+            except Exception as e:
+                self._count_keepalive(failed=1)
+                logger.log(level=log_levels.MODULE_DEBUG, msg=f"Keepalive of {self._ip} failed: {e}")
+            finally:
+                self._count_keepalive(reconnects=self._reconnect_statistics.count - reconnects)
+                self._command_lock.release()
+
+    def _send_keepalive(self) -> None:
+        """Send no-op command, dropped session is reconnected."""
+        if self._keepalive_command is None:
+            self._execute(lambda remote: remote.find_prompt())
+        else:
+            self._execute(lambda remote: remote.send_command(self._keepalive_command))
+
+    @property
+    def keepalive_statistics(self) -> KeepaliveStatistics:
+        """Snapshot of keepalive counters, reconnects done by keepalive are counted in reconnect_statistics too."""
+        with self._keepalive_statistics_lock:
+            return KeepaliveStatistics(**vars(self._keepalive_statistics))
 
     def _check_connection(self) -> Optional[bool]:
         """Check connection to switch."""
@@ -99,15 +469,64 @@ class SSHSwitchConnection(BaseSwitchConnection):
             return connection_status
         logger.log(level=log_levels.MODULE_DEBUG, msg="Connection not established.")
 
+    def _is_trusted(self) -> bool:
+        """Check if transport had successful I/O within liveness window."""
+        return self._last_alive is not None and time.monotonic() - self._last_alive < self._liveness_window
+
+    def _is_alive(self) -> bool:
+        """Check transport without raising on already closed connection."""
+        try:
+            return bool(self._check_connection())
+        except AttributeError:
+            return False
+
     @property
     def _remote(self) -> Netmiko:
-        """If connection is dropped reconnect."""
+        """
+        If connection is not established yet connect, if connection is dropped reconnect.
+
+        Transport is not checked within liveness window after successful I/O.
+        """
+        self._ensure_connected()
+        if self._is_trusted():
+            return self._connection
         logging.getLogger("netmiko").setLevel(logging.CRITICAL)
-        if not self._check_connection():
-            self._reconnect()
-        logging.getLogger("netmiko").setLevel(logging.DEBUG)
+        try:
+            if not self._check_connection():
+                self._reconnect()
+        finally:
+            logging.getLogger("netmiko").setLevel(logging.DEBUG)
+        self._last_alive = time.monotonic()
         return self._connection
 
+    def _execute(self, operation: Callable[[Netmiko], str], cost: int = 1) -> str:
+        """
+        Run operation on Netmiko connection.
+
+        When operation fails because connection was dropped, reconnect, restore CLI mode from before operation
+        and retry operation once.
+
+        :param operation: Callable getting Netmiko connection and returning output
+        :param cost: Number of command lines sent by operation, charged to governor
+        :return: Output of operation
+        """
+        with self._governed(cost):
+            remote = self._remote
+            cli_mode = self._cli_mode.copy()
+            try:
+                output = operation(remote)
+            except Exception:
+                # CLI mode after failed operation is not known
+                self._cli_mode.reset()
+                if self._is_alive():
+                    raise
+                logger.log(level=log_levels.MODULE_DEBUG, msg="Connection dropped during command, reconnecting.")
+                # context from before failed operation is restored, so only failed operation is repeated
+                self._reconnect(cli_mode)
+                output = operation(self._connection)
+        self._last_alive = time.monotonic()
+        return output
+
     def send_command(self, command: str) -> str:
         """
         Send command via connection.
@@ -115,8 +534,10 @@ class SSHSwitchConnection(BaseSwitchConnection):
         :param command: command for send
         :return: Output from command
         """
-        logger.log(level=log_levels.CMD, msg=f"Executing '{command}'")
-        output = self._remote.send_command(command)
+        with self._command_lock:
+            self._flush_batch()
+            logger.log(level=log_levels.CMD, msg=f"Executing '{command}'")
+            output = self._execute(lambda remote: self._send_timed(remote, self._track_command(command)))
         logger.log(level=log_levels.OUT, msg=output)
         return output
 
@@ -128,14 +549,335 @@ class SSHSwitchConnection(BaseSwitchConnection):
         :param prompt: expected string
         :return: Output from command
         """
-        logger.log(level=log_levels.CMD, msg=f"Executing '{command}'    expect_string: {prompt}")
-        output = self._remote.send_command(command, expect_string=prompt)
+        with self._command_lock:
+            self._flush_batch()
+            logger.log(level=log_levels.CMD, msg=f"Executing '{command}'    expect_string: {prompt}")
+            output = self._execute(
+                lambda remote: self._send_timed(remote, self._track_command(command), expect_string=prompt)
+            )
         logger.log(level=log_levels.OUT, msg=output)
         return output
 
+    def _send_timed(self, remote: Netmiko, command: str, **kwargs) -> str:
+        """
+        Send command with read timeout derived from latency statistics and record its latency.
+
+        Derived read timeout is never shorter than read timeout requested by caller (Netmiko default if not passed).
+
+        :param remote: Netmiko connection
+        :param command: command for send
+        :param kwargs: Additional parameters of Netmiko send_command
+        :return: Output from command
+        """
+        if self._adaptive_read_timeout:
+            min_timeout = kwargs.get("read_timeout", self._NETMIKO_READ_TIMEOUT)
+            read_timeout = self._latency.read_timeout(command, min_timeout=min_timeout)
+        else:
+            read_timeout = None
+        if read_timeout is not None:
+            kwargs["read_timeout"] = read_timeout
+        start = time.monotonic()
+        try:
+            output = remote.send_command(command, **kwargs)
+        except ReadTimeout:
+            self._latency.record(command, kwargs.get("read_timeout", self._NETMIKO_READ_TIMEOUT), timed_out=True)
+            raise
+        self._latency.record(command, time.monotonic() - start)
+        return output
+
+    @property
+    def latency_statistics(self) -> Dict[str, CommandLatency]:
+        """Observed latency (EWMA, p99, timeouts) of commands sent via Netmiko session, per command class."""
+        return self._latency.statistics
+
+    def send_command_on_channel(self, command: str, timeout: Union[int, float] = 30) -> str:
+        """
+        Send read-only command on separate exec channel of SSH transport.
+
+        Commands from different threads are running concurrently and do not wait for Netmiko session nor command lock,
+        session can be used by configuration at the same time. No new TCP connection nor authentication is needed.
+        If transport is dropped, command is sent via Netmiko session which reconnects.
+
+        :param command: read-only command for send, e.g. show command
+        :param timeout: Time in seconds to wait for output of command
+        :return: Output from command
+        """
+        if not self._max_exec_channels:
+            return self.send_command(command)
+        self._ensure_connected()
+        transport = self._connection.remote_conn.transport
+        if not transport.is_alive():
+            return self.send_command(command)
+        logger.log(level=log_levels.CMD, msg=f"Executing on exec channel '{command}'")
+        with self._exec_channels, self._governed():
+            channel = transport.open_session(timeout=timeout)
+            try:
+                channel.settimeout(timeout)
+                channel.exec_command(command)
+                chunks = []
+                while True:
+                    chunk = channel.recv(65535)
+                    if not chunk:
+                        break
+                    chunks.append(chunk)
+            finally:
+                channel.close()
+        output = b"".join(chunks).decode(errors="replace").replace("\r\n", "\n").strip("\n")
+        logger.log(level=log_levels.OUT, msg=output)
+        return output
+
+    def send_commands_pipelined(self, commands: List[str], read_timeout: Union[int, float] = 30) -> List[str]:
+        """
+        Send show commands at once and split combined output by prompt boundaries.
+
+        Commands are written to channel without waiting for prompt, so they cost single round trip.
+        Commands must not change prompt (e.g. entering configuration mode) or ask for confirmation.
+
+        :param commands: commands for send
+        :param read_timeout: Time in seconds to wait for output of all commands
+        :return: Output of each command, in order of commands
+        """
+        with self._command_lock:
+            self._flush_batch()
+            logger.log(level=log_levels.CMD, msg=f"Executing pipelined: '{commands}'")
+            outputs = self._execute(
+                lambda remote: self._send_pipelined(remote, commands, read_timeout), cost=len(commands)
+            )
+        for output in outputs:
+            logger.log(level=log_levels.OUT, msg=output)
+        return outputs
+
+    def _send_pipelined(self, remote: Netmiko, commands: List[str], read_timeout: Union[int, float]) -> List[str]:
+        """
+        Write all commands and read until prompt is shown after each of them.
+
+        :param remote: Netmiko connection
+        :param commands: commands for send
+        :param read_timeout: Time in seconds to wait for output of all commands
+        :return: Output of each command
+        """
+        for command in commands:
+            self._cli_mode.update(command)
+        prompt = self._prompt_regex(remote)
+        remote.write_channel("".join(remote.normalize_cmd(command) for command in commands))
+        output = ""
+        deadline = time.monotonic() + read_timeout
+        while len(prompt.findall(output)) < len(commands):
+            remaining = max(deadline - time.monotonic(), 0.1)
+            output += remote.read_until_pattern(pattern=prompt.pattern, read_timeout=remaining, re_flags=re.M)
+        output = remote.strip_ansi_escape_codes(remote.normalize_linefeeds(output))
+        outputs = []
+        for command, part in zip(commands, prompt.split(output)[:: prompt.groups + 1]):
+            lines = part.lstrip(" ").split("\n")
+            if lines and command.strip() in lines[0]:
+                lines = lines[1:]
+            outputs.append("\n".join(lines).strip("\n"))
+        return outputs
+
+    @staticmethod
+    def _prompt_regex(remote: Netmiko) -> "re.Pattern":
+        """Build regex matching prompt of session in any CLI mode, e.g. 'switch#' and 'switch(config-if)#'."""
+        return re.compile(rf"^{re.escape(remote.base_prompt)}(\([^)\n]*\))?[#>$]", re.M)
+
+    def send_command_stream(
+        self, command: str, read_timeout: Union[int, float] = 30, lines: bool = True
+    ) -> Iterator[str]:
+        """
+        Send command and yield its output as it arrives from channel.
+
+        Output is read by reader thread into bounded queue, so long outputs (e.g. show running-config) can be parsed
+        with bounded memory. Reader thread holds command lock (and slot of governor) while command is executed,
+        lines are yielded outside of lock, so stream can be consumed in any thread. When queue is full, reader
+        waits for consumer, so commands of other threads wait until stream is exhausted or closed.
+        If calling thread already holds command lock (e.g. inside Switch.batch()), output is read by calling thread
+        instead, reader thread would wait for the lock forever.
+        Output not read when stream is closed early is drained, so it is not returned by next command.
+
+        Usage:
+        >>>for line in connection.send_command_stream("show mac address-table"):
+        >>>    parse(line)
+
+        :param command: command for send
+        :param read_timeout: Time in seconds to wait for next data from channel
+        :param lines: Yield single lines if True, chunks of complete lines ended with newline otherwise
+        :return: Generator of output lines or chunks, without command echo and prompt
+        :raises ReadTimeout: if no data is received within read_timeout and prompt was not found
+        """
+        if self._command_lock.is_owned():
+            output = self._send_streamed(command, read_timeout)
+            try:
+                for received_lines in output:
+                    if lines:
+                        yield from received_lines
+                    else:
+                        yield "".join(f"{line}\n" for line in received_lines)
+            finally:
+                try:
+                    for _ in output:
+                        pass
+                except Exception as e:
+                    logger.log(
+                        level=log_levels.MODULE_DEBUG, msg=f"Draining of closed stream of '{command}' failed: {e}"
+                    )
+            return
+        chunks: "queue.Queue[Union[List[str], BaseException, None]]" = queue.Queue(maxsize=self._STREAM_QUEUE_SIZE)
+        closed = threading.Event()
+        reader = threading.Thread(
+            target=self._stream_reader, args=(command, read_timeout, chunks, closed), name="stream-reader", daemon=True
+        )
+        reader.start()
+        try:
+            while True:
+                received_lines = chunks.get()
+                if received_lines is None:
+                    return
+                if isinstance(received_lines, BaseException):
+                    raise received_lines
+                if lines:
+                    yield from received_lines
+                else:
+                    yield "".join(f"{line}\n" for line in received_lines)
+        finally:
+            closed.set()
+            reader.join()
+
+    def _stream_reader(
+        self,
+        command: str,
+        read_timeout: Union[int, float],
+        chunks: "queue.Queue[Union[List[str], BaseException, None]]",
+        closed: threading.Event,
+    ) -> None:
+        """
+        Send command and put its output into queue, run by reader thread.
+
+        After stream is closed, remaining output is drained without putting it into queue.
+
+        :param command: command for send
+        :param read_timeout: Time in seconds to wait for next data from channel
+        :param chunks: Queue for lines received by single channel read, exception of reading and None as end of output
+        :param closed: Event set when stream is closed by consumer
+        """
+
+        def put(item: Union[List[str], BaseException, None]) -> None:
+            while not closed.is_set():
+                try:
+                    chunks.put(item, timeout=0.1)
+                    return
+                except queue.Full:
+                    continue
+
+        try:
+            for received_lines in self._send_streamed(command, read_timeout):
+                put(received_lines)
+        except Exception as e:
+            if closed.is_set():
+                logger.log(level=log_levels.MODULE_DEBUG, msg=f"Draining of closed stream of '{command}' failed: {e}")
+            else:
+                put(e)
+        finally:
+            put(None)
+
+    def _send_streamed(self, command: str, read_timeout: Union[int, float]) -> Iterator[List[str]]:
+        """
+        Send command and read its output, under command lock and slot of governor.
+
+        :param command: command for send
+        :param read_timeout: Time in seconds to wait for next data from channel
+        :return: Generator of complete lines received by single channel read
+        """
+        with self._command_lock, self._governed():
+            self._flush_batch()
+            logger.log(level=log_levels.CMD, msg=f"Executing streamed '{command}'")
+            remote = self._remote
+            remote.write_channel(remote.normalize_cmd(self._track_command(command)))
+            yield from self._read_stream(remote, command, read_timeout)
+            self._last_alive = time.monotonic()
+
+    def _read_stream(self, remote: Netmiko, command: str, read_timeout: Union[int, float]) -> Iterator[List[str]]:
+        """
+        Read channel until prompt is found at tail of output.
+
+        :param remote: Netmiko connection
+        :param command: sent command, its echo is skipped
+        :param read_timeout: Time in seconds to wait for next data from channel
+        :return: Generator of complete lines received by single channel read
+        :raises ReadTimeout: if no data is received within read_timeout and prompt was not found
+        """
+        prompt = self._prompt_regex(remote)
+        pending = ""
+        echo = True
+        deadline = time.monotonic() + read_timeout
+        while True:
+            data = remote.read_channel()
+            if not data:
+                if time.monotonic() > deadline:
+                    raise ReadTimeout(f"Prompt not found in output of '{command}' within {read_timeout} seconds")
+                time.sleep(0.01)
+                continue
+            deadline = time.monotonic() + read_timeout
+            *received, pending = (pending + data).split("\n")
+            received = [remote.strip_ansi_escape_codes(line).replace("\r", "") for line in received]
+            if echo and received:
+                echo = False
+                if command.strip() in received[0]:
+                    received = received[1:]
+            if received:
+                yield received
+            if prompt.match(remote.strip_ansi_escape_codes(pending).replace("\r", "").strip()):
+                return
+
     def exit_port_configuration(self) -> None:
         """Exit config mode."""
-        self._remote.exit_config_mode()
+        with self._command_lock:
+            self._flush_batch()
+            self._remote.exit_config_mode()
+            self._cli_mode.reset(CliMode.EXEC)
+
+    @property
+    def cli_mode(self) -> CliModeTracker:
+        """Tracked CLI mode and configuration context of session."""
+        return self._cli_mode
+
+    def _track_command(self, command: str) -> str:
+        """
+        Update tracked CLI mode with command.
+
+        :param command: command to send
+        :return: the same command
+        """
+        self._cli_mode.update(command)
+        return command
+
+    def _track_command_list(self, commands: List[str]) -> List[Optional[str]]:
+        """
+        Update tracked CLI mode with commands, transitions already satisfied are dropped if enabled.
+
+        :param commands: commands to send
+        :return: Commands aligned with passed ones, None in place of dropped command
+        """
+        skip = self._skip_redundant_transitions
+        return [
+            None if skip and self._cli_mode.is_redundant(command) else self._track_command(command)
+            for command in commands
+        ]
+
+    def _send_tracked_command_list(self, remote: Netmiko, commands: List[str]) -> Tuple[str, List[Optional[str]]]:
+        """
+        Send commands in current mode, transitions already satisfied are dropped if enabled.
+
+        :param remote: Netmiko connection
+        :param commands: commands for send
+        :return: Output from commands and sent commands aligned with passed ones, None in place of dropped command
+        """
+        sent = self._track_command_list(commands)
+        if not any(command is not None for command in sent):
+            logger.log(level=log_levels.MODULE_DEBUG, msg="All commands are already satisfied, nothing to send.")
+            return "", sent
+        output = remote.send_config_set(
+            [command for command in sent if command is not None], exit_config_mode=False, enter_config_mode=False
+        )
+        return output, sent
 
     def send_command_list(self, commands: str) -> str:
         """
@@ -144,10 +886,7 @@ class SSHSwitchConnection(BaseSwitchConnection):
         :param commands: commands for send
         :return: Output from commands
         """
-        logger.log(level=log_levels.CMD, msg=f"Executing command list: '{commands}'")
-        output = self._remote.send_config_set(commands, exit_config_mode=False, enter_config_mode=False)
-        logger.log(level=log_levels.OUT, msg=output)
-        return output
+        return self._send_command_lines(commands, configuration=False)
 
     def send_configuration(self, commands: List[str]) -> str:
         """
@@ -158,11 +897,221 @@ class SSHSwitchConnection(BaseSwitchConnection):
         :param commands: commands for send
         :return: Output from commands
         """
-        logger.log(level=log_levels.CMD, msg=f"Executing configuration: '{commands}'")
-        output = self._remote.send_config_set(commands, exit_config_mode=True, enter_config_mode=True)
+        return self._send_command_lines(commands, configuration=True)
+
+    def _send_command_lines(self, commands: List[str], configuration: bool, check: bool = False) -> str:
+        """
+        Send commands list, output is checked for errors if commands were sent in windows or as file, or if requested.
+
+        :param commands: commands for send
+        :param configuration: True if configuration mode has to be entered before and exited after commands
+        :param check: Check output for errors reported by switch regardless of way of sending
+        :return: Output from commands
+        :raises SwitchCommandException: if output is checked and contains error reported by switch
+        """
+        with self._command_lock:
+            if self._queue(commands, configuration=configuration):
+                return ""
+            kind = "configuration" if configuration else "command list"
+            logger.log(level=log_levels.CMD, msg=f"Executing {kind}: '{commands}'")
+            output, sent, checked = self._execute(
+                lambda remote: self._send_commands(remote, commands, configuration), cost=len(commands)
+            )
+            if configuration:
+                self._cli_mode.reset(CliMode.EXEC)
         logger.log(level=log_levels.OUT, msg=output)
+        # command errors are raised outside of _execute, so commands are never repeated because of them
+        if check or checked:
+            self._raise_config_error(commands, sent, output)
         return output
 
+    def _send_commands(
+        self, remote: Netmiko, commands: List[str], configuration: bool
+    ) -> Tuple[str, List[Optional[str]], bool]:
+        """
+        Send commands as configuration file if they are exceeding threshold, line by line otherwise.
+
+        :param remote: Netmiko connection
+        :param commands: commands for send
+        :param configuration: True if configuration mode has to be entered before and exited after commands
+        :return: Output from commands, commands echoed in output aligned with passed ones (None in place of command
+                 not sent line by line) and True if output has to be checked for errors
+        """
+        if self._file_transfer_threshold and len(commands) >= self._file_transfer_threshold:
+            output = self._push_config_file(remote, commands, configuration)
+            if output is not None:
+                return output, [None] * len(commands), True
+        if self._fast_config_window:
+            return *self._send_windowed(remote, commands, configuration), True
+        if configuration:
+            return remote.send_config_set(commands, exit_config_mode=True, enter_config_mode=True), commands, False
+        return *self._send_tracked_command_list(remote, commands), False
+
+    @contextmanager
+    def fast_config(self, window: int = 20) -> Iterator[None]:
+        """
+        Send command lists in windows within context, for trusted command lists (e.g. generated VLAN ranges).
+
+        Lines of window are written at once, echo is checked only for last line of window and output is scanned
+        for error markers of switch. Commands must not ask for confirmation.
+        Command lock is held within context.
+
+        Usage:
+        >>>with switch._connection.fast_config():
+        >>>    switch.default_ports("ethernet 1/1-48")
+
+        :param window: Number of lines written at once
+        """
+        with self._command_lock:
+            previous, self._fast_config_window = self._fast_config_window, window
+            try:
+                yield
+            finally:
+                self._fast_config_window = previous
+
+    def _send_windowed(
+        self, remote: Netmiko, commands: List[str], configuration: bool
+    ) -> Tuple[str, List[Optional[str]]]:
+        """
+        Write commands in windows, wait for prompt of each line and echo of last line of window only.
+
+        Output is not checked for errors reported by switch here, caller checks it outside of retry of operation.
+
+        :param remote: Netmiko connection
+        :param commands: commands for send
+        :param configuration: True if configuration mode has to be entered before and exited after commands
+        :return: Output from commands and sent commands aligned with passed ones, None in place of skipped transition
+        :raises SwitchConnectionException: if echo of last line of window is not found in output
+        """
+        sent = list(commands) if configuration else self._track_command_list(commands)
+        commands = [command for command in sent if command is not None]
+        if not commands:
+            return "", sent
+        output = remote.config_mode() if configuration else ""
+        prompt = self._prompt_regex(remote)
+        for start in range(0, len(commands), self._fast_config_window):
+            window = commands[start : start + self._fast_config_window]
+            remote.write_channel("".join(remote.normalize_cmd(command) for command in window))
+            window_output = ""
+            deadline = time.monotonic() + self._NETMIKO_READ_TIMEOUT * len(window)
+            while len(prompt.findall(window_output)) < len(window):
+                remaining = max(deadline - time.monotonic(), 0.1)
+                window_output += remote.read_until_pattern(
+                    pattern=prompt.pattern, read_timeout=remaining, re_flags=re.M
+                )
+            window_output = remote.strip_ansi_escape_codes(remote.normalize_linefeeds(window_output))
+            if window[-1].strip() not in window_output:
+                raise SwitchConnectionException(f"Echo of '{window[-1]}' not found in output, switch lost input")
+            output += window_output
+        if configuration:
+            output += remote.exit_config_mode()
+        return output, sent
+
+    def _push_config_file(self, remote: Netmiko, commands: List[str], configuration: bool) -> Optional[str]:
+        """
+        Copy commands to switch as file over existing SSH transport and merge it with vendor command.
+
+        Copied file is removed from switch after it is applied.
+
+        :param remote: Netmiko connection
+        :param commands: commands for send
+        :param configuration: True if configuration mode has to be entered before and exited after commands
+        :return: Output from applying file, None if commands have to be sent line by line
+        """
+        handler = get_config_file_handler(getattr(remote, "device_type", None))
+        plan = handler.build(commands, configuration, self._cli_mode.mode) if handler else None
+        if plan is None:
+            return None
+        try:
+            with SCPClient(remote.remote_conn.transport) as scp_client:
+                scp_client.putfo(BytesIO(plan.content.encode()), handler.remote_path)
+        except Exception as e:
+            logger.log(level=log_levels.MODULE_DEBUG, msg=f"File transfer failed, sending line by line: {e}")
+            return None
+        logger.log(level=log_levels.MODULE_DEBUG, msg=f"Copied {len(plan.lines)} commands to {handler.remote_path}")
+        try:
+            return self._send_tracked_command_list(remote, plan.apply_commands)[0]
+        finally:
+            self._delete_config_file(remote, handler)
+
+    def _delete_config_file(self, remote: Netmiko, handler: ConfigFileHandler) -> None:
+        """
+        Remove copied configuration file from switch on separate exec channel, CLI mode of session is not changed.
+
+        File left on switch does not fail operation, it is overwritten by next push.
+
+        :param remote: Netmiko connection
+        :param handler: Handler of configuration file push
+        """
+        try:
+            channel = remote.remote_conn.transport.open_session(timeout=self._NETMIKO_READ_TIMEOUT)
+            try:
+                channel.settimeout(self._NETMIKO_READ_TIMEOUT)
+                channel.exec_command(handler.delete_command)
+                while channel.recv(65535):
+                    pass
+            finally:
+                channel.close()
+        except Exception as e:
+            logger.log(level=log_levels.MODULE_DEBUG, msg=f"Removing of {handler.remote_path} failed: {e}")
+
+    def _send_batch(self, commands: List[str], configuration: bool = False) -> None:
+        """
+        Send batched commands in one push and check output for errors.
+
+        :param commands: commands for send
+        :param configuration: True if commands have to be sent in configuration mode
+        :raises SwitchCommandException: if output contains error reported by switch
+        """
+        self._send_command_lines(commands, configuration=configuration, check=True)
+
+    def _raise_config_error(self, commands: List[str], sent: List[Optional[str]], output: str) -> None:
+        """
+        Raise first error reported by switch in output of command list.
+
+        Index of rejected command is index in passed commands, None if command is not known (e.g. pushed as file).
+
+        :param commands: commands passed by caller, nothing is checked if empty
+        :param sent: commands echoed in output aligned with passed ones, None in place of command not sent line by line
+        :param output: output of commands
+        :raises SwitchCommandException: if output contains error reported by switch
+        """
+        if not commands:
+            return
+        error = self._find_config_error(sent, output)
+        if error is not None:
+            index, message = error
+            if index is None:
+                raise SwitchCommandException(message, command_index=None)
+            raise SwitchCommandException(f"{message}: {commands[index]}", command_index=index)
+
+    def _find_config_error(
+        self, sent: List[Optional[str]], output: str
+    ) -> Optional[typing.Tuple[Optional[int], str]]:
+        """
+        Find first error in output of command list.
+
+        :param sent: commands echoed in output, None in place of command not sent line by line
+        :param output: output of commands
+        :return: Index of command which output contains error (None if no command is echoed) and error line,
+                 None if there is no error
+        """
+        positions = [index for index, command in enumerate(sent) if command is not None]
+        echoed = 0
+        for line in output.splitlines():
+            following = sent[positions[echoed]].strip() if echoed < len(positions) else ""
+            if following and following in line:
+                echoed += 1
+            elif self.CONFIG_ERROR_REGEX.search(line):
+                return (positions[max(echoed - 1, 0)] if positions else None), line.strip()
+        return None
+
     def disconnect(self) -> None:
-        """Close connection with switch."""
-        self._remote.disconnect()
+        """Close connection with switch, dead session is not reconnected and keepalive is not restarted."""
+        self._stop_keepalive()
+        if self._connection is None:
+            return
+        with self._command_lock:
+            # command which held the lock could reconnect session and restart keepalive meanwhile
+            self._stop_keepalive()
+            self._connection.disconnect()
@@ -0,0 +1,190 @@
+# Copyright (C) 2025 Intel Corporation
+# SPDX-License-Identifier: MIT
+"""Module for asyncio Cisco API connection."""
+
+import asyncio
+import base64
+import logging
+import ssl
+from typing import Dict, List, Optional, Tuple
+
+from mfd_common_libs import add_logging_level, log_levels
+
+from .cisco_api import CiscoAPIConnection, json_loads
+from ..async_base import AsyncBaseSwitchConnection
+from ...exceptions import SwitchConnectionException
+
+logger = logging.getLogger(__name__)
+add_logging_level("MODULE_DEBUG", log_levels.MODULE_DEBUG)
+add_logging_level("CMD", log_levels.CMD)
+
+
+class AsyncCiscoAPIConnection(AsyncBaseSwitchConnection):
+    """
+    Implementation of asyncio Cisco API (NX-API JSON-RPC).
+
+    Requests are sent over single persistent HTTP/1.1 connection per switch, opened with asyncio streams.
+    Payloads and responses are the same as of CiscoAPIConnection.
+    """
+
+    SYNC_CONNECTION_TYPE = CiscoAPIConnection
+
+    def __init__(self, *args, **kwargs) -> None:
+        """
+        Init for asyncio Cisco API connection.
+
+        :param port: HTTP port of NX-API, 80 by default or 443 with ssl_cert
+        :param ssl_cert: Path to client certificate, HTTPS is used when passed with ssl_key
+        :param ssl_key: Path to client key
+        :param verify: Verify certificate of switch
+        :param read_timeout: Time in seconds to wait for response
+        """
+        super().__init__(*args, **kwargs)
+        self._ssl_cert: Optional[str] = kwargs.get("ssl_cert", None)
+        self._ssl_key: Optional[str] = kwargs.get("ssl_key", None)
+        self._verify: bool = kwargs.get("verify", False)
+        self._use_ssl = bool(self._ssl_cert and self._ssl_key)
+        self._port: int = kwargs.get("port", 443 if self._use_ssl else 80)
+        self._read_timeout: float = kwargs.get("read_timeout", 30)
+        self._http_header = {"content-type": "application/json-rpc"}
+        self._reader: Optional[asyncio.StreamReader] = None
+        self._io_lock = asyncio.Lock()
+
+    def _ssl_context(self) -> Optional[ssl.SSLContext]:
+        """Build SSL context if HTTPS is used."""
+        if not self._use_ssl:
+            return None
+        context = ssl.create_default_context()
+        if not self._verify:
+            context.check_hostname = False
+            context.verify_mode = ssl.CERT_NONE
+        context.load_cert_chain(self._ssl_cert, self._ssl_key)
+        return context
+
+    async def connect(self) -> None:
+        """
+        Open HTTP connection and send test command.
+
+        :raises SwitchConnectionException: if switch does not respond correctly
+        """
+        try:
+            await self.send_command("show version")
+        except Exception as e:
+            logger.log(level=log_levels.MODULE_DEBUG, msg="Problem with sending test command to switch")
+            raise SwitchConnectionException("Problem with sending test command to switch") from e
+
+    async def _open(self) -> None:
+        """Open HTTP connection."""
+        self._reader, self._connection = await asyncio.wait_for(
+            asyncio.open_connection(str(self._ip), self._port, ssl=self._ssl_context()), timeout=self._auth_timeout
+        )
+
+    async def _close(self) -> None:
+        """Close HTTP connection."""
+        if self._connection is None:
+            return
+        self._connection.close()
+        try:
+            await self._connection.wait_closed()
+        except (OSError, ssl.SSLError):
+            pass
+        self._connection = None
+        self._reader = None
+
+    async def _post(self, payload: str) -> Tuple[int, bytes]:
+        """
+        Send POST request to NX-API, connection closed by switch is opened again once.
+
+        :param payload: JSON-RPC payload
+        :return: HTTP status code and body of response
+        """
+        credentials = base64.b64encode(f"{self._username}:{self._password}".encode()).decode()
+        body = payload.encode()
+        headers = {
+            "Host": str(self._ip),
+            "Content-Type": self._http_header["content-type"],
+            "Authorization": f"Basic {credentials}",
+            "Content-Length": str(len(body)),
+            "Connection": "keep-alive",
+        }
+        request = "POST /ins HTTP/1.1\r\n" + "".join(f"{name}: {value}\r\n" for name, value in headers.items())
+        for attempt in range(2):
+            reused = self._connection is not None
+            if not reused:
+                await self._open()
+            try:
+                self._connection.write(request.encode() + b"\r\n" + body)
+                await self._connection.drain()
+                return await asyncio.wait_for(self._read_response(), timeout=self._read_timeout)
+            except (OSError, asyncio.IncompleteReadError, ssl.SSLError) as e:
+                await self._close()
+                # keep-alive connection could be closed by switch while idle
+                if not reused or attempt:
+                    raise SwitchConnectionException("Found problem with switch communication") from e
+
+    async def _read_response(self) -> Tuple[int, bytes]:
+        """Read HTTP response, body is delimited by content length, chunked encoding or connection close."""
+        status_line = await self._reader.readuntil(b"\r\n")
+        status = int(status_line.split()[1])
+        headers: Dict[str, str] = {}
+        while True:
+            line = await self._reader.readuntil(b"\r\n")
+            if line == b"\r\n":
+                break
+            name, _, value = line.decode("latin-1").partition(":")
+            headers[name.strip().lower()] = value.strip()
+        if headers.get("transfer-encoding", "").lower() == "chunked":
+            chunks = []
+            while True:
+                size = int((await self._reader.readuntil(b"\r\n")).split(b";")[0], 16)
+                chunk = await self._reader.readexactly(size + 2)
+                if not size:
+                    break
+                chunks.append(chunk[:-2])
+            body = b"".join(chunks)
+        elif "content-length" in headers:
+            body = await self._reader.readexactly(int(headers["content-length"]))
+        else:
+            body = await self._reader.read()
+            headers["connection"] = "close"
+        if headers.get("connection", "").lower() == "close":
+            await self._close()
+        return status, body
+
+    async def send_command(self, command: str) -> list:
+        """
+        Send command via connection.
+
+        :param command: command for send
+        :return: Output from command
+        """
+        return await self.send_command_list([command])
+
+    async def send_command_expect(self, command: str, prompt: str) -> str:
+        """
+        Passthrough for sending command via connection.
+
+        :param command: command for send
+        :param prompt: expected string
+        :return: Output from command
+        """
+        raise NotImplementedError("Send command expect for API is not implemented")
+
+    async def send_command_list(self, command_list: List[str]) -> list:
+        """
+        Send commands to targeted client switch, collect responses, log errors and commands results.
+
+        :param command_list: Cisco_NX OS commands to be executed in order on switch
+        :raises SwitchConnectionException: If response is incorrect
+        :return: JSON encoded responses
+        """
+        logger.log(level=log_levels.CMD, msg=f">{self._ip}> {command_list}")
+        async with self._io_lock:
+            status, body = await self._post(CiscoAPIConnection._generate_payload(command_list))
+        if status != 200:
+            raise SwitchConnectionException(f"Switch responded {status} status code")
+        return CiscoAPIConnection._parse_response(command_list, json_loads(body))
+
+    async def disconnect(self) -> None:
+        """Close connection with switch."""
+        await self._close()
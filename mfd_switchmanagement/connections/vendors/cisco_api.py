@@ -4,12 +4,16 @@
 
 import json
 import logging
-from typing import List
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Any, BinaryIO, Iterator, List, Union
 
 import requests
+from requests.adapters import HTTPAdapter
 
 from ...connections.api import APISwitchConnection
-from ...exceptions import SwitchConnectionException
+from ...exceptions import SwitchCommandException, SwitchConnectionException, SwitchException
 from mfd_common_libs import add_logging_level, log_levels
 
 logger = logging.getLogger(__name__)
@@ -17,15 +21,57 @@ add_logging_level("MODULE_DEBUG", log_levels.MODULE_DEBUG)
 add_logging_level("CMD", log_levels.CMD)
 add_logging_level("OUT", log_levels.OUT)
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def json_loads(content: Union[bytes, str]) -> Any:
+    """
+    Decode JSON document, by orjson if it is installed (extra 'fast-json').
+
+    :param content: JSON document
+    :return: Decoded document
+    """
+    if orjson is not None:
+        return orjson.loads(content)
+    return json.loads(content)
+
+
+@dataclass
+class HTTPStatistics:
+    """Counters of HTTP connections of API session."""
+
+    requests: int = 0
+    connections: int = 0
+
+    @property
+    def reused(self) -> int:
+        """Number of requests sent over already opened connection."""
+        return max(self.requests - self.connections, 0)
+
 
 class CiscoAPIConnection(APISwitchConnection):
     """Implementation of Cisco API."""
 
+    # requests are sent to http://<ip>/ins
+    SERVICE_PORT = 80
+    SUPPORTS_BATCH = True
+
     def __init__(self, *args, **kwargs) -> None:
         """
         Init for Cisco API Connection.
 
-        Set variables
+        Requests are sent by session owned by connection, TCP (and TLS) connections, authentication and NX-API
+        cookie are reused between requests.
+
+        :param http_pool_size: Maximal number of kept-alive HTTP connections to switch
+        :param max_request_commands: Maximal number of commands merged into single NX-API request
+        :param max_request_size: Maximal size in bytes of payload of merged NX-API request
+        :param stream_responses: Decode tables of large responses incrementally while they are received,
+                                 requires ijson (extra 'fast-json')
+        :raises SwitchException: if stream_responses is set and ijson is not installed
         """
         super().__init__(*args, **kwargs)
         self._http_header = {"content-type": "application/json-rpc"}
@@ -33,6 +79,27 @@ class CiscoAPIConnection(APISwitchConnection):
         self._verify = kwargs.get("verify", False)
         self._ssl_cert = kwargs.get("ssl_cert", None)
         self._ssl_key = kwargs.get("ssl_key", None)
+        self._http_pool_size: int = kwargs.get("http_pool_size", 4)
+        self._max_request_commands: int = kwargs.get("max_request_commands", 50)
+        self._max_request_size: int = kwargs.get("max_request_size", 64 * 1024)
+        self._stream_responses: bool = kwargs.get("stream_responses", False)
+        if self._stream_responses:
+            try:
+                import ijson  # noqa:F401
+            except ImportError as e:
+                raise SwitchException(
+                    "ijson is required by stream_responses, install mfd-switchmanagement[fast-json]"
+                ) from e
+        self._adapter = HTTPAdapter(pool_connections=1, pool_maxsize=self._http_pool_size)
+        self._session = requests.Session()
+        self._session.mount("http://", self._adapter)
+        self._session.mount("https://", self._adapter)
+        self._session.headers.update(self._http_header)
+        self._session.auth = (self._username, self._password)
+        self._session.verify = self._verify
+        if self._ssl_cert and self._ssl_key:
+            self._session.cert = (self._ssl_cert, self._ssl_key)
+        self._check_reachability()
         try:
             self.send_command("show version")
         except Exception as e:
@@ -40,16 +107,17 @@ class CiscoAPIConnection(APISwitchConnection):
             raise SwitchConnectionException("Problem with sending test command to switch") from e
 
     @staticmethod
-    def _generate_payload(command_list: List[str]) -> str:
+    def _generate_payload(command_list: List[str], first_id: int = 1) -> str:
         """
         Generate JSON string from Cisco_NX OS command input.
 
         :param command_list: comma separated Cisco_NX OS commands to be executed in order on switch
+        :param first_id: JSON-RPC id of first command, following commands get consecutive ids
         :return: serialized object as JSON formatted string
         """
         req_list = []
 
-        for nbr, command in enumerate(command_list, start=1):
+        for nbr, command in enumerate(command_list, start=first_id):
             req_list.append(
                 {
                     "jsonrpc": "2.0",
@@ -67,42 +135,224 @@ class CiscoAPIConnection(APISwitchConnection):
         :param command: command for send
         :return: Output from command
         """
+        self._flush_batch()
         return self.send_command_list([command])
 
+    def _send_batch(self, commands: List[str], configuration: bool = False) -> None:
+        """
+        Send batched commands in one NX-API request.
+
+        :param commands: commands for send
+        :param configuration: not used, NX-API does not require configuration mode
+        :raises SwitchCommandException: if switch rejected command
+        """
+        self.send_command_list(commands)
+
     def send_command_list(self, command_list: List[str]) -> list:
         """
         Send commands to targeted client switch, collect responses, log errors and commands results.
 
         :param command_list: Cisco_NX OS commands to be executed in order on switch
         :raises SwitchConnectionException: If response is incorrect
-        :return: JSON encoded responses
+        :return: JSON encoded responses, empty list when commands were queued by batch
         """
+        if self._queue(command_list):
+            return []
         logger.log(level=log_levels.CMD, msg=f">{self._ip}> {command_list}")
 
-        http_payload = self._generate_payload(command_list)
+        return self._parse_response(
+            command_list, self._post(self._generate_payload(command_list), cost=len(command_list))
+        )
+
+    def _post(self, http_payload: str, cost: int = 1) -> Union[list, dict]:
+        """
+        Send JSON-RPC request.
+
+        :param http_payload: JSON-RPC payload
+        :param cost: Number of commands in payload, charged to governor
+        :raises SwitchConnectionException: If response is incorrect
+        :return: Decoded JSON-RPC response
+        """
         try:
-            resp = requests.post(
-                self._url,
-                data=http_payload,
-                headers=self._http_header,
-                auth=(self._username, self._password),
-                verify=self._verify,
-                cert=(self._ssl_cert, self._ssl_key) if self._ssl_cert and self._ssl_key else None,
-            )
+            with self._governed(cost):
+                resp = self._session.post(self._url, data=http_payload)
         except (requests.ConnectionError, requests.Timeout, requests.HTTPError) as request_exception:
             raise SwitchConnectionException("Found problem with switch communication") from request_exception
 
         if resp.status_code != 200:
             raise SwitchConnectionException(f"Switch responded {resp.status_code} status code")
-        raw_json_response = resp.json()
+        if orjson is not None:
+            return json_loads(resp.content)
+        return resp.json()
+
+    @contextmanager
+    def stream_command(self, command: str) -> Iterator[BinaryIO]:
+        """
+        Send command and give access to body of response, which is read while it is being parsed.
+
+        Whole response is neither loaded nor decoded, e.g. for parsing rows of large tables one by one.
+
+        :param command: command for send
+        :raises SwitchConnectionException: If response is incorrect
+        :return: Context yielding file-like body of JSON-RPC response
+        """
+        self._flush_batch()
+        logger.log(level=log_levels.CMD, msg=f">{self._ip}> {command}")
+        with self._governed():
+            try:
+                resp = self._session.post(self._url, data=self._generate_payload([command]), stream=True)
+            except (requests.ConnectionError, requests.Timeout, requests.HTTPError) as request_exception:
+                raise SwitchConnectionException("Found problem with switch communication") from request_exception
+            try:
+                if resp.status_code != 200:
+                    raise SwitchConnectionException(f"Switch responded {resp.status_code} status code")
+                resp.raw.decode_content = True
+                yield resp.raw
+            finally:
+                resp.close()
+
+    def send_command_lists(self, command_lists: List[List[str]]) -> List[list]:
+        """
+        Send command lists of many calls merged into as few NX-API requests as possible.
+
+        :param command_lists: Cisco_NX OS command lists, each of them executed in order
+        :raises SwitchCommandException: If switch rejected command, index is relative to its command list
+        :raises SwitchConnectionException: If response is incorrect
+        :return: JSON encoded responses of each command list
+        """
+        results = self._send_merged(command_lists)
+        for result in results:
+            if isinstance(result, Exception):
+                raise result
+        return results
+
+    def _split_requests(self, command_lists: List[List[str]]) -> List[List[int]]:
+        """
+        Split command lists into requests fitting limits, command list is never split between requests.
+
+        :param command_lists: Cisco_NX OS command lists
+        :return: Indexes of command lists sent by each request
+        """
+        split: List[List[int]] = []
+        commands = size = 0
+        for index, command_list in enumerate(command_lists):
+            list_size = len(self._generate_payload(command_list))
+            if not split or (
+                commands + len(command_list) > self._max_request_commands or size + list_size > self._max_request_size
+            ):
+                split.append([])
+                commands = size = 0
+            split[-1].append(index)
+            commands += len(command_list)
+            size += list_size
+        return split
+
+    def _send_merged(self, command_lists: List[List[str]]) -> List[Union[list, Exception]]:
+        """
+        Send command lists merged into requests, response elements are mapped back to command lists by id.
+
+        Requests are sent in parallel if all commands are show commands, in order otherwise (request following
+        failed one is not sent).
+
+        :param command_lists: Cisco_NX OS command lists
+        :return: JSON encoded responses of each command list or exception of its failure
+        """
+        first_ids = []
+        next_id = 1
+        for command_list in command_lists:
+            first_ids.append(next_id)
+            next_id += len(command_list)
+
+        def send(indexes: List[int]) -> Union[list, Exception]:
+            elements = []
+            for index in indexes:
+                elements.extend(json.loads(self._generate_payload(command_lists[index], first_id=first_ids[index])))
+            logger.log(
+                level=log_levels.CMD,
+                msg=f">{self._ip}> {len(elements)} commands of {len(indexes)} calls merged into single request",
+            )
+            try:
+                response = self._post(json.dumps(elements), cost=len(elements))
+            except SwitchConnectionException as e:
+                return e
+            return response if isinstance(response, list) else [response]
+
+        split = self._split_requests(command_lists)
+        read_only = all(
+            command.strip().startswith("show") for command_list in command_lists for command in command_list
+        )
+        if read_only and len(split) > 1:
+            with ThreadPoolExecutor(max_workers=min(len(split), self._http_pool_size)) as executor:
+                responses = list(executor.map(send, split))
+        else:
+            responses = []
+            for indexes in split:
+                if responses and isinstance(responses[-1], Exception):
+                    responses.append(SwitchConnectionException("Request was not sent, previous request failed"))
+                else:
+                    responses.append(send(indexes))
+
+        results: List[Union[list, Exception]] = [None] * len(command_lists)
+        for indexes, response in zip(split, responses):
+            by_id = {} if isinstance(response, Exception) else {element.get("id"): element for element in response}
+            for index in indexes:
+                command_list = command_lists[index]
+                if isinstance(response, Exception):
+                    results[index] = response
+                    continue
+                # ids are renumbered, so errors point to command of its own command list
+                elements = []
+                for offset in range(len(command_list)):
+                    element = by_id.get(first_ids[index] + offset)
+                    if element is None:
+                        results[index] = SwitchCommandException(
+                            f"Response of command is missing: {command_list[offset]}", command_index=offset
+                        )
+                        break
+                    elements.append({**element, "id": offset + 1})
+                else:
+                    try:
+                        results[index] = self._parse_response(command_list, elements)
+                    except SwitchCommandException as e:
+                        results[index] = e
+        return results
+
+    @property
+    def http_statistics(self) -> HTTPStatistics:
+        """Numbers of sent requests and opened HTTP connections, showing how many requests reused connection."""
+        pools = self._adapter.poolmanager.pools
+        statistics = HTTPStatistics()
+        for key in pools.keys():
+            pool = pools.get(key)
+            if pool is not None:
+                statistics.requests += pool.num_requests
+                statistics.connections += pool.num_connections
+        return statistics
+
+    def disconnect(self) -> None:
+        """Close kept-alive HTTP connections."""
+        self._session.close()
+
+    @staticmethod
+    def _parse_response(command_list: List[str], raw_json_response: Union[list, dict]) -> list:
+        """
+        Check responses of commands for errors and log results.
+
+        :param command_list: Cisco_NX OS commands executed on switch
+        :param raw_json_response: Decoded JSON-RPC response
+        :raises SwitchCommandException: If switch rejected command
+        :return: JSON encoded responses
+        """
         json_resp = raw_json_response if isinstance(raw_json_response, list) else [raw_json_response]
         for element in json_resp:
             if element.get("error", 0):
-                raise SwitchConnectionException(
+                raise SwitchCommandException(
                     f"{element['error']['message']}{element['error']['data']['msg'].strip()}: "
-                    f"{command_list[element['id'] - 1]}"
+                    f"{command_list[element['id'] - 1]}",
+                    command_index=element["id"] - 1,
                 )
-            elif element.get("result", None) is not None:
+            elif element.get("result", None) is not None and logger.isEnabledFor(log_levels.OUT):
+                # formatting of large bodies is expensive, it is skipped when output is not logged
                 logger.log(level=log_levels.OUT, msg=json.dumps(element["result"].get("body", ""), indent=4))
                 logger.log(level=log_levels.OUT, msg=json.dumps(element["result"].get("msg", "")))
         return json_resp
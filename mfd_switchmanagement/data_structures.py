@@ -17,3 +17,10 @@ class ETSMode(Enum):
 
     WRR = "wrr"
     STRICT = "strict"
+
+
+class CliMode(Enum):
+    """CLI modes of switch session."""
+
+    EXEC = "exec"
+    CONFIG = "config"
@@ -2,6 +2,8 @@
 # SPDX-License-Identifier: MIT
 """Module for module exceptions."""
 
+from typing import Optional
+
 
 class SwitchConnectionException(Exception):
     """Exception for connection with switches."""
@@ -17,3 +19,21 @@ class SwitchWaitForLinkUpTimeout(SwitchException):
 
 class SwitchWaitForHoldingLinkStateTimeout(SwitchException):
     """Exception for switch port link state (up or down) timeout."""
+
+
+class SwitchCommandException(SwitchConnectionException):
+    """Exception for command rejected by switch."""
+
+    def __init__(self, message: str, command_index: Optional[int] = 0):
+        """
+        Init of exception.
+
+        :param message: Description of failure
+        :param command_index: Index of rejected command in sent command list, None if it cannot be determined
+        """
+        super().__init__(message)
+        self.command_index = command_index
+
+
+class SwitchBatchException(SwitchException):
+    """Exception for failure of batched configuration."""
@@ -0,0 +1,167 @@
+# Copyright (C) 2025 Intel Corporation
+# SPDX-License-Identifier: MIT
+"""Command rate limiter and concurrency governor."""
+
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Dict, Iterator, Optional
+
+
+@dataclass
+class GovernorStatistics:
+    """Counters of governor, delay is time spent by commands queued before they were sent."""
+
+    commands: int = 0
+    delayed: int = 0
+    total_delay: float = 0.0
+    max_delay: float = 0.0
+    in_flight: int = 0
+    lines: int = 0
+
+    @property
+    def average_delay(self) -> float:
+        """Average queueing delay in seconds per command."""
+        return self.total_delay / self.commands if self.commands else 0.0
+
+
+class CommandGovernor:
+    """
+    Token bucket rate limiter with cap of commands in flight.
+
+    Governor can be shared by connections, e.g. all connections to one switch or to all switches of one model,
+    to keep them below load at which control plane starts answering slowly.
+    Each command line sent in slot costs one token, so command list of 100 lines is limited like 100 commands.
+    Nested acquisitions by the same owner (e.g. retry of command) do not take another slot nor tokens.
+    """
+
+    def __init__(self, rate: Optional[float] = None, burst: int = 1, max_concurrency: Optional[int] = None):
+        """
+        Init of governor.
+
+        :param rate: Maximal average number of commands per second, None for no rate limit
+        :param burst: Number of commands which can be sent at once after idle period
+        :param max_concurrency: Maximal number of commands in flight, None for no limit
+        :raises ValueError: if limits are not positive
+        """
+        if rate is not None and rate <= 0:
+            raise ValueError("Rate has to be positive")
+        if burst < 1:
+            raise ValueError("Burst has to be at least 1")
+        if max_concurrency is not None and max_concurrency < 1:
+            raise ValueError("Max concurrency has to be at least 1")
+        self._rate = rate
+        self._burst = burst
+        self._max_concurrency = max_concurrency
+        self._tokens = float(burst)
+        self._refilled = time.monotonic()
+        self._condition = threading.Condition(threading.Lock())
+        self._holders: Dict[int, int] = {}
+        self._statistics = GovernorStatistics()
+
+    @property
+    def statistics(self) -> GovernorStatistics:
+        """Snapshot of governor counters."""
+        with self._condition:
+            return GovernorStatistics(**vars(self._statistics))
+
+    def _refill(self, now: float) -> None:
+        """Add tokens for time elapsed since last refill."""
+        if self._rate is not None:
+            self._tokens = min(self._burst, self._tokens + (now - self._refilled) * self._rate)
+        self._refilled = now
+
+    def acquire(self, cost: int = 1, owner: Optional[int] = None) -> float:
+        """
+        Wait for free slot and tokens.
+
+        Cost larger than burst is allowed once bucket is full, missing tokens delay following commands.
+
+        :param cost: Number of command lines sent in slot
+        :param owner: Identifier of slot owner, current thread if not passed
+        :return: Time in seconds spent waiting
+        """
+        owner = threading.get_ident() if owner is None else owner
+        start = time.monotonic()
+        with self._condition:
+            depth = self._holders.get(owner, 0)
+            if depth:
+                self._holders[owner] = depth + 1
+                return 0.0
+            required = min(cost, self._burst)
+            while True:
+                now = time.monotonic()
+                self._refill(now)
+                concurrency_free = self._max_concurrency is None or self._statistics.in_flight < self._max_concurrency
+                if concurrency_free and (self._rate is None or self._tokens >= required):
+                    break
+                # slot is announced by release, tokens are computed from rate
+                self._condition.wait(None if not concurrency_free else (required - self._tokens) / self._rate)
+            if self._rate is not None:
+                self._tokens -= cost
+            delay = time.monotonic() - start
+            self._holders[owner] = 1
+            self._statistics.in_flight += 1
+            self._statistics.commands += 1
+            self._statistics.lines += cost
+            self._statistics.total_delay += delay
+            self._statistics.max_delay = max(self._statistics.max_delay, delay)
+            if delay > 0.001:
+                self._statistics.delayed += 1
+        return delay
+
+    def release(self, owner: Optional[int] = None) -> None:
+        """
+        Free slot of command.
+
+        :param owner: Identifier of slot owner passed to acquire, current thread if not passed
+        """
+        owner = threading.get_ident() if owner is None else owner
+        with self._condition:
+            depth = self._holders[owner] - 1
+            if depth:
+                self._holders[owner] = depth
+                return
+            del self._holders[owner]
+            self._statistics.in_flight -= 1
+            self._condition.notify_all()
+
+    @contextmanager
+    def slot(self, cost: int = 1) -> Iterator[float]:
+        """
+        Hold slot for command.
+
+        Slot is released by owner which acquired it, even if context is exited in other thread.
+
+        :param cost: Number of command lines sent in slot
+        :return: Context yielding time in seconds spent waiting
+        """
+        owner = threading.get_ident()
+        delay = self.acquire(cost, owner=owner)
+        try:
+            yield delay
+        finally:
+            self.release(owner)
+
+
+_governors: Dict[str, CommandGovernor] = {}
+_governors_lock = threading.Lock()
+
+
+def get_governor(
+    key: str, rate: Optional[float] = None, burst: int = 1, max_concurrency: Optional[int] = None
+) -> CommandGovernor:
+    """
+    Get process-wide governor registered under key, create it with given limits if it does not exist yet.
+
+    :param key: Name of governor, e.g. IP address of switch or switch class name
+    :param rate: Maximal average number of commands per second, None for no rate limit
+    :param burst: Number of commands which can be sent at once after idle period
+    :param max_concurrency: Maximal number of commands in flight, None for no limit
+    :return: Governor shared by whole process
+    """
+    with _governors_lock:
+        if key not in _governors:
+            _governors[key] = CommandGovernor(rate=rate, burst=burst, max_concurrency=max_concurrency)
+        return _governors[key]
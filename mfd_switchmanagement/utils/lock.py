@@ -0,0 +1,135 @@
+# Copyright (C) 2025 Intel Corporation
+# SPDX-License-Identifier: MIT
+"""Fair reentrant lock with wait time statistics."""
+
+import threading
+import time
+from dataclasses import dataclass
+from typing import Optional, Set
+
+
+@dataclass
+class LockStatistics:
+    """Counters of lock usage."""
+
+    acquisitions: int = 0
+    contended: int = 0
+    total_wait: float = 0.0
+    max_wait: float = 0.0
+    waiting: int = 0
+
+    @property
+    def average_wait(self) -> float:
+        """Average time in seconds spent waiting for lock."""
+        return self.total_wait / self.acquisitions if self.acquisitions else 0.0
+
+
+class FairRLock:
+    """
+    Reentrant lock granted to threads in order of their requests (FIFO).
+
+    Nested acquisitions by owner thread do not wait and are not queued.
+    Turn of thread which stopped waiting (timeout or exception, e.g. KeyboardInterrupt) is skipped.
+    """
+
+    def __init__(self):
+        """Init of lock."""
+        self._condition = threading.Condition(threading.Lock())
+        self._owner: Optional[int] = None
+        self._count = 0
+        self._next_ticket = 0
+        self._serving = 0
+        self._abandoned: Set[int] = set()
+        self._statistics = LockStatistics()
+
+    @property
+    def statistics(self) -> LockStatistics:
+        """Snapshot of lock counters."""
+        with self._condition:
+            return LockStatistics(**vars(self._statistics))
+
+    def acquire(self, blocking: bool = True, timeout: float = -1) -> bool:
+        """
+        Acquire lock, wait for threads which requested it earlier.
+
+        :param blocking: Wait for lock, if False lock is acquired only when it is free and no thread is waiting
+        :param timeout: Maximal time in seconds to wait for lock, -1 waits without limit
+        :return: True when lock is acquired, False when it is not free or timeout expired
+        """
+        me = threading.get_ident()
+        with self._condition:
+            if self._owner == me:
+                self._count += 1
+                return True
+            if not blocking and (self._owner is not None or self._serving != self._next_ticket):
+                return False
+            ticket = self._next_ticket
+            self._next_ticket += 1
+            start = time.monotonic()
+            deadline = start + timeout if timeout >= 0 else None
+            contended = self._owner is not None or self._serving != ticket
+            if contended:
+                self._statistics.waiting += 1
+                try:
+                    while self._owner is not None or self._serving != ticket:
+                        remaining = deadline - time.monotonic() if deadline is not None else None
+                        if remaining is not None and remaining <= 0:
+                            self._abandon(ticket)
+                            return False
+                        self._condition.wait(remaining)
+                except BaseException:
+                    self._abandon(ticket)
+                    raise
+                finally:
+                    self._statistics.waiting -= 1
+            wait = time.monotonic() - start
+            self._owner = me
+            self._count = 1
+            self._statistics.acquisitions += 1
+            self._statistics.contended += int(contended)
+            self._statistics.total_wait += wait
+            self._statistics.max_wait = max(self._statistics.max_wait, wait)
+            return True
+
+    def is_owned(self) -> bool:
+        """Check if lock is held by calling thread."""
+        with self._condition:
+            return self._owner == threading.get_ident()
+
+    def _abandon(self, ticket: int) -> None:
+        """Skip turn of thread which stopped waiting, called with condition held."""
+        if ticket == self._serving and self._owner is None:
+            self._advance()
+        else:
+            self._abandoned.add(ticket)
+        self._condition.notify_all()
+
+    def _advance(self) -> None:
+        """Pass turn to next ticket which is still waiting, called with condition held."""
+        self._serving += 1
+        while self._serving in self._abandoned:
+            self._abandoned.discard(self._serving)
+            self._serving += 1
+
+    def release(self) -> None:
+        """
+        Release lock, on last nested release lock is passed to next waiting thread.
+
+        :raises RuntimeError: if lock is not owned by calling thread
+        """
+        with self._condition:
+            if self._owner != threading.get_ident():
+                raise RuntimeError("Cannot release lock not owned by current thread")
+            self._count -= 1
+            if self._count:
+                return
+            self._owner = None
+            self._advance()
+            self._condition.notify_all()
+
+    def __enter__(self) -> "FairRLock":
+        self.acquire()
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.release()
@@ -0,0 +1,141 @@
+# Copyright (C) 2025 Intel Corporation
+# SPDX-License-Identifier: MIT
+"""Replay of recorded command outputs to synchronous switch methods."""
+
+from copy import deepcopy
+from ipaddress import IPv4Address, IPv6Address
+from typing import Any, List, Optional, Tuple, Type, Union
+
+from ..exceptions import SwitchException
+
+
+class OutputRequired(BaseException):
+    """Raised by replay connection when output of next command is not known yet, not catchable as Exception."""
+
+    def __init__(self, method: str, args: Tuple):
+        """
+        Init of exception.
+
+        :param method: Name of connection method which output is required
+        :param args: Arguments of method
+        """
+        super().__init__(method, args)
+        self.method = method
+        self.command_args = args
+
+
+class ReplayConnection:
+    """
+    Connection replaying recorded outputs of commands to synchronous switch method.
+
+    Method is run until it needs output which is not recorded yet (OutputRequired is raised), caller sends command,
+    records its output and runs method again. Class is mixed with connection class expected by switch,
+    so vendor checks like isinstance(self._connection, CiscoAPIConnection) keep working.
+    """
+
+    command_lock = None
+    SUPPORTS_BATCH = False
+    _batch = None
+
+    def rewind(self) -> None:
+        """Start replaying from first recorded output."""
+        self._position = 0
+
+    def record(self, method: str, args: Tuple, result: Any = None, exception: Optional[Exception] = None) -> None:
+        """
+        Record output (or exception) of command requested by OutputRequired.
+
+        :param method: Name of connection method
+        :param args: Arguments of method
+        :param result: Output of method
+        :param exception: Exception raised by method
+        """
+        self._records.append(((method, args), result, exception))
+
+    def _replay(self, method: str, *args) -> Any:
+        """
+        Return next recorded output, call has to match recorded one.
+
+        :param method: Name of connection method
+        :param args: Arguments of method
+        :return: Copy of recorded output
+        :raises OutputRequired: if output of call is not recorded yet
+        :raises SwitchException: if call differs from recorded one
+        """
+        index = self._position
+        self._position += 1
+        if index == len(self._records):
+            raise OutputRequired(method, args)
+        (recorded_method, recorded_args), result, exception = self._records[index]
+        if (recorded_method, recorded_args) != (method, args):
+            raise SwitchException(
+                f"Switch method is not deterministic, {method}{args} called instead of {recorded_method}{recorded_args}"
+            )
+        if exception is not None:
+            raise exception
+        # vendor parsers could modify output, each run gets its own copy
+        return deepcopy(result)
+
+    def send_command(self, command: str) -> Any:
+        """
+        Replay output of command.
+
+        :param command: command for send
+        :return: Recorded output from command
+        """
+        return self._replay("send_command", command)
+
+    def send_command_expect(self, command: str, prompt: str) -> Any:
+        """
+        Replay output of command waiting for prompt.
+
+        :param command: command for send
+        :param prompt: expected string
+        :return: Recorded output from command
+        """
+        return self._replay("send_command_expect", command, prompt)
+
+    def send_command_list(self, commands: List[str]) -> Any:
+        """
+        Replay output of commands list.
+
+        :param commands: commands for send
+        :return: Recorded output from commands
+        """
+        return self._replay("send_command_list", tuple(commands))
+
+    def send_configuration(self, commands: List[str]) -> Any:
+        """
+        Replay output of commands list sent as configuration.
+
+        :param commands: commands for send
+        :return: Recorded output from commands
+        """
+        return self._replay("send_configuration", tuple(commands))
+
+    def exit_port_configuration(self) -> None:
+        """Replay exit from port configuration."""
+        return self._replay("exit_port_configuration")
+
+    def disconnect(self) -> None:
+        """Do nothing, replay connection is not connected to switch."""
+
+
+def create_replay_connection(
+    connection_type: Type, ip: Union[IPv4Address, IPv6Address], device_type: Optional[str] = None
+) -> ReplayConnection:
+    """
+    Create replay connection, it is not connected to switch.
+
+    :param connection_type: Connection class expected by switch methods
+    :param ip: IP address of switch
+    :param device_type: device type of switch
+    :return: Replay connection without recorded outputs
+    """
+    replay_type = type(f"Replay{connection_type.__name__}", (ReplayConnection, connection_type), {})
+    replay = replay_type.__new__(replay_type)
+    replay._ip = ip
+    replay._device_type = device_type
+    replay._records = []
+    replay._position = 0
+    return replay
@@ -6,6 +6,7 @@ import logging
 import re
 import socket
 import struct
+from typing import Any, List, Union
 
 from ...base import Switch
 from ...exceptions import SwitchException
@@ -37,6 +38,20 @@ class Cisco(Switch):
 
     INCORRECT_COMMAND_OUTPUT = "% Invalid input detected at '^' marker."
 
+    def _configure(self, commands: Union[str, List[str]], configuration: bool = False) -> Any:
+        """
+        Send commands changing configuration of switch.
+
+        :param commands: command or list of commands to send
+        :param configuration: True if configuration mode has to be entered by connection
+        :return: Output from switch
+        """
+        if configuration:
+            return self._connection.send_configuration(commands)
+        if isinstance(commands, str):
+            return self._connection.send_command(commands)
+        return self._connection.send_command_list(commands)
+
     def get_max_mtu_frame_size(
         self,
     ) -> int:
@@ -148,7 +163,7 @@ class Cisco(Switch):
         else:
             command_list.append(f"interface range {port}")
             command_list.append("no mtu")
-        self._connection.send_command_list(command_list)
+        self._configure(command_list)
 
     def enable_jumbo_frame(self, frame_size: int, port: str) -> None:
         """
@@ -172,7 +187,7 @@ class Cisco(Switch):
         else:
             command_list.append(f"interface range {port}")
             command_list.append(f"mtu {frame_size}")
-        self._connection.send_command_list(command_list)
+        self._configure(command_list)
 
     def delete_mat_entry(self, mac: str) -> None:
         """
@@ -204,7 +219,7 @@ class Cisco(Switch):
             f"mtu {self.MAXIMUM_FRAME_SIZE}",
             "no shutdown",
         ]
-        return self._connection.send_command_list(command_list)
+        return self._configure(command_list)
 
     def show_vlans(self) -> str:
         """
@@ -234,7 +249,7 @@ class Cisco(Switch):
             "spanning-tree portfast disable",
             "spanning-tree bpdufilter disable",
         ]
-        return self._connection.send_command_list(command_list)
+        return self._configure(command_list)
 
     def disable_spanning_tree(self, port: str) -> str:
         """
@@ -245,7 +260,7 @@ class Cisco(Switch):
         """
         self._prepare_port_configuration(port)
         command_list = ["spanning-tree portfast", "spanning-tree bpdufilter enable"]
-        return self._connection.send_command_list(command_list)
+        return self._configure(command_list)
 
     def shutdown(self, shutdown: bool, port: str) -> None:
         """
@@ -270,7 +285,7 @@ class Cisco(Switch):
         """
         self._prepare_port_configuration(port)
         for _ in range(count):
-            self._connection.send_command("no sh")
+            self._configure("no sh")
 
     def disable_port(self, port: str, count: int = 3) -> None:
         """
@@ -281,7 +296,7 @@ class Cisco(Switch):
         """
         self._prepare_port_configuration(port)
         for _ in range(count):
-            self._connection.send_command("sh")
+            self._configure("sh")
 
     def change_vlan(self, port: str, vlan: int) -> str:
         """
@@ -298,7 +313,7 @@ class Cisco(Switch):
             "no sh",
             "spanning-tree portfast",
         ]
-        return self._connection.send_command_list(command_list)
+        return self._configure(command_list)
 
     def set_trunking_interface(self, port: str, vlan: int) -> str:
         """
@@ -317,7 +332,7 @@ class Cisco(Switch):
             f"switchport trunk allowed vlan add {vlan}",
             "no sh",
         ]
-        return self._connection.send_command_list(command_list)
+        return self._configure(command_list)
 
     def configure_vlan(self, ports: str, vlan: int, vlan_type: str, mode: str) -> None:
         """
@@ -355,7 +370,7 @@ class Cisco(Switch):
             command_list.append("switchport mode trunk")
             command_list.append("spanning-tree portfast trunk")
         command_list.append("no shutdown")
-        self._connection.send_command_list(command_list)
+        self._configure(command_list)
 
     def show_port_running_config(self, port: str) -> str:
         """
@@ -396,7 +411,7 @@ class Cisco(Switch):
 
         :return: output of the command
         """
-        return self._connection.send_configuration(["no cdp enable"])
+        return self._configure(["no cdp enable"], configuration=True)
 
     def configure_lldp(self, port: str, param: str) -> str:
         """
@@ -410,9 +425,10 @@ class Cisco(Switch):
             if param not in ["receive", "transmit"]:
                 raise ValueError(f"Invalid parameter: {param}. Valid values are 'receive' or 'transmit'.")
             else:
-                return self._connection.send_configuration(
+                return self._configure(
                     [
                         f"interface {port}",
                         f"lldp {param}",
-                    ]
+                    ],
+                    configuration=True,
                 )
@@ -0,0 +1,146 @@
+# Copyright (C) 2025 Intel Corporation
+# SPDX-License-Identifier: MIT
+"""Module for accessing TABLE_x / ROW_x structures of NX-API responses."""
+
+from typing import Any, BinaryIO, Dict, Iterator, Type, TypeVar
+
+from ....exceptions import SwitchCommandException, SwitchException
+
+RecordType = TypeVar("RecordType", bound="TableRecord")
+
+
+class TableRecord:
+    """
+    Read-only view of ROW_x element of NX-API table.
+
+    Record keeps reference to row of decoded response, row is neither copied nor modified.
+    """
+
+    __slots__ = ("_row",)
+
+    def __init__(self, row: Dict[str, Any]):
+        """
+        Init of record.
+
+        :param row: Element of ROW_x of NX-API table
+        """
+        self._row = row
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """
+        Get value of column.
+
+        :param key: Name of column
+        :param default: Value returned when column is missing
+        :return: Value of column
+        """
+        return self._row.get(key, default)
+
+    def __getitem__(self, key: str) -> Any:
+        return self._row[key]
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({self._row})"
+
+
+class InterfaceRecord(TableRecord):
+    """Row of TABLE_interface, e.g. of 'show interface brief'."""
+
+    __slots__ = ()
+
+    @property
+    def interface(self) -> str:
+        """Name of interface."""
+        return self._row.get("interface", "")
+
+    @property
+    def state(self) -> str:
+        """Link state of interface, e.g. 'up' or 'down'."""
+        return self._row.get("state", "")
+
+    @property
+    def vlan(self) -> str:
+        """VLAN of interface."""
+        return self._row.get("vlan", "")
+
+
+class MacAddressRecord(TableRecord):
+    """Row of TABLE_mac_address, e.g. of 'show mac address-table'."""
+
+    __slots__ = ()
+
+    @property
+    def mac(self) -> str:
+        """MAC address in switch notation."""
+        return self._row.get("disp_mac_addr", "")
+
+    @property
+    def port(self) -> str:
+        """Port on which MAC address was learned."""
+        return self._row.get("disp_port", "")
+
+    @property
+    def vlan(self) -> int:
+        """VLAN in which MAC address was learned."""
+        return int(self._row.get("disp_vlan", 0))
+
+
+def iter_table(body: Dict[str, Any], name: str, record_type: Type[RecordType] = TableRecord) -> Iterator[RecordType]:
+    """
+    Iterate over rows of NX-API table.
+
+    NX-API returns ROW_x as dictionary when table has single row and as list otherwise, both are handled.
+
+    :param body: Body of result of NX-API command
+    :param name: Name of table without prefix, e.g. 'interface' for TABLE_interface / ROW_interface
+    :param record_type: Class of yielded records
+    :return: Records of table rows, nothing if table is missing
+    """
+    table = body.get(f"TABLE_{name}") or {}
+    rows = table.get(f"ROW_{name}") or ()
+    if isinstance(rows, dict):
+        rows = (rows,)
+    for row in rows:
+        yield record_type(row)
+
+
+def iter_table_stream(stream: BinaryIO, name: str, record_type: Type[RecordType] = TableRecord) -> Iterator[RecordType]:
+    """
+    Iterate over rows of NX-API table while response is being received and parsed.
+
+    Each row is yielded as soon as it is parsed, so only one row of response is kept in memory.
+    Requires ijson (extra 'fast-json'), its fastest available backend is used.
+
+    :param stream: File-like body of JSON-RPC response of single command
+    :param name: Name of table without prefix, e.g. 'interface' for TABLE_interface / ROW_interface
+    :param record_type: Class of yielded records
+    :return: Records of table rows, nothing if table is missing
+    :raises SwitchException: if ijson is not installed
+    :raises SwitchCommandException: if switch rejected command
+    """
+    try:
+        import ijson
+    except ImportError as e:
+        raise SwitchException(
+            "ijson is required for streamed NX-API responses, install mfd-switchmanagement[fast-json]"
+        ) from e
+    # response of single command is either object or array with one object
+    tables = {f"{element}result.body.TABLE_{name}.ROW_{name}" for element in ("", "item.")}
+    rows = tables | {f"{table}.item" for table in tables}
+    errors = {"error", "item.error"}
+    builder = None
+    built_prefix = None
+    for prefix, event, value in ijson.parse(stream):
+        if builder is None:
+            if event != "start_map" or (prefix not in rows and prefix not in errors):
+                continue
+            builder = ijson.ObjectBuilder()
+            built_prefix = prefix
+        builder.event(event, value)
+        if event != "end_map" or prefix != built_prefix:
+            continue
+        if built_prefix in errors:
+            error = builder.value
+            raise SwitchCommandException(f"{error.get('message', '')}{error.get('data', {}).get('msg', '').strip()}")
+        yield record_type(builder.value)
+        builder = None
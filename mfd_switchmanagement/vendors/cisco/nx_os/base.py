@@ -5,15 +5,17 @@
 import logging
 import re
 from enum import Enum
-from typing import Optional, List, Dict
-from time import sleep
+from typing import Any, Iterator, Optional, List, Dict, Tuple, Type, Union
+from time import monotonic, sleep
 from mfd_common_libs import TimeoutCounter, add_logging_level, log_levels
 
 from mfd_switchmanagement import CiscoAPIConnection
 from mfd_switchmanagement.base import FecMode
 from mfd_switchmanagement.exceptions import SwitchWaitForHoldingLinkStateTimeout, SwitchException
 from mfd_switchmanagement.utils.match import any_match
+from mfd_switchmanagement.utils.replay import OutputRequired, create_replay_connection
 
+from .api_tables import InterfaceRecord, MacAddressRecord, RecordType, iter_table, iter_table_stream
 from ..base import Cisco
 
 logger = logging.getLogger(__name__)
@@ -34,6 +36,101 @@ class Cisco_NXOS(Cisco):
     MINIMUM_FRAME_SIZE = 1523
     MAXIMUM_FRAME_SIZE = 9216
     PORT_REGEX = re.compile(r"^(Eth|Ethernet)(\d+/\d+(-\d+)?)?(\d+/\d+/\d+(-\d+)?)?$", re.I)
+    LINK_STATE_TTL = 1.0
+    _link_states: Optional[Dict[str, bool]] = None
+    _link_states_timestamp: float = 0.0
+    # read-only methods sending show commands only, without waiting and without setting state of switch object
+    GATHER_METHODS = frozenset(
+        {
+            "get_fec",
+            "get_port_by_mac",
+            "get_vlan_by_mac",
+            "is_fec_mode_set",
+            "is_port_linkup",
+            "show_lldp_info",
+            "show_port_channel_summary",
+            "show_port_dcbx",
+            "show_port_running_config",
+            "show_ports_status",
+            "show_version",
+            "show_vlans",
+        }
+    )
+
+    def gather(self, calls: List[Tuple], return_exceptions: bool = False) -> List[Any]:
+        """
+        Run many calls of switch methods, commands of all calls are merged into NX-API requests.
+
+        Calls are run in steps, commands needed by all calls in step are sent together (split into requests
+        by NX-API limits), responses are mapped back to calls by JSON-RPC id.
+        Each call is run on copy of switch object and replayed from start in every step, so only read-only
+        methods of GATHER_METHODS can be gathered, state they could set would be lost with copy.
+        For connections other than CiscoAPIConnection calls are run one by one.
+
+        Usage:
+        >>>switch.gather([("is_port_linkup", port) for port in ports])
+        [True, False, ...]
+
+        :param calls: Tuples of method name and its positional arguments
+        :param return_exceptions: Return exception raised by call as its result instead of raising it
+        :return: Results of calls, in order of calls
+        :raises ValueError: if method of call is not in GATHER_METHODS, no call is run then
+        """
+        not_supported = sorted({method for method, *_ in calls if method not in self.GATHER_METHODS})
+        if not_supported:
+            raise ValueError(
+                f"Methods {not_supported} can not be gathered, supported are {sorted(self.GATHER_METHODS)}"
+            )
+        results: List[Any] = [None] * len(calls)
+        if not isinstance(self._connection, CiscoAPIConnection):
+            for index, (method, *args) in enumerate(calls):
+                try:
+                    results[index] = getattr(self, method)(*args)
+                except Exception as e:
+                    if not return_exceptions:
+                        raise
+                    results[index] = e
+            return results
+        pending = {}
+        for index, (method, *args) in enumerate(calls):
+            switch = type(self).__new__(type(self))
+            switch.__dict__.update(self.__dict__)
+            switch._connection = create_replay_connection(self._connection.__class__, self._connection._ip)
+            pending[index] = (switch, getattr(switch, method), args)
+        while pending:
+            requests = {}
+            for index, (switch, method, args) in list(pending.items()):
+                switch._connection.rewind()
+                try:
+                    results[index] = method(*args)
+                except OutputRequired as request:
+                    requests[index] = request
+                    continue
+                except Exception as e:
+                    if not return_exceptions:
+                        raise
+                    results[index] = e
+                del pending[index]
+            merged = {
+                index: [request.command_args[0]] if request.method == "send_command" else list(request.command_args[0])
+                for index, request in requests.items()
+                if request.method in ("send_command", "send_command_list")
+            }
+            outputs = dict(zip(merged, self._connection._send_merged(list(merged.values())))) if merged else {}
+            for index, request in requests.items():
+                if index in outputs:
+                    output = outputs[index]
+                else:
+                    try:
+                        output = getattr(self._connection, request.method)(*request.command_args)
+                    except Exception as e:
+                        output = e
+                replay = pending[index][0]._connection
+                if isinstance(output, Exception):
+                    replay.record(request.method, request.command_args, exception=output)
+                else:
+                    replay.record(request.method, request.command_args, output)
+        return results
 
     def default_ports(self, ports: str) -> None:
         """
@@ -49,7 +146,7 @@ class Cisco_NXOS(Cisco):
             "switchport trunk allowed vlan none",
             f"mtu {self.MAXIMUM_FRAME_SIZE}",
         ]
-        self._connection.send_command_list(commands)
+        self._configure(commands)
         self.shutdown(shutdown=False, port=ports)
 
     def configure_vlan(self, ports: str, vlan: int, vlan_type: str, mode: str) -> None:
@@ -89,7 +186,7 @@ class Cisco_NXOS(Cisco):
             ]
         else:
             raise ValueError(f"Invalid mode or vlan type: {mode}, {vlan_type}")
-        self._connection.send_command_list(commands)
+        self._configure(commands)
 
     def get_port_by_mac(self, mac: str) -> str:
         """
@@ -130,17 +227,15 @@ class Cisco_NXOS(Cisco):
         else:
             raise IndexError
 
-    def _get_port_by_mac_by_api(self, mac: str, response: Dict) -> int:
+    def _get_port_by_mac_by_api(self, mac: str, response: Dict) -> str:
         body = self._verify_cisco_api_result(
             response, exception_message=f"Could not find MAC address {mac} on address-table."
         )
-        mac_table = body.get("TABLE_mac_address", 0)
-        if mac_table:
-            if isinstance(mac_table["ROW_mac_address"], list):
-                mac_table["ROW_mac_address"] = mac_table["ROW_mac_address"][0]
-            port = mac_table["ROW_mac_address"].get("disp_port", 0)
-            logger.log(level=log_levels.MODULE_DEBUG, msg=f"found port {port}")
-            return port
+        record = next(iter_table(body, "mac_address", MacAddressRecord), None)
+        if record is None:
+            raise IndexError
+        logger.log(level=log_levels.MODULE_DEBUG, msg=f"found port {record.port}")
+        return record.port
 
     def get_vlan_by_mac(self, mac: str) -> int:
         """
@@ -171,12 +266,11 @@ class Cisco_NXOS(Cisco):
         body = self._verify_cisco_api_result(
             response, exception_message=f"Could not find MAC address {mac} on address-table."
         )
-        mac_table = body.get("TABLE_mac_address", 0)
-        if isinstance(mac_table["ROW_mac_address"], list):
-            mac_table["ROW_mac_address"] = mac_table["ROW_mac_address"][0]
-        vlan = mac_table["ROW_mac_address"].get("disp_vlan", 0)
-        logger.log(level=log_levels.MODULE_DEBUG, msg=f"Found vlan {vlan}")
-        return int(vlan)
+        record = next(iter_table(body, "mac_address", MacAddressRecord), None)
+        if record is None:
+            raise IndexError
+        logger.log(level=log_levels.MODULE_DEBUG, msg=f"Found vlan {record.vlan}")
+        return record.vlan
 
     def _verify_cisco_api_result(self, response: Dict, *, exception_message: str) -> Dict:
         """
@@ -208,7 +302,7 @@ class Cisco_NXOS(Cisco):
 
         prefix = "" if shutdown else "no "
         commands = ["configure terminal", f"interface {port}", f"{prefix}shutdown"]
-        self._connection.send_command_list(commands)
+        self._configure(commands)
 
     def enable_port(self, port: str, count: int = 1) -> None:
         """
@@ -234,6 +328,8 @@ class Cisco_NXOS(Cisco):
         """
         Wait timeout time if the link is holding expected state (up or down).
 
+        Command lock is released while waiting, so other threads can use switch in the meantime.
+
         :param link_up: True for link up, False for link down checking
         :param timeout: Timeout to wait for link to come up or down, in seconds.
         :raises SwitchWaitForLinkStateTimeout: If link didn't come up before timeout happened.
@@ -242,12 +338,13 @@ class Cisco_NXOS(Cisco):
         condition = True if link_up else False
         time_for_holding_state = timeout / 2
         counter = TimeoutCounter(time_for_holding_state)
-        while not timeout_state:
-            if not self.is_port_linkup(port=port) == condition:
-                counter = TimeoutCounter(time_for_holding_state)  # start counter again, link is flapping
-            if counter:
-                return
-            sleep(0.1)
+        with self._command_lock_released():
+            while not timeout_state:
+                if not self.is_port_linkup(port=port) == condition:
+                    counter = TimeoutCounter(time_for_holding_state)  # start counter again, link is flapping
+                if counter:
+                    return
+                sleep(0.1)
         raise SwitchWaitForHoldingLinkStateTimeout()
 
     def set_port_dcbx_version(self, port: str, mode: str) -> None:
@@ -265,7 +362,7 @@ class Cisco_NXOS(Cisco):
         self._validate_configure_parameters(ports=port)
 
         commands = ["configure terminal", f"interface {port}", f"lldp dcbx version {mode}"]
-        self._connection.send_command_list(commands)
+        self._configure(commands)
         self.shutdown(shutdown=True, port=port)
 
         self._wait_for_holding_link_state(port=port, link_up=False, timeout=3)  # prevent link flap
@@ -289,7 +386,7 @@ class Cisco_NXOS(Cisco):
             "no lldp dcbx version cee",
             "no lldp dcbx version ieee",
         ]
-        self._connection.send_command_list(commands)
+        self._configure(commands)
         self.shutdown(shutdown=True, port=port)
 
         self._wait_for_holding_link_state(port=port, link_up=False, timeout=5)  # prevent link flap
@@ -326,7 +423,7 @@ class Cisco_NXOS(Cisco):
             raise ValueError("Invalid PFC value, must be either 'on', 'off' or 'auto'")
 
         commands = ["configure terminal", f"interface {port}", f"priority-flow-control mode {pfc}"]
-        self._connection.send_command_list(commands)
+        self._configure(commands)
 
     def delete_port_pfc(self, port: str) -> None:
         """
@@ -352,7 +449,7 @@ class Cisco_NXOS(Cisco):
             f"service-policy type qos input QOS_{suffix}",
             f"service-policy type queuing input IN_{suffix}",
         ]
-        self._connection.send_command_list(commands)
+        self._configure(commands)
 
     def delete_port_bw_by_tc(self, port: str, suffix: Optional[str] = "") -> None:
         """
@@ -369,7 +466,7 @@ class Cisco_NXOS(Cisco):
             f"no service-policy type qos input QOS_{suffix}",
             f"no service-policy type queuing input IN_{suffix}",
         ]
-        self._connection.send_command_list(commands)
+        self._configure(commands)
 
     def create_qos_policy(self, bandwidth: List, up2tc: List, suffix: Optional[str] = "") -> None:
         """
@@ -386,7 +483,7 @@ class Cisco_NXOS(Cisco):
                 commands.append(f"class type queuing {queue}")
                 commands.append(f"bandwidth percent {bandwidth}")
 
-        self._connection.send_command_list(commands)
+        self._configure(commands)
 
         configuration_commands = ["configure terminal"]
         policy_commands = ["configure terminal", f"policy-map type qos QOS_{suffix}"]
@@ -399,8 +496,8 @@ class Cisco_NXOS(Cisco):
                 policy_commands.append(f"class TC{i}_{suffix}")
                 policy_commands.append(f"set qos-group {i}")
 
-        self._connection.send_command_list(configuration_commands)
-        self._connection.send_command_list(policy_commands)
+        self._configure(configuration_commands)
+        self._configure(policy_commands)
 
     def delete_qos_policy(self, suffix: Optional[str] = "") -> None:
         """
@@ -416,11 +513,103 @@ class Cisco_NXOS(Cisco):
         for i in self.QOS_PRIORITY:
             commands.append(f"no class-map type qos match-all TC{i}_{suffix}")
 
-        self._connection.send_command_list(commands)
+        self._configure(commands)
+
+    def _configure(self, commands: Union[str, List[str]], configuration: bool = False) -> Any:
+        """Send commands changing configuration, snapshot of link states is dropped as they could change too."""
+        try:
+            return super()._configure(commands, configuration)
+        finally:
+            self._link_states = None
+
+    @staticmethod
+    def _link_state_key(port: str) -> str:
+        """Normalize port name, so full (API) and abbreviated (CLI) names of port are equal."""
+        port = port.strip().lower()
+        for name, abbreviation in (("ethernet", "eth"), ("port-channel", "po")):
+            if port.startswith(name):
+                return abbreviation + port[len(name) :]
+        return port
+
+    def _iter_api_table(
+        self, command: str, name: str, record_type: Type[RecordType], *, exception_message: str
+    ) -> Iterator[RecordType]:
+        """
+        Send command via API and iterate over rows of its table.
+
+        With stream_responses option of connection rows are parsed while response is received.
+
+        :param command: show command
+        :param name: Name of table without prefix, e.g. 'interface' for TABLE_interface / ROW_interface
+        :param record_type: Class of yielded records
+        :param exception_message: Body of exception raised when result is missing
+        :return: Records of table rows
+        """
+        if getattr(self._connection, "_stream_responses", False):
+            with self._connection.stream_command(command) as stream:
+                yield from iter_table_stream(stream, name, record_type)
+            return
+        response = self._connection.send_command(command)
+        body = self._verify_cisco_api_result(response, exception_message=exception_message)
+        yield from iter_table(body, name, record_type)
+
+    def _get_link_states_by_api(self) -> Dict[str, bool]:
+        records = self._iter_api_table(
+            "show interface brief",
+            "interface",
+            InterfaceRecord,
+            exception_message="Could not read states of switch interfaces.",
+        )
+        return {record.interface: record.state == "up" for record in records if record.interface}
+
+    def _get_link_states_by_console(self) -> Dict[str, bool]:
+        output = self._connection.send_command("show interface brief")
+        states = {}
+        status_column = None
+        for line in output.splitlines():
+            if "Status" in line.split():
+                # each section of output (ethernet, port-channel, mgmt) has its own header
+                status_column = line.index("Status")
+                continue
+            fields = line.split()
+            if status_column is None or not fields or fields[0] == "Interface" or line.startswith(("-", " ")):
+                continue
+            status = line[status_column:].split()
+            if status:
+                states[fields[0]] = status[0] == "up"
+        return states
+
+    def get_link_states(self, ports: Optional[List[str]] = None) -> Dict[str, bool]:
+        """
+        Get link states of all ports by single 'show interface brief'.
+
+        Snapshot of states is kept for LINK_STATE_TTL seconds and serves is_port_linkup() calls in that time,
+        so checking many ports takes one command instead of command per port.
+        Snapshot is dropped by every configuration command sent through switch object.
+
+        :param ports: ports of switch, all ports reported by switch if not passed
+        :return: Link state (True for up) of each port
+        :raises SwitchException: when passed port is not reported by switch
+        """
+        if isinstance(self._connection, CiscoAPIConnection):
+            states = self._get_link_states_by_api()
+        else:
+            states = self._get_link_states_by_console()
+        self._link_states = {self._link_state_key(port): state for port, state in states.items()}
+        self._link_states_timestamp = monotonic()
+        if ports is None:
+            return states
+        result = {}
+        for port in ports:
+            state = self._link_states.get(self._link_state_key(port))
+            if state is None:
+                raise SwitchException(f"Could not find port {port} in switch interfaces.")
+            result[port] = state
+        return result
 
     def is_port_linkup(self, port: str) -> bool:
         """
-        Check port link up.
+        Check port link up, state from get_link_states() snapshot is used if it is not older than LINK_STATE_TTL.
 
         :param port: port of switch
         :return: Status of link
@@ -428,6 +617,10 @@ class Cisco_NXOS(Cisco):
                 is not correct.
         :raises SwitchException when port is incorrect
         """
+        if self._link_states is not None and monotonic() - self._link_states_timestamp <= self.LINK_STATE_TTL:
+            state = self._link_states.get(self._link_state_key(port))
+            if state is not None:
+                return state
         if isinstance(self._connection, CiscoAPIConnection):
             return self._is_port_linkup_by_api(port=port)
         else:
@@ -466,11 +659,11 @@ class Cisco_NXOS(Cisco):
             body = self._verify_cisco_api_result(
                 response, exception_message=f"Could not find port {port} in switch interfaces."
             )
-            interface_table = body.get("TABLE_interface", 0)
-            if interface_table:
-                if isinstance(interface_table["ROW_interface"], list):
-                    interface_table["ROW_interface"] = interface_table["ROW_interface"][0]
-                port_state = interface_table["ROW_interface"].get("state", 0)
+            if body.get("TABLE_interface"):
+                record = next(iter_table(body, "interface", InterfaceRecord), None)
+                if record is None:
+                    raise IndexError
+                port_state = record.state
                 logger.log(level=log_levels.MODULE_DEBUG, msg=f"port {port} state {port_state}")
                 if "down" in port_state:
                     return False
@@ -484,7 +677,7 @@ class Cisco_NXOS(Cisco):
             raise SwitchException(f"State of port: {port} not found, API response may be corrupted.")
 
     def _prepare_port_configuration(self, port: str) -> str:
-        return self._connection.send_command_list(["conf t", f"int {port}", "switchport"])
+        return self._configure(["conf t", f"int {port}", "switchport"])
 
     def enable_spanning_tree(self, port: str) -> str:
         """
@@ -494,7 +687,7 @@ class Cisco_NXOS(Cisco):
         :return: Output from enabling
         """
         self._prepare_port_configuration(port)
-        return self._connection.send_command_list(
+        return self._configure(
             ["no spanning-tree port type edge", "spanning-tree bpdufilter disable"]
         )
 
@@ -506,7 +699,7 @@ class Cisco_NXOS(Cisco):
         :return: Output from disabling
         """
         self._prepare_port_configuration(port)
-        return self._connection.send_command_list(["spanning-tree port type edge", "spanning-tree bpdufilter enable"])
+        return self._configure(["spanning-tree port type edge", "spanning-tree bpdufilter enable"])
 
     def change_vlan(self, port: str, vlan: int) -> str:
         """
@@ -516,7 +709,7 @@ class Cisco_NXOS(Cisco):
         :param vlan: vlan to set
         """
         self._prepare_port_configuration(port)
-        return self._connection.send_command_list(
+        return self._configure(
             [
                 "switchport mode access",
                 "no switchport trunk allowed vlan",
@@ -535,7 +728,7 @@ class Cisco_NXOS(Cisco):
         :raises SwitchException on failure
         """
         self._prepare_port_configuration(port)
-        output = self._connection.send_command(f"fec {fec_mode}")
+        output = self._configure(f"fec {fec_mode}")
         if output.find("requested config change not allowed") != -1:
             raise SwitchException(f"Unable to set FEC on port {port}. Potential issue: wrong media inserted.")
 
@@ -583,7 +776,7 @@ class Cisco_NXOS(Cisco):
         """
         self._validate_port_channel_no(pc_no)
         commands = ["configure terminal", f"interface port-channel {pc_no}"]
-        self._connection.send_command_list(commands)
+        self._configure(commands)
 
     def remove_port(self, port: str) -> None:
         """Remove port from switch.
@@ -593,7 +786,7 @@ class Cisco_NXOS(Cisco):
         """
         self._validate_port_and_port_channel_syntax(port_channel=port)
         commands = ["configure terminal", f"no interface {port}"]
-        self._connection.send_command_list(commands)
+        self._configure(commands)
 
     def show_port_channel_summary(self, pc_no: Optional[int] = None) -> str:
         """Show summary for port channel interface.
@@ -618,7 +811,7 @@ class Cisco_NXOS(Cisco):
             raise ValueError("Incorrect switchport mode")
 
         commands = ["configure terminal", f"interface {port}", f"switchport mode {mode}"]
-        self._connection.send_command_list(commands)
+        self._configure(commands)
 
     def add_port_to_channel_group(
         self, port: str, pc_no: int, *, force: Optional[bool] = None, mode: Optional[str] = None
@@ -645,7 +838,7 @@ class Cisco_NXOS(Cisco):
                 raise ValueError(f"{mode} is incorrect parameter for channel-group mode")
             commands[2] += f" mode {mode}"
 
-        self._connection.send_command_list(commands)
+        self._configure(commands)
 
     def set_lacp_rate(self, port: str, rate: str) -> None:
         """Set LACP rate on port.
@@ -661,7 +854,7 @@ class Cisco_NXOS(Cisco):
             raise ValueError(f"{rate} is incorrect option for LACP rate")
 
         commands = ["configure terminal", f"interface {port}", f"lacp rate {rate}"]
-        self._connection.send_command_list(commands)
+        self._configure(commands)
 
     def disable_lacp_rate(self, port: str) -> None:
         """Disable LACP rate on port.
@@ -671,4 +864,4 @@ class Cisco_NXOS(Cisco):
         """
         self._validate_port_and_port_channel_syntax(ethernet_port=port)
         commands = ["configure terminal", f"interface {port}", "no lacp rate"]
-        self._connection.send_command_list(commands)
+        self._configure(commands)
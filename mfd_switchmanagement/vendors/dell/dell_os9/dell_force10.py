@@ -495,11 +495,40 @@ class DellOS9_Force10(DellOS9):
             raise ValueError(f"Dell switch supports up to {self.MAXIMUM_SUPPORT_TRAFFIC_CLASSES} traffic classes.")
 
         output = self._connection.send_command(f"sh qos dcb-map {dcbmap} | grep PG:{tc}")
+        return self._parse_dcb_map_bw(output, dcbmap, tc)
+
+    @staticmethod
+    def _parse_dcb_map_bw(output: str, dcbmap: str, tc: int) -> str:
+        """
+        Parse bandwidth percentage of traffic class from output of 'show qos dcb-map'.
+
+        :param output: Output of show command, whole or filtered to traffic class
+        :param dcbmap: DCB-MAP name
+        :param tc: Traffic Class
+        :return: Bandwidth value
+        :raises SwitchException if bandwidth of traffic class is not found
+        """
         bw = any_match(output, rf"((PG:{tc:d})\s*(TSA:ETS)\s*(BW:(\d+)))", flags=re.I)
         if bw:
             return bw[0][4]
-        else:
-            raise SwitchException(f"Error retrieving bandwidth percentage for DCB-MAP {dcbmap}, PG {tc}")
+        raise SwitchException(f"Error retrieving bandwidth percentage for DCB-MAP {dcbmap}, PG {tc}")
+
+    @staticmethod
+    def _parse_dcb_map_tc_by_up(output: str, dcbmap: str, up: int) -> str:
+        """
+        Parse traffic class of user priority from output of 'show qos dcb-map'.
+
+        :param output: Output of show command
+        :param dcbmap: DCB-MAP name
+        :param up: user priority (0 ~ 7)
+        :return: Traffic class assigned to user priority
+        :raises SwitchException if user priority is not found
+        """
+        for pg_info in output.split("PG:"):
+            result = re.search(rf"Priorities:([0-7]\s+)*{up:d}([0-7]\s+)*", pg_info, re.I)
+            if result:
+                return pg_info[0]
+        raise SwitchException(f" Could not find priority information (UP:{up:d}) from DCB MAP {dcbmap}")
 
     def get_dcb_map_pfc_by_tc(self, dcbmap: str, tc: int) -> str:
         """
@@ -578,11 +607,7 @@ class DellOS9_Force10(DellOS9):
             raise ValueError("User priority has to be between 0 and 7.")
 
         output = self._connection.send_command(f"sh qos dcb-map {dcbmap}")
-        for pg_info in output.split("PG:"):
-            result = re.search(rf"Priorities:([0-7]\s+)*{up:d}([0-7]\s+)*", pg_info, re.I)
-            if result:
-                return pg_info[0]
-        raise SwitchException(f" Could not find priority information (UP:{up:d}) from DCB MAP {dcbmap}")
+        return self._parse_dcb_map_tc_by_up(output, dcbmap, up)
 
     def get_dcb_bw_by_up(self, port: str, dcbmap: str, up: int) -> str:
         """
@@ -592,8 +617,18 @@ class DellOS9_Force10(DellOS9):
         :param dcbmap: switch DCB map name to assign
         :param up: user priority (0 ~ 7)
         :return: traffic class bandwidth percent
+        :raises ValueError if parameters are invalid
+        :raises SwitchException on failure
         """
-        return str(self.get_dcb_map_bw_by_tc(dcbmap, int(self.get_dcb_tc_by_up(port, dcbmap, up))))
+        if up not in list(range(8)):
+            raise ValueError("User priority has to be between 0 and 7.")
+
+        # traffic class and its bandwidth are both read from single output of dcb-map
+        output = self._connection.send_command(f"sh qos dcb-map {dcbmap}")
+        tc = int(self._parse_dcb_map_tc_by_up(output, dcbmap, up))
+        if tc >= self.MAXIMUM_SUPPORT_TRAFFIC_CLASSES:
+            raise ValueError(f"Dell switch supports up to {self.MAXIMUM_SUPPORT_TRAFFIC_CLASSES} traffic classes.")
+        return str(self._parse_dcb_map_bw(output, dcbmap, tc))
 
     def get_pfc_port_statistics(self, port: str, priority: int) -> str:
         """
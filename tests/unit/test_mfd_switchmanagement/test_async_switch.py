@@ -0,0 +1,179 @@
+# Copyright (C) 2025 Intel Corporation
+# SPDX-License-Identifier: MIT
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from mfd_switchmanagement import AsyncSwitch, Cisco_NXOS, ExtremeExos
+from mfd_switchmanagement.connections.async_base import AsyncBaseSwitchConnection
+from mfd_switchmanagement.connections.ssh import SSHSwitchConnection
+from mfd_switchmanagement.connections.vendors.cisco_api import CiscoAPIConnection
+from mfd_switchmanagement.exceptions import SwitchException
+
+
+class FakeAsyncConnection(AsyncBaseSwitchConnection):
+    SYNC_CONNECTION_TYPE = SSHSwitchConnection
+
+    def __init__(self, outputs, **kwargs):
+        super().__init__(ip="10.10.10.10", username="root", password="***", **kwargs)
+        self.outputs = outputs
+        self.sent = []
+        self.active = 0
+        self.max_active = 0
+
+    async def connect(self):
+        pass
+
+    async def _send(self, method, value):
+        self.sent.append((method, value))
+        self.active += 1
+        self.max_active = max(self.max_active, self.active)
+        await asyncio.sleep(0.01)
+        self.active -= 1
+        output = self.outputs.get(value if isinstance(value, str) else tuple(value), "")
+        if isinstance(output, Exception):
+            raise output
+        return output
+
+    async def send_command(self, command):
+        return await self._send("send_command", command)
+
+    async def send_command_expect(self, command, prompt):
+        return await self._send("send_command_expect", command)
+
+    async def send_command_list(self, commands):
+        return await self._send("send_command_list", commands)
+
+    async def send_configuration(self, commands):
+        return await self._send("send_configuration", commands)
+
+    async def disconnect(self):
+        self.sent.append(("disconnect", None))
+
+
+class FakeAsyncAPIConnection(FakeAsyncConnection):
+    SYNC_CONNECTION_TYPE = CiscoAPIConnection
+
+
+class TestAsyncSwitch:
+    def test_is_port_linkup_by_console(self):
+        connection = FakeAsyncConnection({"show ip int brief Ethernet1/1": "Eth1/1 up"})
+        switch = AsyncSwitch(Cisco_NXOS, connection)
+        assert asyncio.run(switch.is_port_linkup("Ethernet1/1")) is True
+        assert connection.sent == [("send_command", "show ip int brief Ethernet1/1")]
+
+    def test_is_port_linkup_by_api(self):
+        response = [{"result": {"body": {"TABLE_interface": {"ROW_interface": [{"state": "up"}]}}}}]
+        connection = FakeAsyncAPIConnection({"show interface Ethernet1/1 brief": response})
+        switch = AsyncSwitch(Cisco_NXOS, connection)
+        assert asyncio.run(switch.is_port_linkup("Ethernet1/1")) is True
+        assert response[0]["result"]["body"]["TABLE_interface"]["ROW_interface"] == [{"state": "up"}]
+
+    def test_multiple_commands_are_awaited_in_order(self):
+        connection = FakeAsyncConnection({})
+        switch = AsyncSwitch(Cisco_NXOS, connection)
+        asyncio.run(switch.enable_port("Ethernet1/1", count=2))
+        command = ("send_command_list", ["configure terminal", "interface Ethernet1/1", "no shutdown"])
+        assert connection.sent == [command, command]
+
+    def test_exception_of_command_is_raised_in_switch_method(self):
+        connection = FakeAsyncConnection({"show ip int brief Ethernet1/1": SwitchException("failure")})
+        switch = AsyncSwitch(Cisco_NXOS, connection)
+        with pytest.raises(SwitchException, match="failure"):
+            asyncio.run(switch.is_port_linkup("Ethernet1/1"))
+
+    def test_operations_on_switch_are_serialized(self):
+        connection = FakeAsyncConnection({"show ip int brief Ethernet1/1": "Eth1/1 up"})
+        switch = AsyncSwitch(Cisco_NXOS, connection)
+
+        async def main():
+            return await asyncio.gather(*(switch.is_port_linkup("Ethernet1/1") for _ in range(5)))
+
+        assert asyncio.run(main()) == [True] * 5
+        assert connection.max_active == 1
+
+    def test_operations_on_switches_run_concurrently(self):
+        connections = [FakeAsyncConnection({}) for _ in range(3)]
+        switches = [AsyncSwitch(Cisco_NXOS, connection) for connection in connections]
+        active = []
+
+        async def send(value, original):
+            active.append(sum(connection.active for connection in connections))
+            return await original(value)
+
+        for connection in connections:
+            connection.send_command = lambda command, original=connection.send_command: send(command, original)
+
+        async def main():
+            await asyncio.gather(*(switch.show_version() for switch in switches))
+
+        asyncio.run(main())
+        assert max(active) == 2
+
+    def test_operations_are_bounded_by_executor(self):
+        connections = [FakeAsyncConnection({}) for _ in range(3)]
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            switches = [AsyncSwitch(Cisco_NXOS, connection, executor=executor) for connection in connections]
+            active = []
+
+            async def send(value, original):
+                active.append(sum(connection.active for connection in connections))
+                return await original(value)
+
+            for connection in connections:
+                connection.send_command = lambda command, original=connection.send_command: send(command, original)
+
+            async def main():
+                await asyncio.gather(*(switch.show_version() for switch in switches))
+
+            asyncio.run(main())
+        assert active == [0, 0, 0]
+
+    def test_unknown_method(self):
+        switch = AsyncSwitch(Cisco_NXOS, FakeAsyncConnection({}))
+        with pytest.raises(AttributeError):
+            switch.not_existing_method
+        with pytest.raises(AttributeError):
+            switch._validate_ports_syntax
+
+    def test_create_and_context_manager(self):
+        async def main():
+            async with await AsyncSwitch.create(Cisco_NXOS, FakeAsyncConnection, outputs={}) as switch:
+                await switch.show_version()
+            return switch.connection
+
+        assert asyncio.run(main()).sent == [("send_command", "sh ver"), ("disconnect", None)]
+
+    def test_vendor_constructor_is_run_once(self):
+        connection = FakeAsyncConnection({})
+        switch = AsyncSwitch(ExtremeExos, connection)
+
+        async def main():
+            await switch.show_version()
+            await switch.show_version()
+
+        asyncio.run(main())
+        assert connection.sent[:2] == [
+            ("send_command", "configure cli columns 256"),
+            ("send_command", "disable idletimeout"),
+        ]
+        assert len(connection.sent) == 4
+
+    def test_waiting_method_does_not_block_loop(self):
+        connection = FakeAsyncConnection({"show ip int brief Ethernet1/1": "Eth1/1 up"})
+        switch = AsyncSwitch(Cisco_NXOS, connection)
+        ticks = []
+
+        async def tick(done):
+            while not done.done():
+                ticks.append(None)
+                await asyncio.sleep(0.01)
+
+        async def main():
+            wait = asyncio.ensure_future(switch.call("_wait_for_holding_link_state", "Ethernet1/1", True, 0.4))
+            await asyncio.gather(wait, tick(wait))
+
+        asyncio.run(main())
+        assert len(ticks) > 10
+        assert len(connection.sent) > 1
@@ -1,10 +1,14 @@
 # Copyright (C) 2025 Intel Corporation
 # SPDX-License-Identifier: MIT
 import re
+import threading
+import time
 
 import pytest
 
 from mfd_switchmanagement.base import Switch
+from mfd_switchmanagement.utils.governor import CommandGovernor, get_governor
+from mfd_switchmanagement.utils.lock import FairRLock
 
 
 class TestBaseSwitch:
@@ -77,3 +81,199 @@ class TestBaseSwitch:
         ports = "te 0/1"
         mode = mode
         switch._validate_configure_parameters(ports=ports, mode=mode, vlan_type="untagged", vlan=1)
+
+    def test_enable_port_is_not_interleaved(self, switch, port_regex, mocker):
+        switch._connection = mocker.Mock(command_lock=FairRLock())
+        sent = []
+
+        def send_command(command):
+            sent.append(command)
+            time.sleep(0.005)
+
+        switch._connection.send_command.side_effect = send_command
+        threads = [threading.Thread(target=switch.enable_port, args=("te 0/1", 3)) for _ in range(2)]
+        threads.append(threading.Thread(target=switch.disable_port, args=("te 0/1", 3)))
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        assert sorted([sent[0:3], sent[3:6], sent[6:9]]) == [["no sh"] * 3, ["no sh"] * 3, ["sh"] * 3]
+
+    def test_command_lock_released_while_waiting(self, switch, mocker):
+        lock = FairRLock()
+        switch._connection = mocker.Mock(command_lock=lock, _batch=None)
+        acquired = []
+
+        def other_thread():
+            acquired.append(lock.acquire(timeout=1))
+            lock.release()
+
+        with lock, lock:
+            with switch._command_lock_released():
+                assert not lock.is_owned()
+                thread = threading.Thread(target=other_thread)
+                thread.start()
+                thread.join()
+            assert lock.is_owned()
+            assert lock._count == 2
+        assert acquired == [True]
+
+    def test_command_lock_kept_in_batch(self, switch, mocker):
+        lock = FairRLock()
+        switch._connection = mocker.Mock(command_lock=lock, _batch=mocker.Mock())
+        with lock:
+            with switch._command_lock_released():
+                assert lock.is_owned()
+
+
+class TestFairRLock:
+    def test_reentrant(self):
+        lock = FairRLock()
+        with lock:
+            with lock:
+                pass
+        assert lock.statistics.acquisitions == 1
+
+    def test_non_blocking_acquire(self):
+        lock = FairRLock()
+        acquired = []
+        with lock:
+            thread = threading.Thread(target=lambda: acquired.append(lock.acquire(blocking=False)))
+            thread.start()
+            thread.join()
+            assert lock.acquire(blocking=False) is True
+            lock.release()
+        assert acquired == [False]
+
+    def test_release_not_owned(self):
+        with pytest.raises(RuntimeError):
+            FairRLock().release()
+
+    def test_granted_in_request_order(self):
+        lock = FairRLock()
+        order = []
+
+        def worker(number):
+            with lock:
+                order.append(number)
+
+        threads = []
+        with lock:
+            for number in range(5):
+                thread = threading.Thread(target=worker, args=(number,))
+                thread.start()
+                threads.append(thread)
+                while lock.statistics.waiting != number + 1:
+                    time.sleep(0.001)
+        for thread in threads:
+            thread.join()
+        assert order == [0, 1, 2, 3, 4]
+        statistics = lock.statistics
+        assert statistics.contended == 5
+        assert statistics.max_wait > 0
+        assert statistics.average_wait > 0
+
+
+    def test_acquire_timeout(self):
+        lock = FairRLock()
+        result = []
+        with lock:
+            thread = threading.Thread(target=lambda: result.append(lock.acquire(timeout=0.01)))
+            thread.start()
+            thread.join()
+        assert result == [False]
+        assert lock.statistics.waiting == 0
+        assert lock.acquire(timeout=0)
+        lock.release()
+
+    def test_interrupted_waiter_is_skipped(self, mocker):
+        lock = FairRLock()
+        acquired = []
+        with lock:
+            interrupted = threading.Thread(target=lambda: pytest.raises(KeyboardInterrupt, lock.acquire))
+            wait = mocker.patch.object(lock._condition, "wait", side_effect=KeyboardInterrupt)
+            interrupted.start()
+            interrupted.join()
+            mocker.stop(wait)
+            waiter = threading.Thread(target=lambda: acquired.append(lock.acquire(timeout=5)))
+            waiter.start()
+            while lock.statistics.waiting != 1:
+                time.sleep(0.001)
+        waiter.join()
+        assert acquired == [True]
+        assert lock.statistics.waiting == 0
+
+
+class TestCommandGovernor:
+    def test_rate_limit(self):
+        governor = CommandGovernor(rate=50, burst=2)
+        start = time.monotonic()
+        for _ in range(6):
+            with governor.slot():
+                pass
+        assert time.monotonic() - start >= 4 / 50 * 0.9
+        statistics = governor.statistics
+        assert statistics.commands == 6
+        assert statistics.delayed >= 3
+        assert statistics.max_delay > 0
+        assert statistics.in_flight == 0
+
+    def test_max_concurrency(self):
+        governor = CommandGovernor(max_concurrency=2)
+        active = []
+        peak = []
+
+        def worker():
+            with governor.slot():
+                active.append(1)
+                peak.append(len(active))
+                time.sleep(0.02)
+                active.pop()
+
+        threads = [threading.Thread(target=worker) for _ in range(6)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        assert max(peak) == 2
+        assert governor.statistics.average_delay > 0
+
+    def test_nested_slot_of_thread(self):
+        governor = CommandGovernor(max_concurrency=1)
+        with governor.slot():
+            with governor.slot() as delay:
+                assert delay == 0
+        assert governor.statistics.commands == 1
+        assert governor.statistics.in_flight == 0
+
+    def test_tokens_charged_per_line(self):
+        governor = CommandGovernor(rate=50, burst=2)
+        with governor.slot(cost=6):
+            pass
+        with governor.slot() as delay:
+            pass
+        assert delay >= 5 / 50 * 0.9
+        assert governor.statistics.commands == 2
+        assert governor.statistics.lines == 7
+
+    def test_slot_released_in_other_thread(self):
+        governor = CommandGovernor(max_concurrency=1)
+        slot = governor.slot()
+        slot.__enter__()
+        thread = threading.Thread(target=slot.__exit__, args=(None, None, None))
+        thread.start()
+        thread.join()
+        assert governor.statistics.in_flight == 0
+        with governor.slot() as delay:
+            assert delay < 0.1
+        assert governor.statistics.commands == 2
+
+    @pytest.mark.parametrize("limits", [{"rate": 0}, {"burst": 0}, {"max_concurrency": 0}])
+    def test_invalid_limits(self, limits):
+        with pytest.raises(ValueError):
+            CommandGovernor(**limits)
+
+    def test_get_governor_shared_by_key(self):
+        governor = get_governor("test_dell_os9_8132", rate=5, max_concurrency=2)
+        assert get_governor("test_dell_os9_8132") is governor
+        assert get_governor("test_cisco_4000") is not governor
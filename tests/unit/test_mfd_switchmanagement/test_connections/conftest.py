@@ -0,0 +1,112 @@
+# Copyright (C) 2025 Intel Corporation
+# SPDX-License-Identifier: MIT
+import socket
+import threading
+import time
+
+import paramiko
+import pytest
+
+# Unix sockets used by switch broker are not available on Windows
+collect_ignore = [] if hasattr(socket, "AF_UNIX") else ["test_broker.py"]
+
+
+class FakeSwitchServer(paramiko.ServerInterface):
+    """SSH server emulating CLI of NX-OS like switch, each shell line is answered with its echo, output and prompt."""
+
+    def __init__(self, hostname: str = "switch01", password: str = "password", latency: float = 0.0):
+        self.hostname = hostname
+        self.password = password
+        self.latency = latency
+        self.outputs = {"show version": "Cisco Nexus Operating System (NX-OS) Software"}
+        self.commands = []
+        self.sessions = 0
+        self._host_key = paramiko.RSAKey.generate(1024)
+        self._socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        self._socket.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        self._socket.bind(("127.0.0.1", 0))
+        self._socket.listen(16)
+        self.port = self._socket.getsockname()[1]
+        self._transports = []
+        self._thread = threading.Thread(target=self._accept, daemon=True)
+        self._thread.start()
+
+    def check_auth_password(self, username: str, password: str) -> int:
+        return paramiko.AUTH_SUCCESSFUL if password == self.password else paramiko.AUTH_FAILED
+
+    def get_allowed_auths(self, username: str) -> str:
+        return "password"
+
+    def check_channel_request(self, kind: str, chanid: int) -> int:
+        return paramiko.OPEN_SUCCEEDED if kind == "session" else paramiko.OPEN_FAILED_ADMINISTRATIVELY_PROHIBITED
+
+    def check_channel_pty_request(self, *args) -> bool:
+        return True
+
+    def check_channel_shell_request(self, channel: paramiko.Channel) -> bool:
+        threading.Thread(target=self._shell, args=(channel,), daemon=True).start()
+        return True
+
+    def check_channel_exec_request(self, channel: paramiko.Channel, command: bytes) -> bool:
+        def execute():
+            self.commands.append(command.decode())
+            channel.sendall(f"{self.outputs.get(command.decode(), '')}\n".encode())
+            channel.send_exit_status(0)
+            channel.close()
+
+        threading.Thread(target=execute, daemon=True).start()
+        return True
+
+    def _accept(self) -> None:
+        while True:
+            try:
+                client, _ = self._socket.accept()
+            except OSError:
+                return
+            transport = paramiko.Transport(client)
+            transport.add_server_key(self._host_key)
+            self._transports.append(transport)
+            self.sessions += 1
+            transport.start_server(server=self)
+
+    def _shell(self, channel: paramiko.Channel) -> None:
+        mode = ""
+        channel.sendall(f"\r\n{self.hostname}# ".encode())
+        pending = ""
+        while True:
+            try:
+                data = channel.recv(1024)
+            except OSError:
+                return
+            if not data:
+                return
+            pending += data.decode()
+            while "\n" in pending or "\r" in pending:
+                index = min(position for position in (pending.find("\n"), pending.find("\r")) if position >= 0)
+                line, pending = pending[:index].strip(), pending[index + 1 :].lstrip("\r\n")
+                if line:
+                    self.commands.append(line)
+                if self.latency:
+                    time.sleep(self.latency)
+                if line in ("configure terminal", "conf t"):
+                    mode = "(config)"
+                elif line == "end" or (line == "exit" and mode):
+                    mode = ""
+                output = self.outputs.get(line, "")
+                output = f"{output}\r\n" if output else ""
+                try:
+                    channel.sendall(f"{line}\r\n{output}{self.hostname}{mode}# ".encode())
+                except OSError:
+                    return
+
+    def close(self) -> None:
+        self._socket.close()
+        for transport in self._transports:
+            transport.close()
+
+
+@pytest.fixture
+def fake_ssh_server():
+    server = FakeSwitchServer()
+    yield server
+    server.close()
@@ -0,0 +1,120 @@
+# Copyright (C) 2025 Intel Corporation
+# SPDX-License-Identifier: MIT
+import asyncio
+import json
+
+import pytest
+
+from mfd_switchmanagement import AsyncCiscoAPIConnection
+from mfd_switchmanagement.exceptions import SwitchCommandException, SwitchConnectionException
+
+
+async def _serve(responses, requests, close_after=None):
+    """Start NX-API like HTTP server answering requests with given bodies, optionally closing connection."""
+    served = 0
+
+    async def handle(reader, writer):
+        nonlocal served
+        while True:
+            try:
+                head = await reader.readuntil(b"\r\n\r\n")
+            except asyncio.IncompleteReadError:
+                break
+            length = int(
+                [line for line in head.decode().split("\r\n") if line.lower().startswith("content-length")][0]
+                .split(":")[1]
+                .strip()
+            )
+            body = await reader.readexactly(length)
+            requests.append((head.decode(), json.loads(body)))
+            status, response, chunked = responses[served % len(responses)]
+            served += 1
+            payload = json.dumps(response).encode()
+            if chunked:
+                half = len(payload) // 2
+                writer.write(
+                    f"HTTP/1.1 {status} OK\r\nTransfer-Encoding: chunked\r\n\r\n".encode()
+                    + f"{half:x}\r\n".encode()
+                    + payload[:half]
+                    + f"\r\n{len(payload) - half:x}\r\n".encode()
+                    + payload[half:]
+                    + b"\r\n0\r\n\r\n"
+                )
+            else:
+                writer.write(f"HTTP/1.1 {status} OK\r\nContent-Length: {len(payload)}\r\n\r\n".encode() + payload)
+            await writer.drain()
+            if close_after is not None and served % close_after == 0:
+                break
+        writer.close()
+
+    return await asyncio.start_server(handle, "127.0.0.1", 0)
+
+
+def _result(body, id_=1):
+    return {"jsonrpc": "2.0", "result": {"body": body}, "id": id_}
+
+
+class TestAsyncCiscoAPI:
+    def _run(self, responses, scenario, close_after=None):
+        requests = []
+
+        async def main():
+            server = await _serve(responses, requests, close_after=close_after)
+            port = server.sockets[0].getsockname()[1]
+            connection = AsyncCiscoAPIConnection(ip="127.0.0.1", username="admin", password="***", port=port)
+            try:
+                return await scenario(connection)
+            finally:
+                await connection.disconnect()
+                server.close()
+                await server.wait_closed()
+
+        return asyncio.run(main()), requests
+
+    def test_send_command_list_keep_alive(self):
+        async def scenario(connection):
+            await connection.connect()
+            return await connection.send_command_list(["show version", "show clock"])
+
+        responses = [(200, _result({"host_name": "nexus"}), False), (200, [_result({}), _result({}, 2)], True)]
+        output, requests = self._run(responses, scenario)
+        assert [element["id"] for element in output] == [1, 2]
+        assert [request["params"]["cmd"] for request in requests[1][1]] == ["show version", "show clock"]
+        assert "Authorization: Basic YWRtaW46Kioq" in requests[0][0]
+
+    def test_reconnect_when_connection_closed_by_switch(self):
+        async def scenario(connection):
+            await connection.connect()
+            await asyncio.sleep(0.05)
+            return await connection.send_command("show version")
+
+        output, requests = self._run([(200, _result({"host_name": "nexus"}), False)], scenario, close_after=1)
+        assert output[0]["result"]["body"] == {"host_name": "nexus"}
+        assert len(requests) == 2
+
+    def test_command_error(self):
+        error = {"jsonrpc": "2.0", "error": {"message": "Input CLI command error", "data": {"msg": ""}}, "id": 1}
+
+        async def scenario(connection):
+            with pytest.raises(SwitchCommandException) as exception:
+                await connection.send_command("show wrong")
+            return exception.value.command_index
+
+        assert self._run([(200, error, False)], scenario)[0] == 0
+
+    def test_status_code_error(self):
+        async def scenario(connection):
+            with pytest.raises(SwitchConnectionException):
+                await connection.send_command("show version")
+
+        self._run([(500, {}, False)], scenario)
+
+    def test_connect_failure(self):
+        async def main():
+            connection = AsyncCiscoAPIConnection(
+                ip="127.0.0.1", username="admin", password="***", port=1, auth_timeout=1
+            )
+            await connection.connect()
+
+        with pytest.raises(SwitchConnectionException):
+            asyncio.run(main())
@@ -1,13 +1,16 @@
 # Copyright (C) 2025 Intel Corporation
 # SPDX-License-Identifier: MIT
 import json
+import logging
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 from textwrap import dedent
 
 import pytest
 from requests import HTTPError
 
 from mfd_switchmanagement import CiscoAPIConnection
-from mfd_switchmanagement.exceptions import SwitchConnectionException
+from mfd_switchmanagement.exceptions import SwitchCommandException, SwitchConnectionException, SwitchException
 
 
 class TestCiscoAPI:
@@ -75,8 +78,9 @@ class TestCiscoAPI:
         mock_response = mocker.Mock()
         mock_response.status_code = 200
         mock_response.json = mocker.Mock(return_value=json_output)
+        mock_response.content = json.dumps(json_output).encode()
         mock_post = mocker.Mock(return_value=mock_response)
-        mocker.patch("requests.post", new=mock_post)
+        mocker.patch.object(connection._session, "post", new=mock_post)
         output = connection.send_command_list(["show version"])
         assert output == [json_output]
 
@@ -84,12 +88,115 @@ class TestCiscoAPI:
         mock_response = mocker.Mock()
         mock_response.status_code = 400
         mock_post = mocker.Mock(return_value=mock_response)
-        mocker.patch("requests.post", new=mock_post)
+        mocker.patch.object(connection._session, "post", new=mock_post)
         with pytest.raises(SwitchConnectionException):
             connection.send_command_list(["show version"])
 
     def test_send_command_list_request_failure(self, connection, mocker):
         mock_post = mocker.Mock(side_effect=HTTPError)
-        mocker.patch("requests.post", new=mock_post)
+        mocker.patch.object(connection._session, "post", new=mock_post)
         with pytest.raises(SwitchConnectionException):
             connection.send_command_list(["show version"])
+
+    def test_session_reuses_connection(self, connection):
+        authorizations = []
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def do_POST(self):
+                authorizations.append(self.headers["Authorization"])
+                self.rfile.read(int(self.headers["Content-Length"]))
+                body = json.dumps({"jsonrpc": "2.0", "result": {"body": {}}, "id": 1}).encode()
+                self.send_response(200)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args):
+                pass
+
+        server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        thread = threading.Thread(target=server.serve_forever, kwargs={"poll_interval": 0.05}, daemon=True)
+        thread.start()
+        try:
+            connection._url = f"http://127.0.0.1:{server.server_address[1]}/ins"
+            for _ in range(3):
+                connection.send_command_list(["show clock"])
+            statistics = connection.http_statistics
+            assert statistics.requests == 3
+            assert statistics.connections == 1
+            assert statistics.reused == 2
+            assert authorizations == ["Basic YWRtaW46Kioq"] * 3
+            connection.disconnect()
+            connection.send_command_list(["show clock"])
+            assert connection.http_statistics.connections == 1
+        finally:
+            server.shutdown()
+            server.server_close()
+
+    @staticmethod
+    def _echo(payload, cost=1):
+        return [{"jsonrpc": "2.0", "result": {"body": e["params"]["cmd"]}, "id": e["id"]} for e in json.loads(payload)]
+
+    def test_send_command_lists_chunked_without_splitting_list(self, connection, mocker):
+        connection._max_request_commands = 3
+        post = mocker.patch.object(connection, "_post", side_effect=self._echo)
+        results = connection.send_command_lists([["show a", "show b"], ["show c", "show d"], ["show e"]])
+        assert [[element["result"]["body"] for element in result] for result in results] == [
+            ["show a", "show b"],
+            ["show c", "show d"],
+            ["show e"],
+        ]
+        assert [element["id"] for element in results[1]] == [1, 2]
+        assert sorted(len(json.loads(c.args[0])) for c in post.call_args_list) == [2, 3]
+
+    def test_send_command_lists_error_index_relative_to_list(self, connection, mocker):
+        def post(payload, cost=1):
+            response = self._echo(payload)
+            response[3] = {"jsonrpc": "2.0", "error": {"message": "Invalid", "data": {"msg": " cmd"}}, "id": 4}
+            return response
+
+        mocker.patch.object(connection, "_post", side_effect=post)
+        command_lists = [["show a", "show b"], ["configure terminal", "bad command"]]
+        results = connection._send_merged(command_lists)
+        assert len(results[0]) == 2
+        assert isinstance(results[1], SwitchCommandException)
+        assert results[1].command_index == 1
+        with pytest.raises(SwitchCommandException, match="bad command"):
+            connection.send_command_lists(command_lists)
+
+    def test_send_command_lists_configuration_stops_after_failed_request(self, connection, mocker):
+        connection._max_request_commands = 2
+        post = mocker.patch.object(connection, "_post", side_effect=SwitchConnectionException("failure"))
+        results = connection._send_merged([["configure terminal", "vlan 10"], ["configure terminal", "vlan 20"]])
+        assert post.call_count == 1
+        assert all(isinstance(result, SwitchConnectionException) for result in results)
+        assert "not sent" in str(results[1])
+
+    def test_output_formatted_only_when_logged(self, connection, mocker):
+        dumps = mocker.spy(json, "dumps")
+        response = [{"jsonrpc": "2.0", "result": {"body": {"TABLE_interface": {}}}, "id": 1}]
+        logger = logging.getLogger("mfd_switchmanagement.connections.vendors.cisco_api")
+        mocker.patch.object(logger, "isEnabledFor", return_value=False)
+        connection._parse_response(["show interface brief"], response)
+        dumps.assert_not_called()
+
+    def test_stream_responses_requires_ijson(self, mocker):
+        mocker.patch.object(CiscoAPIConnection, "send_command", return_value="version")
+        mocker.patch.dict("sys.modules", {"ijson": None})
+        with pytest.raises(SwitchException, match="ijson"):
+            CiscoAPIConnection(ip="10.10.10.10", username="admin", password="***", stream_responses=True)
+
+    def test_stream_command(self, connection, mocker):
+        response = mocker.Mock(status_code=200)
+        post = mocker.patch.object(connection._session, "post", return_value=response)
+        with connection.stream_command("show interface brief") as stream:
+            assert stream is response.raw
+        assert post.call_args.kwargs["stream"] is True
+        response.close.assert_called_once()
+
+        response.status_code = 500
+        with pytest.raises(SwitchConnectionException, match="500"):
+            with connection.stream_command("show interface brief"):
+                pass
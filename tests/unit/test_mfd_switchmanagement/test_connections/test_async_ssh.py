@@ -0,0 +1,109 @@
+# Copyright (C) 2025 Intel Corporation
+# SPDX-License-Identifier: MIT
+import asyncio
+
+import pytest
+
+from mfd_switchmanagement import AsyncSSHSwitchConnection
+from mfd_switchmanagement.exceptions import SwitchConnectionException, SwitchException
+
+
+class FakeShell:
+    """Interactive shell of switch answering written lines with configured outputs."""
+
+    def __init__(self, outputs, prompt="switch#"):
+        self.outputs = outputs
+        self.prompt = prompt
+        self.written = []
+        self.queue = asyncio.Queue()
+        self.stdin = self
+        self.stdout = self
+        self.closed = False
+
+    def write(self, data):
+        command = data.rstrip("\n")
+        self.written.append(command)
+        output = self.outputs.get(command, "")
+        if output is None:
+            return
+        echo = f"{command}\r\n" if command else "\r\n"
+        self.queue.put_nowait(f"{echo}{output}\r\n{self.prompt}" if output else f"{echo}{self.prompt}")
+
+    async def read(self, _):
+        return await self.queue.get()
+
+    def close(self):
+        self.closed = True
+
+
+class TestAsyncSSHSwitchConnection:
+    def _connection(self, shell, **kwargs):
+        connection = AsyncSSHSwitchConnection(
+            ip="10.10.10.10", username="root", password="***", device_type="cisco_nxos", read_timeout=1, **kwargs
+        )
+        connection._process = shell
+        return connection
+
+    def test_device_type_required(self):
+        with pytest.raises(ValueError):
+            AsyncSSHSwitchConnection(ip="10.10.10.10", username="root", password="***")
+
+    def test_connect_without_asyncssh(self, mocker):
+        mocker.patch.dict("sys.modules", {"asyncssh": None})
+        connection = AsyncSSHSwitchConnection(
+            ip="10.10.10.10", username="root", password="***", device_type="cisco_nxos"
+        )
+        with pytest.raises(SwitchException, match="asyncssh"):
+            asyncio.run(connection.connect())
+
+    def test_prepare_session_and_send_command(self):
+        async def main():
+            shell = FakeShell({"show version": "NX-OS 9.3\nuptime 1 day"})
+            connection = self._connection(shell)
+            await connection._prepare_session()
+            return shell, connection, await connection.send_command("show version")
+
+        shell, connection, output = asyncio.run(main())
+        assert connection.base_prompt == "switch"
+        assert shell.written == ["", "terminal length 0", "show version"]
+        assert output == "NX-OS 9.3\nuptime 1 day"
+
+    def test_enable_with_secret(self):
+        async def main():
+            shell = FakeShell({"": "", "enable": None, "***": ""}, prompt="switch>")
+            connection = self._connection(shell, secret="***")
+
+            def write(data, original=shell.write):
+                original(data)
+                if data == "enable\n":
+                    shell.prompt = "switch#"
+                    shell.queue.put_nowait("enable\r\nPassword: ")
+
+            shell.write = write
+            await connection._prepare_session()
+            return shell, connection
+
+        shell, connection = asyncio.run(main())
+        assert "***" in shell.written
+        assert connection.base_prompt == "switch"
+
+    def test_send_configuration(self):
+        async def main():
+            shell = FakeShell({})
+            connection = self._connection(shell)
+            await connection._prepare_session()
+            shell.written.clear()
+            await connection.send_configuration(["interface e1/1", "no shutdown"])
+            return shell
+
+        assert asyncio.run(main()).written == ["configure terminal", "interface e1/1", "no shutdown", "end"]
+
+    def test_prompt_timeout(self):
+        async def main():
+            shell = FakeShell({"show hang": None})
+            connection = self._connection(shell)
+            await connection._prepare_session()
+            await connection.send_command("show hang")
+
+        with pytest.raises(SwitchConnectionException):
+            asyncio.run(main())
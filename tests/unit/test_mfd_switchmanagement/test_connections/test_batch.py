@@ -0,0 +1,161 @@
+# Copyright (C) 2025 Intel Corporation
+# SPDX-License-Identifier: MIT
+import json
+
+import pytest
+
+from mfd_switchmanagement import Arista, Cisco_NXOS, CiscoAPIConnection, SSHSwitchConnection
+from mfd_switchmanagement.data_structures import CliMode
+from mfd_switchmanagement.exceptions import SwitchBatchException, SwitchCommandException
+from mfd_switchmanagement.utils.replay import create_replay_connection
+
+
+class TestConfigurationBatch:
+    @pytest.fixture
+    def ssh_switch(self, mocker):
+        mocker.patch("mfd_switchmanagement.connections.ssh.SSHSwitchConnection.connect", return_value=mocker.Mock())
+        switch = Arista(ip="10.10.10.10", username="root", connection_type=SSHSwitchConnection)
+        switch._connection._check_connection = mocker.Mock(return_value=True)
+        switch._connection._connection.send_config_set.return_value = ""
+        return switch
+
+    @pytest.fixture
+    def api_switch(self, mocker):
+        mocker.patch.object(CiscoAPIConnection, "send_command", return_value=[])
+        switch = Cisco_NXOS(ip="10.10.10.10", username="admin", connection_type=CiscoAPIConnection)
+        mocker.stopall()
+        return switch
+
+    def test_batch_sends_one_push(self, ssh_switch):
+        with ssh_switch.batch() as batch:
+            ssh_switch.shutdown(shutdown=False, port="Ethernet1/1")
+            ssh_switch.shutdown(shutdown=True, port="Ethernet1/2")
+            assert len(batch.entries) == 2
+            ssh_switch._connection._connection.send_config_set.assert_not_called()
+        ssh_switch._connection._connection.send_config_set.assert_called_once_with(
+            [
+                "configure terminal",
+                "interface Ethernet1/1",
+                "no shutdown",
+                "interface Ethernet1/2",
+                "shutdown",
+            ],
+            exit_config_mode=False,
+            enter_config_mode=False,
+        )
+        assert ssh_switch._connection._batch is None
+
+    def test_batch_not_supported_raises_on_enter(self, ssh_switch, mocker):
+        ssh_switch._connection = create_replay_connection(SSHSwitchConnection, "10.10.10.10")
+        body = mocker.Mock()
+        with pytest.raises(NotImplementedError, match="Batching"):
+            with ssh_switch.batch():
+                body()
+        body.assert_not_called()
+
+    def test_batch_records_origin(self, ssh_switch):
+        with ssh_switch.batch() as batch:
+            ssh_switch.disable_port(port="Ethernet1/1")
+            with batch.origin("enable_port(Ethernet1/1)"):
+                ssh_switch.enable_port(port="Ethernet1/1")
+            assert [entry.origin for entry in batch.entries] == ["call #1", "enable_port(Ethernet1/1)"]
+            batch.discard()
+
+    def test_batch_keeps_configure_after_end(self, ssh_switch):
+        with ssh_switch.batch():
+            ssh_switch._connection.send_command_list(["configure terminal", "vlan 10", "end"])
+            ssh_switch._connection.send_command_list(["configure terminal", "vlan 20"])
+        ssh_switch._connection._connection.send_config_set.assert_called_once_with(
+            ["configure terminal", "vlan 10", "end", "configure terminal", "vlan 20"],
+            exit_config_mode=False,
+            enter_config_mode=False,
+        )
+
+    def test_batch_read_flushes_queued_commands(self, ssh_switch, mocker):
+        manager = mocker.Mock()
+        manager.attach_mock(ssh_switch._connection._connection.send_config_set, "send_config_set")
+        manager.attach_mock(ssh_switch._connection._connection.send_command, "send_command")
+        with ssh_switch.batch():
+            ssh_switch.shutdown(shutdown=False, port="Ethernet1/1")
+            ssh_switch.show_version()
+        assert [call[0] for call in manager.mock_calls] == ["send_config_set", "send_command"]
+
+    def test_batch_discarded_on_exception(self, ssh_switch):
+        with pytest.raises(RuntimeError):
+            with ssh_switch.batch():
+                ssh_switch.shutdown(shutdown=False, port="Ethernet1/1")
+                raise RuntimeError
+        ssh_switch._connection._connection.send_config_set.assert_not_called()
+        assert ssh_switch._connection._batch is None
+
+    def test_batch_error_mapped_to_call(self, ssh_switch):
+        ssh_switch._connection._connection.send_config_set.return_value = (
+            "configure terminal\ninterface Ethernet1/1\nno shutdown\n"
+            "interface Ethernet1/99\n% Invalid input detected at '^' marker.\nshutdown"
+        )
+        with pytest.raises(SwitchBatchException, match=r"disable_port\(\).*Ethernet1/99"):
+            with ssh_switch.batch() as batch:
+                ssh_switch.enable_port(port="Ethernet1/1")
+                with batch.origin("disable_port()"):
+                    ssh_switch.disable_port(port="Ethernet1/99")
+
+    def test_batch_error_mapped_to_call_with_skipped_transition(self, ssh_switch):
+        ssh_switch._connection._skip_redundant_transitions = True
+        ssh_switch._connection._fast_config_window = 10
+        remote = ssh_switch._connection._connection
+        remote.base_prompt = "switch"
+        remote.normalize_cmd.side_effect = lambda command: f"{command}\n"
+        remote.normalize_linefeeds.side_effect = lambda output: output
+        remote.strip_ansi_escape_codes.side_effect = lambda output: output
+        remote.read_until_pattern.return_value = (
+            "vlan 10\nswitch(config-vlan)# vlan 4097\n% Invalid value\nswitch(config-vlan)# "
+        )
+        ssh_switch._connection.cli_mode.reset(CliMode.CONFIG)
+        with pytest.raises(SwitchBatchException, match=r"second\(\).*vlan 4097"):
+            with ssh_switch.batch() as batch:
+                with batch.origin("first()"):
+                    ssh_switch._connection.send_command_list(["configure terminal", "vlan 10"])
+                with batch.origin("second()"):
+                    ssh_switch._connection.send_command_list(["vlan 4097"])
+
+    def test_batch_error_of_pushed_file_names_all_calls(self, ssh_switch, mocker):
+        mocker.patch("mfd_switchmanagement.connections.ssh.SCPClient")
+        ssh_switch._connection._file_transfer_threshold = 3
+        remote = ssh_switch._connection._connection
+        remote.device_type = "cisco_nxos"
+        remote.remote_conn.transport.open_session.return_value.recv.return_value = b""
+        remote.send_config_set.return_value = "% Invalid command at line 4"
+        with pytest.raises(SwitchBatchException, match=r"one of first\(\), second\(\)"):
+            with ssh_switch.batch() as batch:
+                with batch.origin("first()"):
+                    ssh_switch._connection.send_command_list(["configure terminal", "vlan 10"])
+                with batch.origin("second()"):
+                    ssh_switch._connection.send_command_list(["vlan 20", "vlan 4097"])
+
+    def test_batch_api_one_request(self, api_switch, mocker):
+        send_command_list = mocker.patch.object(
+            CiscoAPIConnection, "send_command_list", autospec=True, side_effect=CiscoAPIConnection.send_command_list
+        )
+        post = mocker.patch("requests.Session.post")
+        post.return_value.status_code = 200
+        post.return_value.json.return_value = [{"result": None, "id": 1}]
+        post.return_value.content = json.dumps(post.return_value.json.return_value).encode()
+        with api_switch.batch():
+            api_switch.shutdown(shutdown=False, port="Eth1/1")
+            api_switch.shutdown(shutdown=False, port="Eth1/2")
+        post.assert_called_once()
+        assert send_command_list.call_count == 3
+
+    def test_batch_api_error_mapped_to_call(self, api_switch, mocker):
+        post = mocker.patch("requests.Session.post")
+        post.return_value.status_code = 200
+        post.return_value.json.return_value = [
+            {"result": None, "id": 4},
+            {"error": {"message": "Input CLI command error", "data": {"msg": ""}}, "id": 5},
+        ]
+        post.return_value.content = json.dumps(post.return_value.json.return_value).encode()
+        with pytest.raises(SwitchBatchException, match="Eth1/2") as error:
+            with api_switch.batch():
+                api_switch.shutdown(shutdown=False, port="Eth1/1")
+                api_switch.shutdown(shutdown=False, port="Eth1/2")
+        assert isinstance(error.value.__cause__, SwitchCommandException)
@@ -0,0 +1,192 @@
+# Copyright (C) 2025 Intel Corporation
+# SPDX-License-Identifier: MIT
+import socket
+import stat
+import tempfile
+import threading
+import time
+from functools import partial
+from pathlib import Path
+
+import pytest
+from netmiko import Netmiko
+
+from mfd_switchmanagement.connections.base import BaseSwitchConnection
+from mfd_switchmanagement.connections.broker import BrokeredSwitchConnection, SwitchBroker
+from mfd_switchmanagement.connections.ssh import SSHSwitchConnection
+from mfd_switchmanagement.exceptions import SwitchCommandException, SwitchConnectionException
+
+
+class FakeSwitchConnection(BaseSwitchConnection):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.params = kwargs
+        self.sent = []
+
+    def connect(self):
+        return None
+
+    def send_command(self, command):
+        with self.command_lock:
+            self.sent.append(command)
+            time.sleep(0.005)
+            return f"output of {command}"
+
+    def send_command_expect(self, command, prompt):
+        return self.send_command(command)
+
+    def send_command_list(self, commands):
+        with self.command_lock:
+            self.sent.extend(commands)
+            return "\n".join(commands)
+
+    def send_configuration(self, commands):
+        return self.send_command_list(commands)
+
+    def _send_batch(self, commands, configuration=False):
+        for index, command in enumerate(commands):
+            if command.startswith("bad"):
+                raise SwitchCommandException(f"% Invalid command: {command}", command_index=index)
+        self.send_command_list(commands)
+
+    def disconnect(self):
+        pass
+
+
+def serve(connection_type):
+    # short path, Unix socket path length is limited
+    socket_path = Path(tempfile.mkdtemp()) / "broker.sock"
+    broker = SwitchBroker(socket_path=socket_path, connection_type=connection_type)
+    thread = threading.Thread(target=broker.serve_forever, kwargs={"poll_interval": 0.05}, daemon=True)
+    thread.start()
+    yield broker
+    broker.shutdown()
+    broker.server_close()
+    thread.join()
+
+
+class TestSwitchBroker:
+    @pytest.fixture
+    def broker(self):
+        yield from serve(FakeSwitchConnection)
+
+    @pytest.fixture
+    def client(self, broker):
+        client = BrokeredSwitchConnection(
+            ip="10.10.10.10", username="root", password="***", broker_socket=broker._socket_path
+        )
+        yield client
+        client.disconnect()
+
+    def test_send_command(self, client, broker):
+        assert client.send_command("show version") == "output of show version"
+        assert client.send_command_list(["configure terminal", "vlan 10"]) == "configure terminal\nvlan 10"
+        assert broker.connections[0].sent == ["show version", "configure terminal", "vlan 10"]
+        assert broker.connections[0].params["password"] == "***"
+
+    def test_clients_share_connection(self, client, broker):
+        other = BrokeredSwitchConnection(
+            ip="10.10.10.10", username="root", password="***", broker_socket=broker._socket_path
+        )
+        other.send_command("show clock")
+        client.send_command("show clock")
+        other.disconnect()
+        assert len(broker.connections) == 1
+        assert broker.connections[0].sent == ["show clock", "show clock"]
+
+    def test_broker_not_running(self, tmp_path):
+        with pytest.raises(SwitchConnectionException):
+            BrokeredSwitchConnection(ip="10.10.10.10", broker_socket=tmp_path / "missing.sock")
+
+    def test_unsupported_method(self, client):
+        with pytest.raises(SwitchConnectionException, match="not supported"):
+            client._request("disconnect")
+
+    def test_command_exception_keeps_index(self, client):
+        with pytest.raises(SwitchCommandException) as exception:
+            client._send_batch(["vlan 10", "bad command"])
+        assert exception.value.command_index == 1
+
+    def test_lock_held_across_clients(self, client, broker):
+        other = BrokeredSwitchConnection(
+            ip="10.10.10.10", username="root", password="***", broker_socket=broker._socket_path
+        )
+        with client.command_lock:
+            thread = threading.Thread(target=other.send_command, args=("show clock",))
+            thread.start()
+            client.send_command("no sh")
+            client.send_command("no sh")
+            time.sleep(0.02)
+            assert broker.connections[0].sent == ["no sh", "no sh"]
+        thread.join()
+        other.disconnect()
+        assert broker.connections[0].sent == ["no sh", "no sh", "show clock"]
+
+    def test_lock_acquire_timeout_and_non_blocking(self, client, broker):
+        other = BrokeredSwitchConnection(
+            ip="10.10.10.10", username="root", password="***", broker_socket=broker._socket_path
+        )
+        with client.command_lock:
+            assert other.command_lock.acquire(timeout=0.05) is False
+            assert other.command_lock.acquire(blocking=False) is False
+            assert other.command_lock._owner is None
+        assert other.command_lock.acquire(timeout=1) is True
+        other.command_lock.release()
+        assert client.command_lock.acquire(blocking=False) is True
+        client.command_lock.release()
+        other.disconnect()
+
+    def test_lock_released_when_client_disconnects(self, client, broker):
+        client.command_lock.acquire()
+        client.disconnect()
+        other = BrokeredSwitchConnection(
+            ip="10.10.10.10", username="root", password="***", broker_socket=broker._socket_path
+        )
+        assert other.send_command("show clock") == "output of show clock"
+        other.disconnect()
+
+    def test_socket_accessible_only_for_user(self, broker):
+        assert stat.S_IMODE(broker._socket_path.stat().st_mode) & 0o077 == 0
+
+    def test_running_broker_socket_is_not_removed(self, broker):
+        with pytest.raises(SwitchConnectionException, match="already running"):
+            SwitchBroker(socket_path=broker._socket_path, connection_type=FakeSwitchConnection)
+        client = BrokeredSwitchConnection(ip="10.10.10.10", broker_socket=broker._socket_path)
+        assert client.send_command("show clock") == "output of show clock"
+        client.disconnect()
+
+    def test_stale_socket_is_removed(self):
+        socket_path = Path(tempfile.mkdtemp()) / "broker.sock"
+        stale = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        stale.bind(str(socket_path))
+        stale.close()
+        broker = SwitchBroker(socket_path=socket_path, connection_type=FakeSwitchConnection)
+        broker.server_close()
+        assert not socket_path.exists()
+
+    def test_other_credentials_do_not_share_connection(self, client, broker):
+        other = BrokeredSwitchConnection(
+            ip="10.10.10.10", username="root", password="other", broker_socket=broker._socket_path
+        )
+        other.send_command("show clock")
+        client.send_command("show clock")
+        other.disconnect()
+        assert len(broker.connections) == 2
+        assert sorted(connection.params["password"] for connection in broker.connections) == ["***", "other"]
+
+    def test_clients_share_ssh_session(self, fake_ssh_server, mocker):
+        mocker.patch("mfd_switchmanagement.connections.ssh.Netmiko", partial(Netmiko, port=fake_ssh_server.port))
+        for broker in serve(SSHSwitchConnection):
+            params = dict(
+                ip="127.0.0.1",
+                username="admin",
+                password="password",
+                device_type="cisco_nxos",
+                broker_socket=broker._socket_path,
+            )
+            clients = [BrokeredSwitchConnection(**params) for _ in range(2)]
+            for client in clients:
+                assert "NX-OS" in client.send_command("show version")
+                client.disconnect()
+        assert fake_ssh_server.sessions == 1
+        assert fake_ssh_server.commands.count("show version") == 2
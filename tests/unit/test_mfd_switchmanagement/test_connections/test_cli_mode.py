@@ -0,0 +1,100 @@
+# Copyright (C) 2025 Intel Corporation
+# SPDX-License-Identifier: MIT
+import pytest
+
+from mfd_switchmanagement.connections.cli_mode import CliModeTracker
+from mfd_switchmanagement.data_structures import CliMode
+
+
+class TestCliModeTracker:
+    @pytest.fixture
+    def tracker(self):
+        return CliModeTracker(mode=CliMode.EXEC)
+
+    @pytest.mark.parametrize(
+        "command",
+        [
+            "interface ethernet 1/1",
+            "int Eth1/1",
+            "interface port-channel 10",
+            "interface range te 0/1 , te 0/2",
+            "interface range ethernet 1/1/1-1/1/4,1/1/6",
+        ],
+    )
+    def test_enters_interface(self, command):
+        assert CliModeTracker.enters_interface(command)
+
+    @pytest.mark.parametrize(
+        "command",
+        [
+            "interface ethernet 1/1 shutdown",
+            "interface ethernet 1/1 traffic-class 3 dcb ets wrr 20",
+            "show interface Eth1/1 error-correction",
+        ],
+    )
+    def test_not_enters_interface(self, command):
+        assert not CliModeTracker.enters_interface(command)
+
+    def test_filter_repeated_interface_operation(self, tracker):
+        commands = ["configure terminal", "interface Eth1/1", "no shutdown"]
+        assert tracker.filter(commands) == commands
+        assert tracker.mode is CliMode.CONFIG
+        assert tracker.interface == "Eth1/1"
+        assert tracker.filter(["configure terminal", "interface Eth1/1", "shutdown"]) == ["shutdown"]
+
+    def test_filter_other_interface(self, tracker):
+        tracker.filter(["configure terminal", "interface Eth1/1", "no shutdown"])
+        assert tracker.filter(["configure terminal", "interface Eth1/2", "shutdown"]) == [
+            "interface Eth1/2",
+            "shutdown",
+        ]
+
+    def test_filter_after_submode(self, tracker):
+        tracker.filter(["configure terminal", "interface Eth1/1", "vlan 10", "interface Eth1/1"])
+        assert tracker.interface == "Eth1/1"
+        tracker.update("vlan 20")
+        assert tracker.interface is None
+        assert tracker.filter(["interface Eth1/1"]) == ["interface Eth1/1"]
+
+    def test_filter_one_line_interface_command_not_dropped(self, tracker):
+        commands = ["conf t", "interface ethernet 1/1 shutdown"]
+        assert tracker.filter(commands) == commands
+        assert tracker.filter(["interface ethernet 1/1 shutdown"]) == ["interface ethernet 1/1 shutdown"]
+
+    def test_exit_and_end(self, tracker):
+        tracker.filter(["configure terminal", "interface Eth1/1"])
+        tracker.update("exit")
+        assert tracker.mode is CliMode.CONFIG
+        assert tracker.context is None
+        tracker.update("exit")
+        assert tracker.mode is CliMode.EXEC
+        tracker.filter(["configure terminal", "interface Eth1/1"])
+        tracker.update("end")
+        assert tracker.mode is CliMode.EXEC
+        assert tracker.context is None
+
+    def test_unknown_mode_keeps_everything(self):
+        tracker = CliModeTracker()
+        commands = ["interface Eth1/1", "configure terminal", "interface Eth1/1"]
+        assert tracker.filter(commands) == commands
+
+    def test_no_interface_leaves_context(self, tracker):
+        tracker.filter(["configure terminal", "interface Eth1/1"])
+        tracker.update("no interface Eth1/1")
+        assert tracker.interface is None
+
+    def test_global_command_leaves_interface_context(self, tracker):
+        tracker.filter(["configure terminal", "interface Eth1/1", "no shutdown"])
+        assert tracker.interface == "Eth1/1"
+        tracker.update("ip route 0.0.0.0/0 10.10.10.1")
+        assert tracker.context is None
+        commands = ["configure terminal", "interface Eth1/1", "shutdown"]
+        assert tracker.filter(commands) == ["interface Eth1/1", "shutdown"]
+
+    @pytest.mark.parametrize(
+        "context, command",
+        [("vlan 10", "name test"), ("vlan 10", "vlan 10"), ("class-map type qos c1", "match cos 3")],
+    )
+    def test_context_after_submode_command(self, tracker, context, command):
+        tracker.filter(["configure terminal", context, command])
+        assert tracker.context == (context if command.startswith(("name", "vlan")) else None)
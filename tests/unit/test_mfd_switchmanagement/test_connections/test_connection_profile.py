@@ -0,0 +1,49 @@
+# Copyright (C) 2025 Intel Corporation
+# SPDX-License-Identifier: MIT
+import pytest
+
+from mfd_switchmanagement.connections.connection_profile import ConnectionProfile, ConnectionProfileCache
+
+
+class TestConnectionProfileCache:
+    @pytest.fixture
+    def cache(self, tmp_path):
+        return ConnectionProfileCache(path=tmp_path / "cache" / "connection_profiles.json", ttl=60)
+
+    @pytest.fixture
+    def profile(self):
+        return ConnectionProfile(base_prompt="switch01", paging_command="terminal length 0", width_command=None)
+
+    def test_get_not_cached(self, cache):
+        assert cache.get("cisco_nxos", "10.10.10.10") is None
+
+    def test_set_and_get(self, cache, profile):
+        cache.set("cisco_nxos", "10.10.10.10", profile)
+        assert cache.get("cisco_nxos", "10.10.10.10") == profile
+
+    def test_prompt_is_learned_per_ip(self, cache, profile):
+        cache.set("cisco_nxos", "10.10.10.10", profile)
+        assert cache.get("cisco_nxos", "10.10.10.11") is None
+        cache.set("cisco_nxos", "10.10.10.11", ConnectionProfile("switch02", "terminal length 0"))
+        assert cache.get("cisco_nxos", "10.10.10.10").base_prompt == "switch01"
+        assert cache.get("cisco_nxos", "10.10.10.11").base_prompt == "switch02"
+
+    def test_expired_entry(self, cache, profile, mocker):
+        time_mock = mocker.patch("mfd_switchmanagement.connections.device_type_cache.time.time", return_value=1000)
+        cache.set("cisco_nxos", "10.10.10.10", profile)
+        time_mock.return_value = 1061
+        assert cache.get("cisco_nxos", "10.10.10.10") is None
+
+    def test_invalidate_single_ip(self, cache, profile):
+        cache.set("cisco_nxos", "10.10.10.10", profile)
+        cache.set("cisco_nxos", "10.10.10.11", profile)
+        cache.invalidate("cisco_nxos", "10.10.10.10")
+        assert cache.get("cisco_nxos", "10.10.10.10") is None
+        assert cache.get("cisco_nxos", "10.10.10.11") == profile
+
+    def test_invalidate_all(self, cache, profile):
+        cache.set("cisco_nxos", "10.10.10.10", profile)
+        cache.set("dell_os10", "10.10.10.11", profile)
+        cache.invalidate()
+        assert cache.get("cisco_nxos", "10.10.10.10") is None
+        assert cache.get("dell_os10", "10.10.10.11") is None
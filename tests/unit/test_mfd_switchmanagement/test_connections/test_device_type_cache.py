@@ -0,0 +1,47 @@
+# Copyright (C) 2025 Intel Corporation
+# SPDX-License-Identifier: MIT
+import pytest
+
+from mfd_switchmanagement.connections.device_type_cache import DeviceTypeCache
+
+
+class TestDeviceTypeCache:
+    @pytest.fixture
+    def cache(self, tmp_path):
+        return DeviceTypeCache(path=tmp_path / "cache" / "device_types.json", ttl=60)
+
+    def test_get_not_cached(self, cache):
+        assert cache.get("10.10.10.10") is None
+
+    def test_set_and_get(self, cache):
+        cache.set("10.10.10.10", "cisco_nxos")
+        assert cache.get("10.10.10.10") == "cisco_nxos"
+
+    def test_persisted_between_instances(self, cache, tmp_path):
+        cache.set("10.10.10.10", "arista_eos")
+        assert DeviceTypeCache(path=tmp_path / "cache" / "device_types.json").get("10.10.10.10") == "arista_eos"
+
+    def test_expired_entry(self, cache, mocker):
+        time_mock = mocker.patch("mfd_switchmanagement.connections.device_type_cache.time.time", return_value=1000)
+        cache.set("10.10.10.10", "cisco_nxos")
+        time_mock.return_value = 1061
+        assert cache.get("10.10.10.10") is None
+
+    def test_invalidate_single_ip(self, cache):
+        cache.set("10.10.10.10", "cisco_nxos")
+        cache.set("10.10.10.11", "dell_os10")
+        cache.invalidate("10.10.10.10")
+        assert cache.get("10.10.10.10") is None
+        assert cache.get("10.10.10.11") == "dell_os10"
+
+    def test_invalidate_all(self, cache):
+        cache.set("10.10.10.10", "cisco_nxos")
+        cache.set("10.10.10.11", "dell_os10")
+        cache.invalidate()
+        assert cache.get("10.10.10.10") is None
+        assert cache.get("10.10.10.11") is None
+
+    def test_corrupted_file_is_empty_cache(self, tmp_path):
+        path = tmp_path / "device_types.json"
+        path.write_text("not a json")
+        assert DeviceTypeCache(path=path).get("10.10.10.10") is None
@@ -0,0 +1,76 @@
+# Copyright (C) 2025 Intel Corporation
+# SPDX-License-Identifier: MIT
+import pytest
+
+from mfd_switchmanagement.connections.file_transfer import (
+    CopyConfigFileHandler,
+    JunosConfigFileHandler,
+    get_config_file_handler,
+)
+from mfd_switchmanagement.data_structures import CliMode
+
+
+class TestConfigFileHandlers:
+    @pytest.mark.parametrize(
+        "device_type, handler_type",
+        [
+            ("cisco_nxos", CopyConfigFileHandler),
+            ("arista_eos_ssh", CopyConfigFileHandler),
+            ("dell_os10", CopyConfigFileHandler),
+            ("juniper_junos", JunosConfigFileHandler),
+        ],
+    )
+    def test_get_config_file_handler(self, device_type, handler_type):
+        assert isinstance(get_config_file_handler(device_type), handler_type)
+
+    @pytest.mark.parametrize("device_type", [None, "dell_force10", "mellanox_mlnxos"])
+    def test_get_config_file_handler_not_supported(self, device_type):
+        assert get_config_file_handler(device_type) is None
+
+    def test_copy_handler_reenters_context(self):
+        handler = get_config_file_handler("cisco_nxos")
+        plan = handler.build(["configure terminal", "interface Eth1/1", "no shutdown"], False, CliMode.EXEC)
+        assert plan.content == "interface Eth1/1\nno shutdown\n"
+        assert plan.apply_commands == [
+            "copy bootflash:mfd_config.cfg running-config",
+            "configure terminal",
+            "interface Eth1/1",
+        ]
+
+    def test_copy_handler_ends_in_exec(self):
+        handler = get_config_file_handler("arista_eos")
+        plan = handler.build(["conf t", "vlan 10", "end"], False, CliMode.CONFIG)
+        assert plan.lines == ["vlan 10"]
+        assert plan.apply_commands == ["end", "copy flash:mfd_config.cfg running-config"]
+
+    def test_copy_handler_configuration(self):
+        handler = get_config_file_handler("dell_os10")
+        plan = handler.build(["interface vlan 10", "no shutdown"], True, CliMode.EXEC)
+        assert plan.lines == ["interface vlan 10", "no shutdown"]
+        assert plan.apply_commands == ["copy home://mfd_config.cfg running-configuration"]
+
+    def test_copy_handler_requires_configure(self):
+        handler = get_config_file_handler("cisco_nxos")
+        assert handler.build(["no shutdown", "end"], False, CliMode.CONFIG) is None
+
+    def test_junos_handler(self):
+        handler = get_config_file_handler("juniper_junos")
+        plan = handler.build(["edit", "set interfaces xe-0/0/1 mtu 9216", "commit", "exit"], False, CliMode.EXEC)
+        assert plan.lines == ["set interfaces xe-0/0/1 mtu 9216"]
+        assert plan.apply_commands == ["edit", "load set /var/tmp/mfd_config.cfg", "commit", "exit"]
+
+    def test_junos_handler_not_set_commands(self):
+        handler = get_config_file_handler("juniper_junos")
+        assert handler.build(["edit", "commit", "exit"], False, CliMode.EXEC) is None
+
+    @pytest.mark.parametrize(
+        "device_type, delete_command",
+        [
+            ("cisco_nxos", "delete bootflash:mfd_config.cfg no-prompt"),
+            ("arista_eos", "delete flash:mfd_config.cfg"),
+            ("dell_os10", "delete home://mfd_config.cfg"),
+            ("juniper_junos", "file delete /var/tmp/mfd_config.cfg"),
+        ],
+    )
+    def test_delete_command(self, device_type, delete_command):
+        assert get_config_file_handler(device_type).delete_command == delete_command
@@ -0,0 +1,65 @@
+# Copyright (C) 2025 Intel Corporation
+# SPDX-License-Identifier: MIT
+import pytest
+
+from mfd_switchmanagement.connections.latency import LatencyTracker
+
+
+class TestLatencyTracker:
+    @pytest.fixture
+    def tracker(self):
+        return LatencyTracker(min_samples=3, timeout_factor=4, min_timeout=5, max_timeout=600)
+
+    @pytest.mark.parametrize(
+        "command, command_class",
+        [
+            ("show interface ethernet 1/1", "show interface ethernet"),
+            ("show interface ethernet1/1 brief", "show interface"),
+            ("show running-config", "show running-config"),
+            ("show mac address-table address aa:bb:cc:dd:ee:ff", "show mac address-table"),
+            ("show ip int brief", "show ip int"),
+            ("  SHOW VERSION  ", "show version"),
+        ],
+    )
+    def test_command_class(self, command, command_class):
+        assert LatencyTracker.command_class(command) == command_class
+
+    def test_no_timeout_without_enough_samples(self, tracker):
+        tracker.record("show version", 0.1)
+        tracker.record("show version", 0.1)
+        assert tracker.read_timeout("show version") is None
+
+    def test_fast_command_gets_minimal_timeout(self, tracker):
+        for _ in range(3):
+            tracker.record("show version", 0.1)
+        assert tracker.read_timeout("show version") == 5
+
+    def test_default_lower_bound_is_netmiko_read_timeout(self):
+        tracker = LatencyTracker()
+        for _ in range(3):
+            tracker.record("show version", 0.1)
+        assert tracker.read_timeout("show version") == 10
+
+    def test_requested_lower_bound(self, tracker):
+        for _ in range(3):
+            tracker.record("show version", 0.1)
+        assert tracker.read_timeout("show version", min_timeout=30) == 30
+
+    def test_slow_command_gets_longer_timeout(self, tracker):
+        for duration in (20, 25, 30):
+            tracker.record("show running-config", duration)
+        assert tracker.read_timeout("show running-config") == 120
+
+    def test_timeout_extends_read_timeout(self, tracker):
+        tracker.record("show tech-support", 10, timed_out=True)
+        assert tracker.read_timeout("show tech-support") == 40
+
+    def test_statistics(self, tracker):
+        tracker.record("show interface ethernet 1/1", 1.0)
+        tracker.record("show interface ethernet 1/2", 2.0)
+        statistics = tracker.statistics["show interface ethernet"]
+        assert statistics.count == 2
+        assert statistics.ewma == pytest.approx(1.2)
+        assert statistics.p99 == 2.0
+        assert statistics.last == 2.0
+        assert statistics.timeouts == 0
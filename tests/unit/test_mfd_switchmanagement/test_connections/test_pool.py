@@ -0,0 +1,166 @@
+# Copyright (C) 2025 Intel Corporation
+# SPDX-License-Identifier: MIT
+import pytest
+
+from mfd_switchmanagement.base import Switch
+from mfd_switchmanagement.connections.pool import SSHConnectionPool, get_connection_pool
+from mfd_switchmanagement.connections.ssh import SSHSwitchConnection
+from mfd_switchmanagement.connections.vendors.cisco_api import CiscoAPIConnection
+
+
+class TestSSHConnectionPool:
+    @pytest.fixture
+    def pool(self):
+        return SSHConnectionPool(max_idle_time=300)
+
+    @pytest.fixture
+    def connection_type(self, mocker):
+        def create_connection(**kwargs):
+            connection = mocker.create_autospec(SSHSwitchConnection, instance=True)
+            connection._connection = mocker.Mock()
+            return connection
+
+        connection_type = mocker.Mock(side_effect=create_connection)
+        connection_type.__qualname__ = "FakeSSHSwitchConnection"
+        return connection_type
+
+    def test_acquire_miss_creates_connection(self, pool, connection_type):
+        connection = pool.acquire(connection_type=connection_type, ip="10.10.10.10", username="root")
+        connection_type.assert_called_once_with(ip="10.10.10.10", username="root")
+        assert connection._pool_key == pool.make_key("10.10.10.10", "root", connection_type=connection_type)
+        assert pool.statistics.misses == 1
+        assert pool.statistics.hits == 0
+
+    def test_acquire_hit_reuses_released_connection(self, pool, connection_type):
+        connection = pool.acquire(connection_type=connection_type, ip="10.10.10.10", username="root")
+        connection._check_connection.return_value = True
+        pool.release(connection)
+        assert pool.statistics.idle == 1
+        assert pool.acquire(connection_type=connection_type, ip="10.10.10.10", username="root") is connection
+        assert connection_type.call_count == 1
+        assert pool.statistics.hits == 1
+        assert pool.statistics.idle == 0
+
+    def test_acquire_different_key_is_miss(self, pool, connection_type):
+        connection = pool.acquire(connection_type=connection_type, ip="10.10.10.10", username="root")
+        pool.release(connection)
+        other = pool.acquire(connection_type=connection_type, ip="10.10.10.10", username="admin")
+        assert other is not connection
+        assert pool.statistics.misses == 2
+
+    def test_acquire_different_password_is_miss(self, pool, connection_type):
+        connection = pool.acquire(connection_type=connection_type, ip="10.10.10.10", username="root", password="a")
+        connection._check_connection.return_value = True
+        pool.release(connection)
+        other = pool.acquire(connection_type=connection_type, ip="10.10.10.10", username="root", password="b")
+        assert other is not connection
+        assert "a" not in connection._pool_key
+
+    def test_acquire_different_options_is_miss(self, pool, connection_type):
+        connection = pool.acquire(connection_type=connection_type, ip="10.10.10.10", keepalive_interval=60)
+        connection._check_connection.return_value = True
+        pool.release(connection)
+        assert pool.acquire(connection_type=connection_type, ip="10.10.10.10") is not connection
+        assert pool.acquire(connection_type=connection_type, ip="10.10.10.10", keepalive_interval=60) is connection
+
+    def test_make_key_compares_object_options_by_identity(self, pool):
+        governor = object()
+        assert pool.make_key("10.10.10.10", options={"governor": governor}) == pool.make_key(
+            "10.10.10.10", options={"governor": governor}
+        )
+        assert pool.make_key("10.10.10.10", options={"governor": governor}) != pool.make_key(
+            "10.10.10.10", options={"governor": object()}
+        )
+
+    def test_acquire_reuses_not_connected_lazy_connection(self, pool, connection_type):
+        connection = pool.acquire(connection_type=connection_type, ip="10.10.10.10", lazy_connect=True)
+        connection._connection = None
+        pool.release(connection)
+        assert pool.acquire(connection_type=connection_type, ip="10.10.10.10", lazy_connect=True) is connection
+        connection._check_connection.assert_not_called()
+        assert pool.statistics.evictions == 0
+
+    def test_make_key_contains_connection_type(self, pool):
+        class OtherSSHSwitchConnection(SSHSwitchConnection):
+            pass
+
+        assert pool.make_key("10.10.10.10") != pool.make_key(
+            "10.10.10.10", connection_type=OtherSSHSwitchConnection
+        )
+
+    def test_release_twice_is_ignored(self, pool, connection_type):
+        connection = pool.acquire(connection_type=connection_type, ip="10.10.10.10")
+        connection._check_connection.return_value = True
+        pool.release(connection)
+        pool.release(connection)
+        assert pool.statistics.idle == 1
+        assert pool.acquire(connection_type=connection_type, ip="10.10.10.10") is connection
+        assert pool.acquire(connection_type=connection_type, ip="10.10.10.10") is not connection
+
+    def test_acquire_drops_dead_connection(self, pool, connection_type):
+        connection = pool.acquire(connection_type=connection_type, ip="10.10.10.10")
+        connection._check_connection.return_value = None
+        pool.release(connection)
+        other = pool.acquire(connection_type=connection_type, ip="10.10.10.10")
+        assert other is not connection
+        connection.disconnect.assert_called_once()
+        assert pool.statistics.evictions == 1
+
+    def test_evict_idle(self, pool, connection_type, mocker):
+        monotonic = mocker.patch("mfd_switchmanagement.connections.pool.time.monotonic", return_value=100)
+        connection = pool.acquire(connection_type=connection_type, ip="10.10.10.10")
+        pool.release(connection)
+        monotonic.return_value = 401
+        pool.evict_idle()
+        connection.disconnect.assert_called_once()
+        assert pool.statistics.idle == 0
+
+    def test_release_over_limit_drops_connection(self, connection_type):
+        pool = SSHConnectionPool(max_idle_per_key=1)
+        first = pool.acquire(connection_type=connection_type, ip="10.10.10.10")
+        second = pool.acquire(connection_type=connection_type, ip="10.10.10.10")
+        pool.release(first)
+        pool.release(second)
+        second.disconnect.assert_called_once()
+        assert pool.statistics.idle == 1
+
+    def test_drop_stops_keepalive(self, mocker):
+        mocker.patch.object(SSHSwitchConnection, "_open_session")
+        mocker.patch.object(SSHSwitchConnection, "_check_connection", return_value=True)
+        pool = SSHConnectionPool(max_idle_per_key=0)
+        connection = pool.acquire(
+            connection_type=SSHSwitchConnection, ip="10.10.10.10", device_type="cisco_nxos", keepalive_interval=0.05
+        )
+        assert connection._keepalive_thread.is_alive()
+        pool.release(connection)
+        assert not connection._keepalive_thread.is_alive()
+        connection._connection.disconnect.assert_called_once()
+
+    def test_release_foreign_connection(self, pool, mocker):
+        with pytest.raises(ValueError):
+            pool.release(mocker.Mock(spec=[]))
+
+    def test_clear(self, pool, connection_type):
+        connection = pool.acquire(connection_type=connection_type, ip="10.10.10.10")
+        pool.release(connection)
+        pool.clear()
+        connection.disconnect.assert_called_once()
+        assert pool.statistics.idle == 0
+
+    def test_get_connection_pool_is_shared(self):
+        assert get_connection_pool() is get_connection_pool()
+
+    def test_switch_uses_pool(self, pool, mocker):
+        connection = mocker.create_autospec(SSHSwitchConnection, instance=True)
+        mocker.patch.object(pool, "acquire", return_value=connection)
+        mocker.patch.object(pool, "release")
+        switch = Switch(ip="10.10.10.10", username="root", connection_pool=pool)
+        assert switch._connection is connection
+        switch.disconnect()
+        switch.disconnect()
+        pool.release.assert_called_once_with(connection)
+        connection.disconnect.assert_not_called()
+
+    def test_switch_pool_not_supported_for_api(self, pool):
+        with pytest.raises(ValueError):
+            Switch(ip="10.10.10.10", connection_type=CiscoAPIConnection, connection_pool=pool)
@@ -0,0 +1,88 @@
+# Copyright (C) 2025 Intel Corporation
+# SPDX-License-Identifier: MIT
+import asyncio
+import socket
+
+import pytest
+
+from mfd_switchmanagement import ReachabilityChecker
+from mfd_switchmanagement.connections.ssh import SSHSwitchConnection
+from mfd_switchmanagement.exceptions import SwitchConnectionException
+
+
+@pytest.fixture
+def open_port():
+    server = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    server.bind(("127.0.0.1", 0))
+    server.listen(16)
+    yield server.getsockname()[1]
+    server.close()
+
+
+@pytest.fixture
+def closed_port():
+    client = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    client.bind(("127.0.0.1", 0))
+    port = client.getsockname()[1]
+    client.close()
+    return port
+
+
+class TestReachabilityChecker:
+    def test_reachable_by_any_port(self, open_port, closed_port):
+        checker = ReachabilityChecker(ports=(closed_port, open_port), timeout=0.5)
+        assert checker.check(["127.0.0.1"]) == {"127.0.0.1": True}
+        assert checker.states[("127.0.0.1", open_port)].reachable is True
+        assert checker.states[("127.0.0.1", closed_port)].reachable is False
+        assert checker.unreachable == ()
+
+    def test_unreachable(self, closed_port):
+        checker = ReachabilityChecker(ports=(closed_port,), timeout=0.5)
+        assert checker.is_reachable("127.0.0.1") is False
+        assert checker.unreachable == ("127.0.0.1",)
+
+    def test_cached_state(self, closed_port, mocker):
+        checker = ReachabilityChecker(ports=(closed_port,), timeout=0.5)
+        checker.check(["127.0.0.1"])
+        probe = mocker.patch.object(checker, "_probe_port")
+        checker.check(["127.0.0.1"])
+        probe.assert_not_called()
+
+    def test_expired_state_is_probed_again(self, open_port, closed_port):
+        checker = ReachabilityChecker(ports=(closed_port,), timeout=0.5, ttl=0)
+        assert checker.is_reachable("127.0.0.1") is False
+        checker._ports = (open_port,)
+        assert checker.is_reachable("127.0.0.1") is True
+
+    def test_invalidate(self, closed_port):
+        checker = ReachabilityChecker(ports=(closed_port,), timeout=0.5)
+        checker.check(["127.0.0.1"])
+        checker.invalidate("127.0.0.1")
+        assert checker.states == {}
+
+    def test_check_in_running_event_loop(self, open_port):
+        checker = ReachabilityChecker(ports=(open_port,), timeout=0.5)
+
+        async def main():
+            return checker.check(["127.0.0.1"]), await checker.check_async(["127.0.0.1"])
+
+        assert asyncio.run(main()) == ({"127.0.0.1": True}, {"127.0.0.1": True})
+
+    def test_ports_passed_to_check(self, open_port, closed_port):
+        checker = ReachabilityChecker(ports=(open_port,), timeout=0.5)
+        assert checker.is_reachable("127.0.0.1", ports=(closed_port,)) is False
+        assert checker.is_reachable("127.0.0.1") is True
+        assert set(checker.states) == {("127.0.0.1", closed_port), ("127.0.0.1", open_port)}
+        assert checker.unreachable == ()
+
+    def test_connect_skipped_for_unreachable_switch(self, open_port, closed_port, mocker):
+        open_session = mocker.patch.object(SSHSwitchConnection, "_open_session")
+        mocker.patch.object(SSHSwitchConnection, "SERVICE_PORT", closed_port)
+        # other service of switch is reachable, but SSH port is closed
+        checker = ReachabilityChecker(ports=(open_port,), timeout=0.5)
+        with pytest.raises(SwitchConnectionException):
+            SSHSwitchConnection(
+                ip="127.0.0.1", username="root", password="***", device_type="cisco_nxos", reachability=checker
+            )
+        open_session.assert_not_called()
+        assert set(checker.states) == {("127.0.0.1", closed_port)}
@@ -1,12 +1,69 @@
 # Copyright (C) 2025 Intel Corporation
 # SPDX-License-Identifier: MIT
+from concurrent.futures import ThreadPoolExecutor
+import threading
+import time
+from functools import partial
+from ipaddress import ip_address
+from unittest.mock import call
+
 import pytest
-from netmiko import Netmiko
+from netmiko import Netmiko, NetmikoTimeoutException, ReadTimeout
+from mfd_switchmanagement.connections.connection_profile import ConnectionProfile, ConnectionProfileCache
 from mfd_switchmanagement.connections.ssh import SSHSwitchConnection
-from mfd_switchmanagement.exceptions import SwitchConnectionException
+from mfd_switchmanagement.data_structures import CliMode
+from mfd_switchmanagement.exceptions import SwitchCommandException, SwitchConnectionException, SwitchException
+from mfd_switchmanagement.utils.governor import CommandGovernor
 from mfd_common_libs import log_levels
 
 
+class FakeNetmiko:
+    RETURN = "\n"
+
+    def __init__(self, **kwargs):
+        self.kwargs = kwargs
+        self.base_prompt = ""
+        self.calls = []
+        self.global_delay_factor = kwargs["global_delay_factor"]
+
+    def establish_connection(self):
+        self.calls.append("establish_connection")
+
+    def session_preparation(self):
+        self._test_channel_read(pattern=r"[>#]")
+        self.set_base_prompt()
+        self.set_terminal_width(command="terminal width 511", pattern=r"terminal width 511")
+        self.disable_paging()
+
+    def _test_channel_read(self, pattern=None):
+        self.calls.append("_test_channel_read")
+
+    def set_base_prompt(self, pri_prompt_terminator="#", alt_prompt_terminator=">", delay_factor=1.0, pattern=None):
+        self.calls.append("set_base_prompt")
+        self.base_prompt = "switch01"
+
+    def set_terminal_width(self, command="", delay_factor=None, cmd_verify=False, pattern=None):
+        self.calls.append(command)
+
+    def disable_paging(self, command="terminal length 0", delay_factor=None, cmd_verify=True, pattern=None):
+        self.calls.append(command)
+
+    def write_channel(self, data):
+        self.calls.append(data)
+
+    def normalize_cmd(self, command):
+        return f"{command}\n"
+
+    def read_until_prompt(self, *args, **kwargs):
+        return f"{self.base_prompt}#"
+
+    def enable(self):
+        pass
+
+    def disconnect(self):
+        self.calls.append("disconnect")
+
+
 class TestSSHSwitchConnection:
     @pytest.fixture
     def ssh_connection(self, mocker):
@@ -137,3 +194,730 @@ class TestSSHSwitchConnection:
         ssh_connection._connection.exit_config_mode = mocker.Mock()
         ssh_connection.exit_port_configuration()
         ssh_connection._connection.exit_config_mode.assert_called_once()
+
+    def test_connect_uses_cached_device_type(self, ssh_connection, mocker):
+        ssh_detect = mocker.patch("mfd_switchmanagement.connections.ssh.SSHDetect")
+        netmiko = mocker.patch("mfd_switchmanagement.connections.ssh.Netmiko")
+        ssh_connection._device_type_cache = mocker.Mock()
+        ssh_connection._device_type_cache.get.return_value = "cisco_nxos"
+        ssh_connection.connect()
+        ssh_detect.assert_not_called()
+        assert netmiko.call_args.kwargs["device_type"] == "cisco_nxos"
+
+    def test_connect_auto_detect_stores_device_type(self, ssh_connection, mocker):
+        ssh_detect = mocker.patch("mfd_switchmanagement.connections.ssh.SSHDetect")
+        mocker.patch("mfd_switchmanagement.connections.ssh.Netmiko")
+        ssh_detect().autodetect.return_value = "SampleSwitch"
+        ssh_connection._device_type_cache = mocker.Mock()
+        ssh_connection._device_type_cache.get.return_value = None
+        ssh_connection.connect()
+        ssh_connection._device_type_cache.set.assert_called_once_with(ssh_connection._ip, "SampleSwitch")
+
+    def test_connect_cached_device_type_failure_falls_back_to_autodetect(self, ssh_connection, mocker):
+        ssh_detect = mocker.patch("mfd_switchmanagement.connections.ssh.SSHDetect")
+        ssh_detect().autodetect.return_value = "SampleSwitch"
+        netmiko = mocker.patch("mfd_switchmanagement.connections.ssh.Netmiko", side_effect=[ValueError, mocker.Mock()])
+        ssh_connection._device_type_cache = mocker.Mock()
+        ssh_connection._device_type_cache.get.side_effect = ["cisco_nxos", None]
+        ssh_connection.connect()
+        ssh_connection._device_type_cache.invalidate.assert_called_once_with(ssh_connection._ip)
+        assert netmiko.call_args.kwargs["device_type"] == "SampleSwitch"
+
+    def test_connect_cached_device_type_timeout_is_raised(self, ssh_connection, mocker):
+        ssh_detect = mocker.patch("mfd_switchmanagement.connections.ssh.SSHDetect")
+        mocker.patch("mfd_switchmanagement.connections.ssh.Netmiko", side_effect=NetmikoTimeoutException)
+        ssh_connection._device_type_cache = mocker.Mock()
+        ssh_connection._device_type_cache.get.return_value = "cisco_nxos"
+        with pytest.raises(SwitchException, match="Failure on connection"):
+            ssh_connection.connect()
+        ssh_detect.assert_not_called()
+        ssh_connection._device_type_cache.invalidate.assert_not_called()
+
+    def test_lazy_connect_postpones_connection(self, mocker):
+        connect = mocker.patch("mfd_switchmanagement.connections.ssh.SSHSwitchConnection.connect")
+        ssh_connection = SSHSwitchConnection(ip="10.10.10.10", username="root", lazy_connect=True)
+        connect.assert_not_called()
+        assert not ssh_connection.is_connected
+        mocker.patch.object(ssh_connection, "_check_connection", return_value=True)
+        ssh_connection.send_command("show version")
+        ssh_connection.send_command("show version")
+        connect.assert_called_once()
+        connect.return_value.send_command.assert_called_with("show version")
+
+    def test_lazy_connect_concurrent_first_calls_share_connect(self, mocker):
+        def slow_connect():
+            time.sleep(0.05)
+            return mocker.Mock()
+
+        connect = mocker.patch(
+            "mfd_switchmanagement.connections.ssh.SSHSwitchConnection.connect", side_effect=slow_connect
+        )
+        ssh_connection = SSHSwitchConnection(ip="10.10.10.10", username="root", lazy_connect=True)
+        mocker.patch.object(ssh_connection, "_check_connection", return_value=True)
+        threads = [threading.Thread(target=ssh_connection.send_command, args=("show version",)) for _ in range(5)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        connect.assert_called_once()
+
+    def test_lazy_connect_disconnect_without_connection(self, mocker):
+        connect = mocker.patch("mfd_switchmanagement.connections.ssh.SSHSwitchConnection.connect")
+        ssh_connection = SSHSwitchConnection(ip="10.10.10.10", username="root", lazy_connect=True)
+        ssh_connection.disconnect()
+        connect.assert_not_called()
+
+    def test__remote_skips_check_within_liveness_window(self, ssh_connection, mocker):
+        ssh_connection._connection = mocker.Mock()
+        ssh_connection._check_connection = mocker.Mock(return_value=True)
+        ssh_connection.send_command("show version")
+        ssh_connection.send_command("show version")
+        ssh_connection._check_connection.assert_called_once()
+
+    def test__remote_checks_after_liveness_window(self, ssh_connection, mocker):
+        ssh_connection._connection = mocker.Mock()
+        monotonic = mocker.patch("mfd_switchmanagement.connections.ssh.time.monotonic", return_value=100)
+        ssh_connection._check_connection = mocker.Mock(return_value=True)
+        ssh_connection.send_command("show version")
+        monotonic.return_value = 100 + ssh_connection._liveness_window
+        ssh_connection.send_command("show version")
+        assert ssh_connection._check_connection.call_count == 2
+
+    def test_send_command_retried_once_after_connection_drop(self, ssh_connection, mocker):
+        ssh_connection._connection = mocker.Mock()
+        ssh_connection._check_connection = mocker.Mock(side_effect=[True, False])
+        ssh_connection._reconnect = mocker.Mock()
+        ssh_connection._connection.send_command.side_effect = [OSError("Socket is closed"), "output"]
+        assert ssh_connection.send_command("show version") == "output"
+        ssh_connection._reconnect.assert_called_once()
+        assert ssh_connection._connection.send_command.call_count == 2
+
+    def test_send_command_error_on_alive_connection_not_retried(self, ssh_connection, mocker):
+        ssh_connection._connection = mocker.Mock()
+        ssh_connection._check_connection = mocker.Mock(return_value=True)
+        ssh_connection._reconnect = mocker.Mock()
+        ssh_connection._connection.send_command.side_effect = OSError("Search pattern never detected")
+        with pytest.raises(OSError):
+            ssh_connection.send_command("show version")
+        ssh_connection._reconnect.assert_not_called()
+        ssh_connection._connection.send_command.assert_called_once()
+
+    def test_connect_ssh_keepalive(self, ssh_connection, mocker):
+        netmiko = mocker.patch("mfd_switchmanagement.connections.ssh.Netmiko")
+        ssh_connection._device_type = "SampleSwitch"
+        ssh_connection._ssh_keepalive = 30
+        ssh_connection.connect()
+        assert netmiko.call_args.kwargs["keepalive"] == 30
+
+    def test_send_command_list_skips_redundant_transitions(self, ssh_connection, mocker):
+        ssh_connection._connection = mocker.Mock()
+        ssh_connection._check_connection = mocker.Mock(return_value=True)
+        ssh_connection._skip_redundant_transitions = True
+        ssh_connection.cli_mode.reset(CliMode.EXEC)
+        ssh_connection.send_command_list(["configure terminal", "interface Eth1/1", "no shutdown"])
+        ssh_connection.send_command_list(["configure terminal", "interface Eth1/1", "shutdown"])
+        ssh_connection._connection.send_config_set.assert_called_with(
+            ["shutdown"], exit_config_mode=False, enter_config_mode=False
+        )
+
+    def test_send_command_list_keeps_transitions_by_default(self, ssh_connection, mocker):
+        ssh_connection._connection = mocker.Mock()
+        ssh_connection._check_connection = mocker.Mock(return_value=True)
+        ssh_connection.cli_mode.reset(CliMode.EXEC)
+        commands = ["configure terminal", "interface Eth1/1", "shutdown"]
+        ssh_connection.send_command_list(commands)
+        ssh_connection.send_command_list(commands)
+        ssh_connection._connection.send_config_set.assert_called_with(
+            commands, exit_config_mode=False, enter_config_mode=False
+        )
+        assert ssh_connection.cli_mode.interface == "Eth1/1"
+
+    def test_send_configuration_returns_to_exec(self, ssh_connection, mocker):
+        ssh_connection._connection = mocker.Mock()
+        ssh_connection._check_connection = mocker.Mock(return_value=True)
+        ssh_connection.cli_mode.reset(CliMode.CONFIG)
+        ssh_connection.send_configuration(["no cdp enable"])
+        assert ssh_connection.cli_mode.mode is CliMode.EXEC
+
+    def test_send_command_list_pushed_as_file(self, ssh_connection, mocker):
+        scp_client = mocker.patch("mfd_switchmanagement.connections.ssh.SCPClient")
+        ssh_connection._connection = mocker.Mock(device_type="cisco_nxos")
+        ssh_connection._check_connection = mocker.Mock(return_value=True)
+        ssh_connection._file_transfer_threshold = 3
+        ssh_connection.cli_mode.reset(CliMode.EXEC)
+        ssh_connection._connection.send_config_set.return_value = ""
+        channel = ssh_connection._connection.remote_conn.transport.open_session.return_value
+        channel.recv.return_value = b""
+        ssh_connection.send_command_list(["configure terminal", "vlan 10", "vlan 20", "end"])
+        scp_client.return_value.__enter__.return_value.putfo.assert_called_once()
+        ssh_connection._connection.send_config_set.assert_called_once_with(
+            ["copy bootflash:mfd_config.cfg running-config"], exit_config_mode=False, enter_config_mode=False
+        )
+        channel.exec_command.assert_called_once_with("delete bootflash:mfd_config.cfg no-prompt")
+        channel.close.assert_called_once()
+
+    def test_send_command_list_pushed_file_error(self, ssh_connection, mocker):
+        mocker.patch("mfd_switchmanagement.connections.ssh.SCPClient")
+        ssh_connection._connection = mocker.Mock(device_type="cisco_nxos")
+        ssh_connection._check_connection = mocker.Mock(return_value=True)
+        ssh_connection._file_transfer_threshold = 3
+        ssh_connection.cli_mode.reset(CliMode.EXEC)
+        channel = ssh_connection._connection.remote_conn.transport.open_session.return_value
+        channel.recv.return_value = b""
+        ssh_connection._connection.send_config_set.return_value = (
+            "copy bootflash:mfd_config.cfg running-config\n% Invalid command at line 2"
+        )
+        with pytest.raises(SwitchCommandException, match="Invalid command at line 2") as exception:
+            ssh_connection.send_command_list(["configure terminal", "vlan 10", "vlan 20", "end"])
+        assert exception.value.command_index is None
+        ssh_connection._connection.send_config_set.assert_called_once()
+        channel.exec_command.assert_called_once_with("delete bootflash:mfd_config.cfg no-prompt")
+
+    def test_send_command_list_pushed_file_deleted_on_failure(self, ssh_connection, mocker):
+        mocker.patch("mfd_switchmanagement.connections.ssh.SCPClient")
+        ssh_connection._connection = mocker.Mock(device_type="cisco_nxos")
+        ssh_connection._check_connection = mocker.Mock(return_value=True)
+        ssh_connection._file_transfer_threshold = 3
+        channel = ssh_connection._connection.remote_conn.transport.open_session.return_value
+        channel.recv.return_value = b""
+        ssh_connection._connection.send_config_set.side_effect = ReadTimeout("timeout")
+        with pytest.raises(ReadTimeout):
+            ssh_connection.send_command_list(["configure terminal", "vlan 10", "vlan 20", "end"])
+        channel.exec_command.assert_called_with("delete bootflash:mfd_config.cfg no-prompt")
+
+    def test_send_command_list_file_push_fallback(self, ssh_connection, mocker):
+        scp_client = mocker.patch("mfd_switchmanagement.connections.ssh.SCPClient")
+        scp_client.return_value.__enter__.return_value.putfo.side_effect = OSError("scp disabled")
+        ssh_connection._connection = mocker.Mock(device_type="cisco_nxos")
+        ssh_connection._check_connection = mocker.Mock(return_value=True)
+        ssh_connection._file_transfer_threshold = 3
+        commands = ["configure terminal", "vlan 10", "vlan 20", "end"]
+        ssh_connection.send_command_list(commands)
+        ssh_connection._connection.send_config_set.assert_called_once_with(
+            commands, exit_config_mode=False, enter_config_mode=False
+        )
+
+    def test_send_command_list_below_threshold_not_pushed(self, ssh_connection, mocker):
+        scp_client = mocker.patch("mfd_switchmanagement.connections.ssh.SCPClient")
+        ssh_connection._connection = mocker.Mock(device_type="cisco_nxos")
+        ssh_connection._check_connection = mocker.Mock(return_value=True)
+        ssh_connection._file_transfer_threshold = 10
+        ssh_connection.send_command_list(["configure terminal", "vlan 10"])
+        scp_client.assert_not_called()
+
+    def test_send_commands_pipelined(self, ssh_connection, mocker):
+        ssh_connection._connection = mocker.Mock(base_prompt="switch")
+        ssh_connection._connection.normalize_cmd.side_effect = lambda command: f"{command}\n"
+        ssh_connection._connection.normalize_linefeeds.side_effect = lambda output: output
+        ssh_connection._connection.strip_ansi_escape_codes.side_effect = lambda output: output
+        ssh_connection._connection.read_until_pattern.side_effect = [
+            "show clock\n10:00:00\nswitch# show hostname\n",
+            "switch\nswitch# ",
+        ]
+        ssh_connection._check_connection = mocker.Mock(return_value=True)
+        outputs = ssh_connection.send_commands_pipelined(["show clock", "show hostname"])
+        ssh_connection._connection.write_channel.assert_called_once_with("show clock\nshow hostname\n")
+        assert outputs == ["10:00:00", "switch"]
+
+    @pytest.fixture
+    def windowed_remote(self, ssh_connection, mocker):
+        remote = mocker.Mock(base_prompt="switch")
+        remote.normalize_cmd.side_effect = lambda command: f"{command}\n"
+        remote.normalize_linefeeds.side_effect = lambda output: output
+        remote.strip_ansi_escape_codes.side_effect = lambda output: output
+        remote.config_mode.return_value = "configure terminal\nswitch(config)# "
+        remote.exit_config_mode.return_value = "end\nswitch# "
+        ssh_connection._connection = remote
+        ssh_connection._check_connection = mocker.Mock(return_value=True)
+        return remote
+
+    def test_send_configuration_windowed(self, ssh_connection, windowed_remote):
+        windowed_remote.read_until_pattern.side_effect = [
+            "vlan 10\nswitch(config-vlan)# ",
+            "vlan 11\nswitch(config-vlan)# ",
+            "vlan 12\nswitch(config-vlan)# ",
+        ]
+        with ssh_connection.fast_config(window=2):
+            output = ssh_connection.send_configuration(["vlan 10", "vlan 11", "vlan 12"])
+        assert windowed_remote.write_channel.call_args_list == [
+            call("vlan 10\nvlan 11\n"),
+            call("vlan 12\n"),
+        ]
+        windowed_remote.send_config_set.assert_not_called()
+        windowed_remote.exit_config_mode.assert_called_once()
+        assert "vlan 12" in output
+        assert ssh_connection._fast_config_window == 0
+
+    def test_send_command_list_windowed_error(self, ssh_connection, windowed_remote):
+        ssh_connection._fast_config_window = 10
+        windowed_remote.read_until_pattern.return_value = (
+            "vlan 10\nswitch(config-vlan)# vlan 4097\n% Invalid value\nswitch(config-vlan)# exit\nswitch(config)# "
+        )
+        with pytest.raises(SwitchCommandException) as exception:
+            ssh_connection.send_command_list(["vlan 10", "vlan 4097", "exit"])
+        assert exception.value.command_index == 1
+        windowed_remote.config_mode.assert_not_called()
+
+    def test_send_command_list_windowed_error_index_with_skipped_transition(self, ssh_connection, windowed_remote):
+        ssh_connection._fast_config_window = 10
+        ssh_connection._skip_redundant_transitions = True
+        ssh_connection.cli_mode.reset(CliMode.CONFIG)
+        windowed_remote.read_until_pattern.return_value = (
+            "vlan 10\nswitch(config-vlan)# vlan 4097\n% Invalid value\nswitch(config-vlan)# "
+        )
+        with pytest.raises(SwitchCommandException, match="vlan 4097") as exception:
+            ssh_connection.send_command_list(["configure terminal", "vlan 10", "vlan 4097"])
+        assert windowed_remote.write_channel.call_args_list == [call("vlan 10\nvlan 4097\n")]
+        assert exception.value.command_index == 2
+
+    def test_send_command_list_windowed_error_is_not_retried(self, ssh_connection, windowed_remote, mocker):
+        ssh_connection._fast_config_window = 10
+        ssh_connection._is_alive = mocker.Mock(return_value=False)
+        ssh_connection._reconnect = mocker.Mock()
+        windowed_remote.read_until_pattern.return_value = (
+            "vlan 10\nswitch(config-vlan)# vlan 4097\n% Invalid value\nswitch(config-vlan)# exit\nswitch(config)# "
+        )
+        with pytest.raises(SwitchCommandException):
+            ssh_connection.send_command_list(["vlan 10", "vlan 4097", "exit"])
+        windowed_remote.write_channel.assert_called_once()
+        ssh_connection._reconnect.assert_not_called()
+
+    def test_send_command_list_windowed_lost_echo(self, ssh_connection, windowed_remote):
+        ssh_connection._fast_config_window = 10
+        windowed_remote.read_until_pattern.return_value = "vlan 10\nswitch(config-vlan)# switch(config-vlan)# "
+        with pytest.raises(SwitchConnectionException):
+            ssh_connection.send_command_list(["vlan 10", "vlan 11"])
+
+    def test_send_command_on_channel(self, ssh_connection, mocker):
+        ssh_connection._connection = mocker.Mock()
+        ssh_connection._check_connection = mocker.Mock(return_value=True)
+        ssh_connection._max_exec_channels = 2
+        channel = ssh_connection._connection.remote_conn.transport.open_session.return_value
+        channel.recv.side_effect = [b"Eth1/1 up\r\n", b"Eth1/2 down\r\n", b""]
+        assert ssh_connection.send_command_on_channel("show interface brief") == "Eth1/1 up\nEth1/2 down"
+        channel.exec_command.assert_called_once_with("show interface brief")
+        channel.close.assert_called_once()
+        ssh_connection._connection.send_command.assert_not_called()
+
+    def test_send_command_on_channel_disabled(self, ssh_connection, mocker):
+        ssh_connection._connection = mocker.Mock()
+        ssh_connection._check_connection = mocker.Mock(return_value=True)
+        ssh_connection.send_command_on_channel("show interface brief")
+        ssh_connection._connection.send_command.assert_called_once_with("show interface brief")
+        ssh_connection._connection.remote_conn.transport.open_session.assert_not_called()
+
+    def test_send_command_on_channel_concurrent_limit(self, ssh_connection, mocker):
+        ssh_connection._connection = mocker.Mock()
+        ssh_connection._check_connection = mocker.Mock(return_value=True)
+        ssh_connection._max_exec_channels = 2
+        ssh_connection._exec_channels = threading.BoundedSemaphore(2)
+        active = []
+        peak = []
+
+        def recv(_):
+            active.append(1)
+            peak.append(len(active))
+            time.sleep(0.02)
+            active.pop()
+            return b""
+
+        ssh_connection._connection.remote_conn.transport.open_session.return_value.recv.side_effect = recv
+        threads = [
+            threading.Thread(target=ssh_connection.send_command_on_channel, args=("show clock",)) for _ in range(6)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        assert max(peak) <= 2
+
+    def test_governor_limits_exec_channels(self, ssh_connection, mocker):
+        ssh_connection._connection = mocker.Mock()
+        ssh_connection._check_connection = mocker.Mock(return_value=True)
+        ssh_connection._max_exec_channels = 4
+        ssh_connection._exec_channels = threading.BoundedSemaphore(4)
+        ssh_connection._governor = CommandGovernor(max_concurrency=1)
+        active = []
+        peak = []
+
+        def recv(_):
+            active.append(1)
+            peak.append(len(active))
+            time.sleep(0.02)
+            active.pop()
+            return b""
+
+        ssh_connection._connection.remote_conn.transport.open_session.return_value.recv.side_effect = recv
+        threads = [
+            threading.Thread(target=ssh_connection.send_command_on_channel, args=("show clock",)) for _ in range(4)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        assert max(peak) == 1
+        assert ssh_connection.governor_statistics.delayed >= 1
+
+    def test_rate_limit_of_commands(self, mocker):
+        mocker.patch("mfd_switchmanagement.connections.ssh.SSHSwitchConnection.connect")
+        connection = SSHSwitchConnection(ip="10.10.10.10", username="root", password="***", rate_limit=100)
+        mocker.stopall()
+        connection._connection = mocker.Mock()
+        connection._connection.send_command.return_value = ""
+        connection._check_connection = mocker.Mock(return_value=True)
+        for _ in range(4):
+            connection.send_command("show clock")
+        statistics = connection.governor_statistics
+        assert statistics.commands == 4
+        assert statistics.delayed == 3
+        assert statistics.total_delay >= 3 / 100 * 0.9
+
+    def test_rate_limit_charges_command_lines(self, mocker):
+        mocker.patch("mfd_switchmanagement.connections.ssh.SSHSwitchConnection.connect")
+        connection = SSHSwitchConnection(ip="10.10.10.10", username="root", password="***", rate_limit=100)
+        mocker.stopall()
+        connection._connection = mocker.Mock()
+        connection._connection.send_command.return_value = ""
+        connection._connection.send_config_set.return_value = ""
+        connection._check_connection = mocker.Mock(return_value=True)
+        connection.send_command_list(["configure terminal", "vlan 10", "vlan 20", "vlan 30"])
+        connection.send_command("show vlan")
+        statistics = connection.governor_statistics
+        assert statistics.commands == 2
+        assert statistics.lines == 5
+        assert statistics.max_delay >= 3 / 100 * 0.9
+
+    def test_governor_statistics_without_governor(self, ssh_connection):
+        assert ssh_connection.governor_statistics is None
+
+    @pytest.fixture
+    def keepalive_connection(self, mocker):
+        mocker.patch.object(SSHSwitchConnection, "_open_session")
+        connection = SSHSwitchConnection(
+            ip="10.10.10.10", username="root", password="***", device_type="cisco_nxos", keepalive_interval=0.05
+        )
+        connection._check_connection = mocker.Mock(return_value=True)
+        yield connection
+        connection._keepalive_stop.set()
+        connection._keepalive_thread.join()
+
+    def test_keepalive_sent_when_idle(self, keepalive_connection):
+        deadline = time.monotonic() + 2
+        while keepalive_connection.keepalive_statistics.sent < 2 and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert keepalive_connection.keepalive_statistics.sent >= 2
+        keepalive_connection._connection.find_prompt.assert_called()
+
+    def test_keepalive_skipped_when_lock_is_busy(self, keepalive_connection):
+        with keepalive_connection.command_lock:
+            deadline = time.monotonic() + 2
+            while keepalive_connection.keepalive_statistics.skipped < 1 and time.monotonic() < deadline:
+                time.sleep(0.01)
+            assert keepalive_connection.keepalive_statistics.sent == 0
+        keepalive_connection._connection.find_prompt.assert_not_called()
+        assert keepalive_connection.keepalive_statistics.skipped >= 1
+
+    def test_keepalive_reconnects_dropped_session(self, keepalive_connection, mocker):
+        keepalive_connection._connection.find_prompt.side_effect = [OSError("Socket is closed"), "switch#"]
+        keepalive_connection._check_connection = mocker.Mock(side_effect=[True, False])
+        keepalive_connection._is_alive = mocker.Mock(return_value=False)
+
+        def reconnect(cli_mode=None):
+            keepalive_connection._reconnect_statistics.count += 1
+
+        keepalive_connection._reconnect = reconnect
+        deadline = time.monotonic() + 2
+        while keepalive_connection.keepalive_statistics.reconnects < 1 and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert keepalive_connection.keepalive_statistics.reconnects == 1
+
+    def test_disconnect_stops_keepalive(self, keepalive_connection):
+        keepalive_connection.disconnect()
+        assert not keepalive_connection._keepalive_thread.is_alive()
+
+    def test_disconnect_does_not_reconnect_dead_session(self, keepalive_connection, mocker):
+        keepalive_connection._check_connection = mocker.Mock(return_value=False)
+        keepalive_connection._reconnect = mocker.Mock()
+        remote = keepalive_connection._connection
+        keepalive_connection.disconnect()
+        remote.disconnect.assert_called_once()
+        keepalive_connection._reconnect.assert_not_called()
+        assert not keepalive_connection._keepalive_thread.is_alive()
+
+    def test_keepalive_restarted_by_connect(self, keepalive_connection):
+        keepalive_connection.disconnect()
+        keepalive_connection._connection = keepalive_connection.connect()
+        assert keepalive_connection._keepalive_thread.is_alive()
+        deadline = time.monotonic() + 2
+        while keepalive_connection.keepalive_statistics.sent < 1 and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert keepalive_connection.keepalive_statistics.sent >= 1
+
+    def test_keepalive_started_with_lazy_session(self, mocker):
+        mocker.patch.object(SSHSwitchConnection, "_open_session")
+        connection = SSHSwitchConnection(
+            ip="10.10.10.10", username="root", device_type="cisco_nxos", keepalive_interval=0.05, lazy_connect=True
+        )
+        assert connection._keepalive_thread is None
+        connection._ensure_connected()
+        assert connection._keepalive_thread.is_alive()
+        connection.disconnect()
+
+    def test_commands_of_threads_are_serialised(self, ssh_connection, mocker):
+        ssh_connection._connection = mocker.Mock()
+        ssh_connection._check_connection = mocker.Mock(return_value=True)
+        active = []
+        peak = []
+
+        def send_command(command):
+            active.append(command)
+            peak.append(len(active))
+            time.sleep(0.01)
+            active.pop()
+            return ""
+
+        ssh_connection._connection.send_command.side_effect = send_command
+        threads = [threading.Thread(target=ssh_connection.send_command, args=("show clock",)) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        assert max(peak) == 1
+        statistics = ssh_connection.lock_statistics
+        assert statistics.acquisitions == 4
+        assert statistics.waiting == 0
+
+    def test_command_lock_held_for_multiple_commands(self, ssh_connection, mocker):
+        ssh_connection._connection = mocker.Mock()
+        ssh_connection._check_connection = mocker.Mock(return_value=True)
+        sent = []
+        ssh_connection._connection.send_command.side_effect = lambda command: sent.append(command) or ""
+        with ssh_connection.command_lock:
+            thread = threading.Thread(target=ssh_connection.send_command, args=("show clock",))
+            thread.start()
+            ssh_connection.send_command("no sh")
+            ssh_connection.send_command("no sh")
+            time.sleep(0.02)
+            assert sent == ["no sh", "no sh"]
+            assert ssh_connection.lock_statistics.waiting == 1
+        thread.join()
+        assert sent == ["no sh", "no sh", "show clock"]
+        assert ssh_connection.lock_statistics.contended == 1
+
+    def test_connect_learns_connection_profile(self, ssh_connection, mocker, tmp_path):
+        mocker.patch("mfd_switchmanagement.connections.ssh.Netmiko", side_effect=FakeNetmiko)
+        ssh_connection._device_type = "cisco_nxos"
+        ssh_connection._connection_profile_cache = ConnectionProfileCache(path=tmp_path / "profiles.json")
+        connection = ssh_connection.connect()
+        assert connection.kwargs["global_delay_factor"] == 2
+        assert connection.calls == [
+            "establish_connection",
+            "\n",
+            "_test_channel_read",
+            "set_base_prompt",
+            "terminal width 511",
+            "terminal length 0",
+        ]
+        assert ssh_connection._connection_profile_cache.get("cisco_nxos", ssh_connection._ip) == ConnectionProfile(
+            base_prompt="switch01", paging_command="terminal length 0", width_command="terminal width 511"
+        )
+        assert "disable_paging" not in vars(connection)
+
+    def test_connect_with_connection_profile_skips_prompt_discovery(self, ssh_connection, mocker, tmp_path):
+        mocker.patch("mfd_switchmanagement.connections.ssh.Netmiko", side_effect=FakeNetmiko)
+        ssh_connection._device_type = "cisco_nxos"
+        ssh_connection._connection_profile_cache = ConnectionProfileCache(path=tmp_path / "profiles.json")
+        ssh_connection._connection_profile_cache.set(
+            "cisco_nxos", ssh_connection._ip, ConnectionProfile(base_prompt="switch01", paging_command="terminal len 0")
+        )
+        connection = ssh_connection.connect()
+        assert connection.kwargs["global_delay_factor"] == 1
+        assert connection.kwargs["fast_cli"] is True
+        assert connection.calls == ["establish_connection", "\n", "_test_channel_read", "terminal len 0\n"]
+        assert connection.base_prompt == "switch01"
+
+    def test_connect_with_outdated_connection_profile_learns_it_again(self, ssh_connection, mocker, tmp_path):
+        def netmiko(**kwargs):
+            connection = FakeNetmiko(**kwargs)
+            if kwargs.get("fast_cli"):
+                connection.read_until_prompt = mocker.Mock(side_effect=ValueError("Prompt not found"))
+            return connection
+
+        mocker.patch("mfd_switchmanagement.connections.ssh.Netmiko", side_effect=netmiko)
+        ssh_connection._device_type = "cisco_nxos"
+        cache = ConnectionProfileCache(path=tmp_path / "profiles.json")
+        profile = ConnectionProfile(base_prompt="old", paging_command="terminal len 0")
+        cache.set("cisco_nxos", ssh_connection._ip, profile)
+        ssh_connection._connection_profile_cache = cache
+        connection = ssh_connection.connect()
+        assert "set_base_prompt" in connection.calls
+        assert cache.get("cisco_nxos", ssh_connection._ip).base_prompt == "switch01"
+
+    def test_connect_profile_not_learned_without_command_parameter(self, ssh_connection, mocker, tmp_path):
+        class NoCommandNetmiko(FakeNetmiko):
+            def disable_paging(self, *args, **kwargs):
+                self.calls.append("terminal length 0")
+
+        mocker.patch("mfd_switchmanagement.connections.ssh.Netmiko", side_effect=NoCommandNetmiko)
+        ssh_connection._device_type = "cisco_nxos"
+        ssh_connection._connection_profile_cache = ConnectionProfileCache(path=tmp_path / "profiles.json")
+        connection = ssh_connection.connect()
+        assert "terminal length 0" in connection.calls
+        assert ssh_connection._connection_profile_cache.get("cisco_nxos", ssh_connection._ip) is None
+
+    def test_connect_with_connection_profile_to_ssh_server(self, fake_ssh_server, mocker, tmp_path):
+        mocker.patch("mfd_switchmanagement.connections.ssh.Netmiko", partial(Netmiko, port=fake_ssh_server.port))
+        params = dict(ip="127.0.0.1", username="admin", password="password", device_type="cisco_nxos")
+        cache = ConnectionProfileCache(path=tmp_path / "profiles.json")
+        for _ in range(2):
+            connection = SSHSwitchConnection(connection_profile_cache=cache, **params)
+            assert "NX-OS" in connection.send_command("show version")
+            connection.disconnect()
+        assert cache.get("cisco_nxos", ip_address("127.0.0.1")) == ConnectionProfile(
+            base_prompt="switch01", paging_command="terminal length 0", width_command="terminal width 511"
+        )
+        assert fake_ssh_server.commands.count("terminal length 0") == 2
+
+    def test_send_command_adaptive_read_timeout(self, ssh_connection, mocker):
+        ssh_connection._connection = mocker.Mock()
+        ssh_connection._check_connection = mocker.Mock(return_value=True)
+        ssh_connection._adaptive_read_timeout = True
+        for _ in range(3):
+            ssh_connection._latency.record("show version", 0.1)
+        ssh_connection.send_command("show version")
+        ssh_connection._connection.send_command.assert_called_once_with("show version", read_timeout=10)
+        assert ssh_connection.latency_statistics["show version"].count == 4
+
+    def test_send_command_adaptive_read_timeout_keeps_requested_timeout(self, ssh_connection, mocker):
+        ssh_connection._connection = mocker.Mock()
+        ssh_connection._check_connection = mocker.Mock(return_value=True)
+        ssh_connection._adaptive_read_timeout = True
+        for duration in (20, 25, 30):
+            ssh_connection._latency.record("show tech-support", duration)
+        ssh_connection._send_timed(ssh_connection._connection, "show tech-support", read_timeout=900)
+        ssh_connection._connection.send_command.assert_called_once_with("show tech-support", read_timeout=900)
+
+    def test_send_command_read_timeout_is_recorded(self, ssh_connection, mocker):
+        ssh_connection._connection = mocker.Mock()
+        ssh_connection._connection.send_command.side_effect = ReadTimeout
+        ssh_connection._check_connection = mocker.Mock(return_value=True)
+        with pytest.raises(ReadTimeout):
+            ssh_connection.send_command("show tech-support")
+        assert ssh_connection.latency_statistics["show tech-support"].timeouts == 1
+        assert ssh_connection._latency.read_timeout("show tech-support") == 40
+
+    @pytest.fixture
+    def stream_remote(self, ssh_connection, mocker):
+        ssh_connection._connection = mocker.Mock()
+        ssh_connection._check_connection = mocker.Mock(return_value=True)
+        remote = ssh_connection._connection
+        remote.base_prompt = "switch01"
+        remote.normalize_cmd.side_effect = lambda command: f"{command}\n"
+        remote.strip_ansi_escape_codes.side_effect = lambda output: output
+        return remote
+
+    def test_send_command_stream_lines(self, ssh_connection, stream_remote):
+        stream_remote.read_channel.side_effect = [
+            "show mac address-table\r\nVLAN  MAC",
+            "",
+            " Address\r\n10    aa:bb",
+            "\r\n20    cc:dd\r\nswitch01# ",
+        ]
+        lines = list(ssh_connection.send_command_stream("show mac address-table", read_timeout=1))
+        assert lines == ["VLAN  MAC Address", "10    aa:bb", "20    cc:dd"]
+        stream_remote.write_channel.assert_called_once_with("show mac address-table\n")
+
+    def test_send_command_stream_chunks(self, ssh_connection, stream_remote):
+        stream_remote.read_channel.side_effect = ["show clock\nline 1\nline 2\n", "line 3\nswitch01(config)#"]
+        chunks = list(ssh_connection.send_command_stream("show clock", read_timeout=1, lines=False))
+        assert chunks == ["line 1\nline 2\n", "line 3\n"]
+
+    def test_send_command_stream_closed_early_is_drained(self, ssh_connection, stream_remote):
+        stream_remote.read_channel.side_effect = ["show run\nline 1\n", "line 2\n", "line 3\nswitch01#"]
+        stream = ssh_connection.send_command_stream("show run", read_timeout=1)
+        assert next(stream) == "line 1"
+        stream.close()
+        assert stream_remote.read_channel.call_count == 3
+        assert ssh_connection.lock_statistics.acquisitions == 1
+        assert ssh_connection.command_lock._owner is None
+
+    def test_send_command_stream_consumed_in_other_thread(self, ssh_connection, stream_remote):
+        stream_remote.read_channel.side_effect = ["show run\nline 1\n", "line 2\n", "line 3\nswitch01#"]
+        stream = ssh_connection.send_command_stream("show run", read_timeout=1)
+        assert next(stream) == "line 1"
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            assert executor.submit(list, stream).result() == ["line 2", "line 3"]
+        assert ssh_connection.command_lock._owner is None
+        assert ssh_connection.command_lock.acquire(timeout=0)
+        ssh_connection.command_lock.release()
+
+    def test_send_command_stream_under_held_lock(self, ssh_connection, stream_remote):
+        stream_remote.read_channel.side_effect = ["show run\nline 1\n", "line 2\n", "line 3\nswitch01#"]
+        with ssh_connection.command_lock:
+            stream = ssh_connection.send_command_stream("show run", read_timeout=1)
+            assert next(stream) == "line 1"
+            assert threading.active_count() == len([t for t in threading.enumerate() if t.name != "stream-reader"])
+            stream.close()
+            assert stream_remote.read_channel.call_count == 3
+            assert ssh_connection.command_lock._count == 1
+        assert ssh_connection.command_lock._owner is None
+
+    def test_send_command_stream_timeout(self, ssh_connection, stream_remote):
+        stream_remote.read_channel.return_value = ""
+        with pytest.raises(ReadTimeout):
+            list(ssh_connection.send_command_stream("show run", read_timeout=0.05))
+
+    def test__reconnect_with_backoff(self, ssh_connection, mocker):
+        sleep = mocker.patch("mfd_switchmanagement.connections.ssh.time.sleep")
+        ssh_connection._connection = mocker.Mock()
+        ssh_connection._connection._open.side_effect = [OSError("Connection refused"), OSError("Timeout"), None]
+        ssh_connection._check_connection = mocker.Mock(return_value=True)
+        ssh_connection._reconnect_attempts = 3
+        ssh_connection._reconnect_backoff = 2
+        ssh_connection._reconnect()
+        assert ssh_connection._connection._open.call_count == 3
+        delays = [call.args[0] for call in sleep.call_args_list]
+        assert 1 <= delays[0] <= 2
+        assert 2 <= delays[1] <= 4
+        statistics = ssh_connection.reconnect_statistics
+        assert statistics.count == 1
+        assert statistics.failed_attempts == 2
+
+    def test__reconnect_attempts_exhausted(self, ssh_connection, mocker):
+        mocker.patch("mfd_switchmanagement.connections.ssh.time.sleep")
+        ssh_connection._connection = mocker.Mock()
+        ssh_connection._check_connection = mocker.Mock(return_value=False)
+        ssh_connection._reconnect_attempts = 2
+        with pytest.raises(SwitchConnectionException):
+            ssh_connection._reconnect()
+        assert ssh_connection.reconnect_statistics.failed_attempts == 2
+        assert ssh_connection.reconnect_statistics.count == 0
+
+    def test__reconnect_restores_configuration_context(self, ssh_connection, mocker):
+        ssh_connection._connection = mocker.Mock()
+        ssh_connection._check_connection = mocker.Mock(return_value=True)
+        ssh_connection.cli_mode.reset(CliMode.CONFIG)
+        ssh_connection.cli_mode.update("interface ethernet 1/1")
+        ssh_connection._reconnect()
+        ssh_connection._connection.config_mode.assert_called_once()
+        ssh_connection._connection.send_config_set.assert_called_once_with(
+            ["interface ethernet 1/1"], exit_config_mode=False, enter_config_mode=False
+        )
+        assert ssh_connection.cli_mode.mode is CliMode.CONFIG
+        assert ssh_connection.cli_mode.interface == "ethernet 1/1"
+
+    def test_command_list_retried_in_context_from_before_drop(self, ssh_connection, mocker):
+        ssh_connection._connection = mocker.Mock()
+        ssh_connection._check_connection = mocker.Mock(side_effect=[True, False, True])
+        ssh_connection.cli_mode.reset(CliMode.CONFIG)
+        ssh_connection.cli_mode.update("interface ethernet 1/1")
+        ssh_connection._connection.send_config_set.side_effect = [OSError("Socket is closed"), "", "output"]
+        assert ssh_connection.send_command_list(["shutdown", "interface ethernet 1/2", "shutdown"]) == "output"
+        ssh_connection._connection._open.assert_called_once()
+        assert ssh_connection._connection.send_config_set.call_args_list[1].args[0] == ["interface ethernet 1/1"]
+        assert ssh_connection._connection.send_config_set.call_args_list[2].args[0] == [
+            "shutdown",
+            "interface ethernet 1/2",
+            "shutdown",
+        ]
+        assert ssh_connection.cli_mode.interface == "ethernet 1/2"
@@ -1,12 +1,25 @@
 # Copyright (C) 2025 Intel Corporation
 # SPDX-License-Identifier: MIT
+import json
+from contextlib import contextmanager
+from io import BytesIO
 from textwrap import dedent
 
 import pytest
 from pytest import fixture, raises, mark
 
 from mfd_switchmanagement import Cisco_NXOS, CiscoAPIConnection, SSHSwitchConnection
-from mfd_switchmanagement.exceptions import SwitchWaitForHoldingLinkStateTimeout, SwitchException
+from mfd_switchmanagement.exceptions import (
+    SwitchCommandException,
+    SwitchException,
+    SwitchWaitForHoldingLinkStateTimeout,
+)
+from mfd_switchmanagement.vendors.cisco.nx_os.api_tables import (
+    InterfaceRecord,
+    MacAddressRecord,
+    iter_table,
+    iter_table_stream,
+)
 
 show_mac_address_table_address_console_empty = dedent(
     """\
@@ -83,6 +96,41 @@ def show_interface_ethernet_table(state):
     ]
 
 
+show_interface_brief_console = dedent(
+    """\
+--------------------------------------------------------------------------------
+Port   VRF          Status IP Address                              Speed    MTU
+--------------------------------------------------------------------------------
+mgmt0  --           up     10.10.10.10                             1000     1500
+
+--------------------------------------------------------------------------------
+Ethernet      VLAN    Type Mode   Status  Reason                 Speed     Port
+Interface                                                                  Ch #
+--------------------------------------------------------------------------------
+Eth1/1        1       eth  trunk  up      none                       100G(D) --
+Eth1/2        1       eth  access down    Link not connected         auto(D) --
+Eth1/3        1       eth  access sfpAbsent  XCVR not inserted       auto(D) --
+"""
+)
+
+show_interface_brief_api = [
+    {
+        "jsonrpc": "2.0",
+        "result": {
+            "body": {
+                "TABLE_interface": {
+                    "ROW_interface": [
+                        {"interface": "mgmt0", "state": "up"},
+                        {"interface": "Ethernet1/1", "state": "up"},
+                        {"interface": "Ethernet1/2", "state": "down"},
+                    ]
+                }
+            }
+        },
+        "id": 1,
+    }
+]
+
 class TestCiscoNX:
     """Class for CiscoNX tests."""
 
@@ -482,3 +530,172 @@ class TestCiscoNX:
 
         with pytest.raises(ValueError, match=f"Port is not in ethernet port syntax! {port}"):
             switch_console.disable_lacp_rate(port)
+
+    @fixture
+    def switch_api_merged(self, mocker) -> Cisco_NXOS:
+        mocker.patch.object(CiscoAPIConnection, "send_command", return_value="version")
+        connection = CiscoAPIConnection(ip="10.10.10.10", username="admin", password="***")
+        mocker.stopall()
+        switch = Cisco_NXOS.__new__(Cisco_NXOS)
+        switch._connection = connection
+        return switch
+
+    def test_gather_merges_calls_into_one_request(self, switch_api_merged, mocker):
+        def post(payload, cost=1):
+            elements = json.loads(payload)
+            states = {"Ethernet1/1": "up", "Ethernet1/2": "down"}
+            responses = []
+            for element in elements:
+                port = element["params"]["cmd"].split()[2]
+                response = show_interface_ethernet_table(states[port])[0]
+                responses.append({**response, "id": element["id"]})
+            return responses
+
+        post = mocker.patch.object(switch_api_merged._connection, "_post", side_effect=post)
+        results = switch_api_merged.gather([("is_port_linkup", "Ethernet1/1"), ("is_port_linkup", "Ethernet1/2")])
+        assert results == [True, False]
+        post.assert_called_once()
+
+    def test_gather_return_exceptions(self, switch_api_merged, mocker):
+        mocker.patch.object(
+            switch_api_merged._connection,
+            "_post",
+            return_value=[
+                {**show_interface_ethernet_table("up")[0], "id": 1},
+                {"jsonrpc": "2.0", "error": {"message": "Invalid", "data": {"msg": "port"}}, "id": 2},
+            ],
+        )
+        calls = [("is_port_linkup", "Ethernet1/1"), ("is_port_linkup", "Ethernet1/99")]
+        results = switch_api_merged.gather(calls, return_exceptions=True)
+        assert results[0] is True
+        assert isinstance(results[1], SwitchCommandException)
+        with raises(SwitchCommandException):
+            switch_api_merged.gather(calls)
+
+    @mark.parametrize("method", ["get_link_states", "disable_port", "set_port_dcbx_version"])
+    def test_gather_rejects_not_read_only_methods(self, switch_api_merged, mocker, method):
+        post = mocker.patch.object(switch_api_merged._connection, "_post")
+        with raises(ValueError, match=method):
+            switch_api_merged.gather([("is_port_linkup", "Ethernet1/1"), (method, "Ethernet1/2")])
+        post.assert_not_called()
+
+    def test_gather_methods_exist(self):
+        assert all(callable(getattr(Cisco_NXOS, method, None)) for method in Cisco_NXOS.GATHER_METHODS)
+
+    def test_gather_console_runs_calls_one_by_one(self, switch_console):
+        switch_console._connection.send_command.side_effect = ["Eth1/1 up", "Eth1/2 down"]
+        assert switch_console.gather([("is_port_linkup", "Eth1/1"), ("is_port_linkup", "Eth1/2")]) == [True, False]
+
+    def test_get_link_states_console(self, switch_console):
+        switch_console._connection.send_command.return_value = show_interface_brief_console
+        assert switch_console.get_link_states() == {"mgmt0": True, "Eth1/1": True, "Eth1/2": False, "Eth1/3": False}
+        switch_console._connection.send_command.assert_called_once_with("show interface brief")
+
+    def test_get_link_states_api(self, switch_api):
+        switch_api._connection.send_command.return_value = show_interface_brief_api
+        assert switch_api.get_link_states(["Eth1/1", "Ethernet1/2"]) == {"Eth1/1": True, "Ethernet1/2": False}
+        with raises(SwitchException, match="Could not find port Ethernet1/9 in switch interfaces."):
+            switch_api.get_link_states(["Ethernet1/9"])
+
+    def test_is_port_linkup_served_from_link_states(self, switch_api, mocker):
+        switch_api._connection.send_command.return_value = show_interface_brief_api
+        switch_api.get_link_states()
+        assert [switch_api.is_port_linkup(port) for port in ["Ethernet1/1", "Eth1/2"]] == [True, False]
+        switch_api._connection.send_command.assert_called_once_with("show interface brief")
+
+        mocker.patch("mfd_switchmanagement.vendors.cisco.nx_os.base.monotonic", return_value=1e9)
+        switch_api._connection.send_command.return_value = show_interface_ethernet_table("down")
+        assert switch_api.is_port_linkup("Ethernet1/1") is False
+
+    @mark.parametrize(
+        "method, args",
+        [
+            ("shutdown", (True, "Ethernet1/1")),
+            ("set_fec", ("Ethernet1/1", "cl91")),
+            ("configure_vlan", ("Ethernet1/1", 10, "untagged", "access")),
+            ("set_lacp_rate", ("Ethernet1/1", "fast")),
+            ("enable_jumbo_frame", (9216, "Ethernet1/1")),
+            ("configure_lldp", ("Ethernet1/1", "receive")),
+        ],
+    )
+    def test_link_states_invalidated_by_configuration(self, switch_console, method, args):
+        switch_console._connection.send_command.return_value = show_interface_brief_console
+        switch_console.get_link_states()
+        getattr(switch_console, method)(*args)
+        switch_console._connection.send_command.return_value = "Eth1/1 down"
+        assert switch_console.is_port_linkup("Ethernet1/1") is False
+
+    def test_link_states_invalidated_by_failed_configuration(self, switch_console):
+        switch_console._connection.send_command.return_value = show_interface_brief_console
+        switch_console.get_link_states()
+        switch_console._connection.send_command_list.side_effect = SwitchCommandException("Invalid command")
+        with raises(SwitchCommandException):
+            switch_console.shutdown(True, "Ethernet1/1")
+        switch_console._connection.send_command.return_value = "Eth1/1 down"
+        assert switch_console.is_port_linkup("Ethernet1/1") is False
+
+    def test_iter_table_single_and_multiple_rows(self):
+        body = show_interface_brief_api[0]["result"]["body"]
+        records = list(iter_table(body, "interface", InterfaceRecord))
+        assert [(record.interface, record.state) for record in records] == [
+            ("mgmt0", "up"),
+            ("Ethernet1/1", "up"),
+            ("Ethernet1/2", "down"),
+        ]
+        assert records[1]._row is body["TABLE_interface"]["ROW_interface"][1]
+        assert not hasattr(records[0], "__dict__")
+
+        body = {"TABLE_mac_address": {"ROW_mac_address": {"disp_port": "Eth1/5", "disp_vlan": "144"}}}
+        (record,) = iter_table(body, "mac_address", MacAddressRecord)
+        assert (record.port, record.vlan, record["disp_port"]) == ("Eth1/5", 144, "Eth1/5")
+        assert list(iter_table({}, "mac_address")) == []
+
+    def test_get_port_by_mac_does_not_modify_response(self, switch_api):
+        response = [
+            {
+                "result": {
+                    "body": {
+                        "TABLE_mac_address": {
+                            "ROW_mac_address": [
+                                {"disp_port": "Ethernet1/5/2", "disp_vlan": "144"},
+                                {"disp_port": "Ethernet1/6", "disp_vlan": "145"},
+                            ]
+                        }
+                    }
+                }
+            }
+        ]
+        switch_api._connection.send_command.return_value = response
+        assert switch_api.get_port_by_mac(mac="00:AA:BB:CC:DD:EE") == "Ethernet1/5/2"
+        assert switch_api.get_vlan_by_mac(mac="00:AA:BB:CC:DD:EE") == 144
+        assert len(response[0]["result"]["body"]["TABLE_mac_address"]["ROW_mac_address"]) == 2
+
+    def test_iter_table_stream(self):
+        pytest.importorskip("ijson")
+        stream = BytesIO(json.dumps(show_interface_brief_api[0]).encode())
+        records = list(iter_table_stream(stream, "interface", InterfaceRecord))
+        assert [record.interface for record in records] == ["mgmt0", "Ethernet1/1", "Ethernet1/2"]
+
+        stream = BytesIO(json.dumps(show_interface_ethernet_table("up")).encode())
+        assert [record.state for record in iter_table_stream(stream, "interface", InterfaceRecord)] == ["up"]
+
+        error = {"jsonrpc": "2.0", "error": {"message": "Invalid command", "data": {"msg": " at '^'"}}, "id": 1}
+        with raises(SwitchCommandException, match="Invalid command"):
+            list(iter_table_stream(BytesIO(json.dumps(error).encode()), "interface"))
+
+    def test_iter_table_stream_requires_ijson(self, mocker):
+        mocker.patch.dict("sys.modules", {"ijson": None})
+        with raises(SwitchException, match="ijson"):
+            list(iter_table_stream(BytesIO(b"{}"), "interface"))
+
+    def test_get_link_states_api_streamed(self, switch_api):
+        pytest.importorskip("ijson")
+
+        @contextmanager
+        def stream_command(command):
+            yield BytesIO(json.dumps(show_interface_brief_api).encode())
+
+        switch_api._connection._stream_responses = True
+        switch_api._connection.stream_command.side_effect = stream_command
+        assert switch_api.get_link_states() == {"mgmt0": True, "Ethernet1/1": True, "Ethernet1/2": False}
+        switch_api._connection.send_command.assert_not_called()
@@ -156,3 +156,28 @@ class TestDellForce10:
         switch._connection.send_configuration.assert_called_once_with(
             [f"interface {port}", "protocol lldp", "no advertise DCBx-appln-tlv iscsi"]
         )
+
+    def test_get_dcb_bw_by_up_single_command(self, switch, mocker):
+        switch._connection = mocker.Mock()
+        switch._connection.send_command.return_value = dedent(
+            """\
+            State       :Complete
+            PfcMode     :ON
+            --------------------
+            PG:0  TSA:ETS  BW:30  PFC:OFF
+            Priorities:0 1 2 5 6 7
+
+            PG:1  TSA:ETS  BW:70  PFC:ON
+            Priorities:3 4
+            """
+        )
+        assert switch.get_dcb_bw_by_up("Te2/1", "LINUX_ETS", 4) == "70"
+        assert switch.get_dcb_tc_by_up("Te2/1", "LINUX_ETS", 4) == "1"
+        switch._connection.send_command.assert_called_with("sh qos dcb-map LINUX_ETS")
+        assert switch._connection.send_command.call_count == 2
+
+    def test_get_dcb_bw_by_up_priority_not_found(self, switch, mocker):
+        switch._connection = mocker.Mock()
+        switch._connection.send_command.return_value = "PG:0  TSA:ETS  BW:30  PFC:OFF\nPriorities:0 1"
+        with raises(SwitchException):
+            switch.get_dcb_bw_by_up("Te2/1", "LINUX_ETS", 4)